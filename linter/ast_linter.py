@@ -0,0 +1,184 @@
+"""
+
+Lightweight implementation of the ConanCenterIndex recipe rules (E9004-E9014)
+
+It uses only the standard `ast` module and applies every rule in a single walk over the
+syntax tree, so it doesn't need pylint, astroid or Conan to be installed. The pylint
+checkers in this folder remain the reference implementation, this module mirrors them.
+
+"""
+
+import argparse
+import ast
+import glob
+import re
+import sys
+from pathlib import PurePath
+
+
+MESSAGES = {
+    "E9004": ("conan-bad-name", "Reference name should be all lowercase"),
+    "E9005": ("conan-missing-name", "Missing name attribute"),
+    "E9006": (
+        "conan-import-conanfile",
+        "Import ConanFile from new module: `from conan import ConanFile`. Old import is deprecated in Conan v2.",
+    ),
+    "E9007": ("conan-test-no-name", "No 'name' attribute in test_package conanfile"),
+    "E9008": (
+        "conan-import-errors",
+        "Import errors from new module: `from conan import errors`. Old import is deprecated in Conan v2.",
+    ),
+    "E9009": (
+        "conan-import-error-conanexception",
+        "Import ConanException from new module: `from conan.errors import ConanException`. "
+        "Old import is deprecated in Conan v2.",
+    ),
+    "E9010": (
+        "conan-import-error-conaninvalidconfiguration",
+        "Import ConanInvalidConfiguration from new module: "
+        "`from conan.errors import ConanInvalidConfiguration`. Old import is deprecated in Conan v2.",
+    ),
+    "E9011": (
+        "conan-import-tools",
+        "Import tools following pattern 'from conan.tools.xxxx import yyyyy' "
+        "(https://docs.conan.io/en/latest/reference/conanfile/tools.html).",
+    ),
+    "E9012": ("conan-missing-layout-src-folder", "layout is missing `src_folder` argument which should be to `src`"),
+    "E9013": ("conan-layout-src-folder-is-src", "layout should set `src_folder` to `src`"),
+    "E9014": ("conan-forced-version", "Recipe should not contain version attribute"),
+}
+
+LAYOUTS = ["cmake_layout", "bazel_layout", "basic_layout"]
+
+
+def is_test_package(filename):
+    path = PurePath(filename)
+    return path.match("test_package/*.py") or path.match("test_v1_package/*.py")
+
+
+def _const_assignment(statement, target_name):
+    """ Return the ast.Constant assigned by `<target_name> = <constant>`, None otherwise """
+    if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and \
+       isinstance(statement.targets[0], ast.Name) and \
+       statement.targets[0].id == target_name and \
+       isinstance(statement.value, ast.Constant):
+        return statement.value
+    return None
+
+
+def _as_string(value):
+    # Equivalent to astroid's Const.as_string()
+    return repr(value.value)
+
+
+class RecipeRules(ast.NodeVisitor):
+    def __init__(self, filename, source):
+        self.filename = filename
+        self.source = source
+        self.is_test = is_test_package(filename)
+        self.messages = []
+
+    def add_message(self, msg_id, node):
+        self.messages.append((node.lineno, msg_id))
+
+    def visit_ImportFrom(self, node):
+        if node.level == 0:
+            names = [alias.name for alias in node.names]
+            if node.module == "conans":
+                if "ConanFile" in names:
+                    self.add_message("E9006", node)
+                if "errors" in names:
+                    self.add_message("E9008", node)
+            elif node.module == "conans.errors":
+                if "ConanException" in names:
+                    self.add_message("E9009", node)
+                if "ConanInvalidConfiguration" in names:
+                    self.add_message("E9010", node)
+            if (node.module == "conan" and "tools" in names) or re.match(r"conan\.tools\.[^.]+\..+", node.module):
+                self.add_message("E9011", node)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node):
+        if len(node.bases) == 1 and isinstance(node.bases[0], ast.Name) and node.bases[0].id == "ConanFile":
+            self._check_name(node)
+            self._check_version(node)
+        self.generic_visit(node)
+
+    def _check_name(self, node):
+        for statement in node.body:
+            value = _const_assignment(statement, "name")
+            if value is not None:
+                if self.is_test:
+                    self.add_message("E9007", statement)
+                    return
+                text = _as_string(value)
+                if text.lower() != text:
+                    self.add_message("E9004", statement)
+                return
+        if not self.is_test:
+            self.add_message("E9005", node)
+
+    def _check_version(self, node):
+        for statement in node.body:
+            value = _const_assignment(statement, "version")
+            if value is not None:
+                text = _as_string(value).replace('"', "").replace("'", "")
+                if text and text != "system":
+                    self.add_message("E9014", statement)
+                return
+
+    def visit_Call(self, node):
+        if not self.is_test and isinstance(node.func, ast.Name) and node.func.id in LAYOUTS:
+            for kw in node.keywords:
+                if kw.arg == "src_folder":
+                    value = ast.get_source_segment(self.source, kw.value) or ""
+                    if value.strip("\"'") != "src":
+                        self.add_message("E9013", node)
+                    break
+            else:
+                self.add_message("E9012", node)
+        self.generic_visit(node)
+
+
+def lint_source(filename, source):
+    """ Return a sorted list of (line, msg_id) for the given recipe source """
+    rules = RecipeRules(filename, source)
+    rules.visit(ast.parse(source, filename=filename))
+    return sorted(rules.messages)
+
+
+def lint_file(filename):
+    # utf-8-sig: some recipes start with a byte order mark, which python accepts
+    with open(filename, encoding="utf-8-sig") as f:
+        return lint_source(filename, f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check ConanCenterIndex rules (E9004-E9014) in conanfiles without pylint."
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="+",
+        help="files or glob patterns to check (e.g. 'recipes/*/*/conanfile.py').",
+    )
+    args = parser.parse_args()
+
+    files = sorted({file for pattern in args.patterns for file in glob.glob(pattern)})
+    found = False
+    for filename in files:
+        try:
+            messages = lint_file(filename)
+        except SyntaxError as error:
+            print(f"::error file={filename},line={error.lineno},title=syntax-error::{error.msg}")
+            found = True
+            continue
+        for line, msg_id in messages:
+            symbol, text = MESSAGES[msg_id]
+            print(f"::error file={filename},line={line},title={msg_id} {symbol}::{text}")
+            found = True
+    sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import argparse
+import re
 from strictyaml import (
     load,
     Map,
@@ -10,72 +11,148 @@ from strictyaml import (
     Enum,
     Any,
 )
-from yaml_linting import file_path
+from yaml_linting import add_batch_arguments, annotation, expand_paths, run_batch
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 
 CONANDATA_YAML_URL = "https://github.com/conan-io/conan-center-index/blob/master/docs/adding_packages/conandata_yml_format.md"
 
+PATCH_TYPES = ["official", "conan", "portability", "bugfix", "vulnerability"]
+PATCH_REQUIRED_FIELDS = {"patch_file", "patch_description", "patch_type"}
+PATCH_OPTIONAL_FIELDS = {"patch_source", "base_path"}
+
+# Schemas are built once per process and shared by all the validated files
+PATCH_FIELDS = Map(
+    {
+        "patch_file": Str(),
+        "patch_description": Str(),
+        "patch_type": Enum(
+            PATCH_TYPES
+        ),
+        Optional("patch_source"): Str(),
+        # No longer required for v2 recipes with layouts
+        Optional("base_path"): Str(),
+    }
+)
+SCHEMA = Map(
+    {
+        "sources": MapPattern(Str(), Any(), minimum_keys=1),
+        Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
+    }
+)
+
+# Anchors, aliases and tags are rejected by strictyaml, leave those files to it
+DISALLOWED_TOKENS = re.compile(r"(?:^|:|^\s*-)\s+[&*!]", re.MULTILINE)
+
+
+class FastPathUnsupported(Exception):
+    pass
+
+
+if yaml is not None:
+    class _StrictishLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+        """ libyaml loader that behaves like strictyaml: every scalar is a string, no flow style nor duplicated keys """
+        yaml_implicit_resolvers = {}
+
+        def construct_mapping(self, node, deep=False):
+            if not isinstance(node, yaml.MappingNode) or node.flow_style:
+                raise FastPathUnsupported()
+            keys = [key_node.value for key_node, _ in node.value]
+            if len(keys) != len(set(keys)):
+                raise FastPathUnsupported()
+            return super().construct_mapping(node, deep=deep)
+
+        def construct_sequence(self, node, deep=False):
+            if not isinstance(node, yaml.SequenceNode) or node.flow_style:
+                raise FastPathUnsupported()
+            return super().construct_sequence(node, deep=deep)
+
 
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Conan's 'conandata.yaml' file to ConanCenterIndex's requirements."
     )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
-    )
+    add_batch_arguments(parser, "recipes/*/*/conandata.yml")
     args = parser.parse_args()
 
-    patch_fields = Map(
-        {
-            "patch_file": Str(),
-            "patch_description": Str(),
-            "patch_type": Enum(
-                ["official", "conan", "portability", "bugfix", "vulnerability"]
-            ),
-            Optional("patch_source"): Str(),
-            # No longer required for v2 recipes with layouts
-            Optional("base_path"): Str(),
-        }
-    )
-    schema = Map(
-        {
-            "sources": MapPattern(Str(), Any(), minimum_keys=1),
-            Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
-        }
-    )
+    run_batch(lint_conandata, expand_paths(parser, args.paths), jobs=args.jobs, output_format=args.format)
+
+
+def is_valid_fast(content):
+    """ Check the rules on a libyaml parsed document, True only when strictyaml wouldn't report anything """
+    if yaml is None or DISALLOWED_TOKENS.search(content):
+        return False
+    try:
+        data = yaml.load(content, Loader=_StrictishLoader)
+    except (yaml.YAMLError, FastPathUnsupported):
+        return False
 
-    with open(args.path, encoding="utf-8") as f:
+    if not isinstance(data, dict) or "sources" not in data or not set(data).issubset({"sources", "patches"}):
+        return False
+    if not isinstance(data["sources"], dict) or not data["sources"]:
+        return False
+    if "patches" not in data:
+        return True
+    if not isinstance(data["patches"], dict) or not data["patches"]:
+        return False
+    for version, patches in data["patches"].items():
+        if version not in data["sources"] or not isinstance(patches, list):
+            return False
+        for patch in patches:
+            if not isinstance(patch, dict) or not PATCH_REQUIRED_FIELDS.issubset(patch):
+                return False
+            if not set(patch).issubset(PATCH_REQUIRED_FIELDS | PATCH_OPTIONAL_FIELDS):
+                return False
+            if not all(isinstance(value, str) for value in patch.values()):
+                return False
+            if patch["patch_type"] not in PATCH_TYPES:
+                return False
+            if patch["patch_type"] in ["official", "bugfix", "vulnerability"] and "patch_source" not in patch:
+                return False
+    return True
+
+
+def lint_conandata(path):
+    """ Validate a single conandata.yml, returns the list of annotations """
+    annotations = []
+
+    with open(path, encoding="utf-8") as f:
         content = f.read()
 
+    # Most files are valid, strictyaml is only needed to locate the issues
+    if is_valid_fast(content):
+        return annotations
+
     try:
-        parsed = load(content, schema)
+        parsed = load(content, SCHEMA)
     except YAMLValidationError as error:
-        pretty_print_yaml_validate_error(args, error) # Error when "source" is missing or when "patches" has no versions
-        return
+        annotations.append(yaml_validate_error(path, error)) # Error when "source" is missing or when "patches" has no versions
+        return annotations
     except BaseException as error:
-        pretty_print_yaml_validate_error(args, error) # YAML could not be parsed
-        return
+        annotations.append(yaml_validate_error(path, error)) # YAML could not be parsed
+        return annotations
 
     if "patches" in parsed:
         for version in parsed["patches"]:
             patches = parsed["patches"][version]
             if version not in parsed["sources"]:
-                print(
-                    f"::warning file={args.path},line={patches.start_line},endline={patches.end_line},"
-                    f"title=conandata.yml inconsistency"
-                    f"::Patch(es) are listed for version `{version}`, but there is source for this version."
+                annotations.append(annotation(
+                    "warning", path, patches.start_line, patches.end_line,
+                    "conandata.yml inconsistency",
+                    f"Patch(es) are listed for version `{version}`, but there is source for this version."
                     f" You should either remove `{version}` from the `patches` section, or add it to the"
                     f" `sources` section"
-                )
+                ))
             for i, patch in enumerate(patches):
                 # Individual report errors for each patch object
                 try:
-                    parsed["patches"][version][i].revalidate(patch_fields)
+                    parsed["patches"][version][i].revalidate(PATCH_FIELDS)
                 except YAMLValidationError as error:
-                    pretty_print_yaml_validate_warning(args, error) # Warning when patch fields are not followed
+                    annotations.append(yaml_validate_warning(path, error)) # Warning when patch fields are not followed
                     continue
 
                 # Make sure `patch_source` exists where it's encouraged
@@ -84,29 +161,36 @@ def main():
                     type in ["official", "bugfix", "vulnerability"]
                     and not "patch_source" in patch
                 ):
-                    print(
-                        f"::warning file={args.path},line={type.start_line},endline={type.end_line},"
-                        f"title=conandata.yml schema warning"
-                        f"::'patch_type' should have 'patch_source' as per {CONANDATA_YAML_URL}#patch_type"
+                    annotations.append(annotation(
+                        "warning", path, type.start_line, type.end_line,
+                        "conandata.yml schema warning",
+                        f"'patch_type' should have 'patch_source' as per {CONANDATA_YAML_URL}#patch_type"
                         " it is expected to have a source (e.g. a URL) to where it originates from to help with"
                         " reviewing and consumers to evaluate patches"
-                    )
+                    ))
+    return annotations
 
 
-def pretty_print_yaml_validate_error(args, error):
-    snippet = error.context_mark.get_snippet().replace("\n", "%0A")
-    print(
-        f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
-        f"title=conandata.yml schema error"
-        f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
+def yaml_validate_error(path, error):
+    context_mark = error.context_mark  # a property computed on every read: read it once
+    if context_mark is None:
+        context_mark = error.problem_mark  # syntax errors may only have the latter
+    snippet = context_mark.get_snippet().replace("\n", "%0A")
+    return annotation(
+        "error", path, context_mark.line, error.problem_mark.line+1,
+        "conandata.yml schema error",
+        f"Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
     )
-    
-def pretty_print_yaml_validate_warning(args, error):
-    snippet = error.context_mark.get_snippet().replace("\n", "%0A")
-    print(
-        f"::warning file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
-        f"title=conandata.yml schema warning"
-        f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
+
+def yaml_validate_warning(path, error):
+    context_mark = error.context_mark  # a property computed on every read: read it once
+    if context_mark is None:
+        context_mark = error.problem_mark  # syntax errors may only have the latter
+    snippet = context_mark.get_snippet().replace("\n", "%0A")
+    return annotation(
+        "warning", path, context_mark.line, error.problem_mark.line+1,
+        "conandata.yml schema warning",
+        f"Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
     )
 
 
@@ -1,36 +1,48 @@
 import argparse
 from strictyaml import load, Map, Str, YAMLValidationError, MapPattern
-from yaml_linting import file_path
+from strictyaml.ruamel.error import YAMLError
+from yaml_linting import add_batch_arguments, annotation, expand_paths, run_batch
+
+
+SCHEMA = Map(
+    {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
+)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Validate ConanCenterIndex's 'config.yaml' file."
     )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
-    )
+    add_batch_arguments(parser, "recipes/*/config.yml")
     args = parser.parse_args()
 
-    schema = Map(
-        {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
-    )
+    run_batch(lint_config, expand_paths(parser, args.paths), jobs=args.jobs, output_format=args.format)
+
 
-    with open(args.path) as f:
+def lint_config(path):
+    """ Validate a single config.yml, returns the list of annotations """
+    with open(path) as f:
         content = f.read()
 
     try:
-        load(content, schema)
+        load(content, SCHEMA)
     except YAMLValidationError as error:
         e = error.__str__().replace("\n", "%0A")
-        print(
-            f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line},"
-            f"title=config.yml schema error"
-            f"::{e}\n"
-        )
+        return [annotation(
+            "error", path, error.context_mark.line, error.problem_mark.line,
+            "config.yml schema error",
+            f"{e}\n"
+        )]
+    except YAMLError as error:  # YAML could not be parsed, or uses a construct strictyaml disallows
+        e = error.__str__().replace("\n", "%0A")
+        problem_line = error.problem_mark.line if error.problem_mark else 0
+        context_line = error.context_mark.line if error.context_mark else problem_line
+        return [annotation(
+            "error", path, context_line, problem_line,
+            "config.yml syntax error",
+            f"{e}\n"
+        )]
+    return []
 
 
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+"""
+
+Run the ConanCenterIndex pylint rules over many recipes at once.
+
+Recipes are linted in a process pool and the results are stored in a cache keyed by the
+content of each conanfile (and the python files next to it) plus the sources of the linter
+itself, so re-runs only lint the files that changed.
+
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+LINTER_DIR = Path(__file__).parent.absolute()
+DEFAULT_CACHE = Path(".cache") / "cci-linter" / "pylint.json"
+
+
+def _hash_files(paths, hasher):
+    for path in sorted(paths):
+        hasher.update(str(path.name).encode())
+        hasher.update(path.read_bytes())
+
+
+def linter_fingerprint(rcfile):
+    """ Hash of everything that can change the result of the linter for any recipe """
+    import astroid
+    import pylint
+    try:
+        # The recipes import conan: its API decides of no-name-in-module and friends
+        import conan
+        conan_version = conan.__version__
+    except ImportError:
+        conan_version = "none"
+
+    hasher = hashlib.sha256()
+    for version in (pylint.__version__, astroid.__version__, conan_version, sys.version):
+        hasher.update(f"{version}\n".encode())
+    _hash_files(LINTER_DIR.glob("*.py"), hasher)
+    _hash_files([Path(rcfile)], hasher)
+    return hasher.hexdigest()
+
+
+def recipe_fingerprint(conanfile, linter_hash):
+    """ Hash of the conanfile and its sibling modules (it may import them) """
+    hasher = hashlib.sha256(linter_hash.encode())
+    conanfile = Path(conanfile)
+    siblings = [p for p in conanfile.parent.glob("*.py") if p != conanfile]
+    _hash_files([conanfile], hasher)
+    _hash_files(siblings, hasher)
+    return hasher.hexdigest()
+
+
+def _normalized_path(path):
+    return os.path.normcase(os.path.realpath(path))
+
+
+def _lint_chunk(rcfile, files):
+    from pylint.lint import Run
+    from pylint.reporters import JSONReporter
+
+    output = io.StringIO()
+    # duplicate-code compares files against each other, it can't be cached per recipe
+    args = [f"--rcfile={rcfile}", "--score=n", "--disable=duplicate-code", *files]
+    Run(args, reporter=JSONReporter(output), exit=False)
+    results = {file: [] for file in files}
+    # pylint spells the paths its own way (relative, normalized...): map them back to the given files,
+    # a file whose messages were keyed differently would be cached as clean
+    given = {_normalized_path(file): file for file in files}
+    configuration = [_normalized_path(rcfile), "Command line or configuration file"]
+    for message in json.loads(output.getvalue() or "[]"):
+        path = _normalized_path(message["path"]) if os.path.isfile(message["path"]) else message["path"]
+        if path in configuration:
+            # Not about a recipe (e.g. a plugin which can't be loaded): reported, but never cached
+            results.setdefault(message["path"], []).append(message)
+            continue
+        if path not in given:
+            raise RuntimeError(f"pylint reported {message['path']}, which is not one of {files}")
+        results[given[path]].append(message)
+    return results
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path, cache):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, cache_path)
+
+
+def lint_recipes(files, rcfile, cache_path=DEFAULT_CACHE, jobs=None, chunk_size=8):
+    """ Lint all the given files, returns a dict {file: [pylint json messages]} """
+    linter_hash = linter_fingerprint(rcfile)
+    cache = load_cache(cache_path) if cache_path else {}
+
+    results = {}
+    keys = {}
+    pending = []
+    for file in files:
+        keys[file] = recipe_fingerprint(file, linter_hash)
+        cached = cache.get(file)
+        if cached and cached["key"] == keys[file]:
+            results[file] = cached["messages"]
+        else:
+            pending.append(file)
+
+    print(f"Linting {len(pending)} files ({len(files) - len(pending)} cached)", file=sys.stderr)
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_lint_chunk, rcfile, chunk) for chunk in _chunks(pending, chunk_size)]
+            for future in futures:
+                for file, messages in future.result().items():
+                    results[file] = messages
+                    if file in keys:
+                        cache[file] = {"key": keys[file], "messages": messages}
+
+    if cache_path:
+        # Drop entries of files that no longer exist
+        cache = {file: value for file, value in cache.items() if os.path.isfile(file)}
+        save_cache(cache_path, cache)
+    return results
+
+
+def print_parseable(results, out):
+    for file in sorted(results):
+        for msg in results[file]:
+            out.write(f"{msg['path']}:{msg['line']}: [{msg['message-id']}({msg['symbol']}), {msg['obj']}] "
+                      f"{msg['message']}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run ConanCenterIndex pylint rules over many recipes in parallel, caching the results."
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        default=["recipes/*/*/conanfile.py"],
+        help="files or glob patterns to lint (default: recipes/*/*/conanfile.py)",
+    )
+    parser.add_argument("--rcfile", default=str(LINTER_DIR / "pylintrc_recipe"), help="pylint rcfile to use.")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE), help="cache file, empty string to disable.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes (default: all CPUs).")
+    parser.add_argument("--output-format", choices=["parseable", "json"], default="parseable")
+    parser.add_argument("--output", default=None, help="write the report to this file instead of stdout.")
+    args = parser.parse_args()
+
+    files = sorted({file for pattern in args.patterns for file in glob.glob(pattern)})
+    results = lint_recipes(files, args.rcfile, cache_path=args.cache or None, jobs=args.jobs)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.output_format == "json":
+            json.dump([msg for file in sorted(results) for msg in results[file]], out, indent=4)
+        else:
+            print_parseable(results, out)
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+
+Cross-file consistency checks between a recipe's config.yml, its conandata.yml files and
+the patches on disk:
+
+ - every folder listed in config.yml exists and has a conanfile.py
+ - every version listed in config.yml has a `sources` entry in `<folder>/conandata.yml`
+ - every `patch_file` listed in `patches` exists
+
+Each recipe is checked independently, so the whole index is validated in a single
+parallel pass.
+
+"""
+
+import argparse
+import os
+
+import yaml
+from yaml_linting import add_batch_arguments, annotation, expand_paths, run_batch
+
+
+TITLE = "recipe consistency"
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class LineDict(dict):
+    """ Mapping loaded from YAML which also knows the line (1-based) of each key """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lines = {}
+
+
+def _to_python(node):
+    # Every scalar is kept as a string, versions like 1.10 must not become floats
+    if isinstance(node, yaml.MappingNode):
+        result = LineDict()
+        for key_node, value_node in node.value:
+            result[key_node.value] = _to_python(value_node)
+            result.lines[key_node.value] = key_node.start_mark.line + 1
+        return result
+    if isinstance(node, yaml.SequenceNode):
+        return [_to_python(item) for item in node.value]
+    return node.value
+
+
+def load_yaml(path):
+    with open(path, encoding="utf-8") as f:
+        node = yaml.compose(f, Loader=_Loader)
+    return _to_python(node) if node is not None else LineDict()
+
+
+def _section(data, key):
+    value = data.get(key) if isinstance(data, dict) else None
+    return value if isinstance(value, dict) else LineDict()
+
+
+def check_recipe(config_path):
+    """ Check one recipe given its config.yml, returns the list of annotations """
+    annotations = []
+    recipe_dir = os.path.dirname(config_path)
+
+    def error(path, line, message):
+        annotations.append(annotation("error", path, line, line, TITLE, message))
+
+    try:
+        versions = _section(load_yaml(config_path), "versions")
+    except yaml.YAMLError as exc:
+        error(config_path, 1, f"config.yml could not be parsed: {exc}".replace("\n", "%0A"))
+        return annotations
+
+    folders = {}
+    for version, info in versions.items():
+        folder = info.get("folder") if isinstance(info, dict) else None
+        if folder is None:
+            continue  # Reported by config_yaml_linter.py
+        folders.setdefault(folder, []).append(version)
+
+    for folder, folder_versions in folders.items():
+        folder_path = os.path.join(recipe_dir, folder)
+        conanfile_path = os.path.join(folder_path, "conanfile.py")
+        conandata_path = os.path.join(folder_path, "conandata.yml")
+        if not os.path.isfile(conanfile_path):
+            for version in folder_versions:
+                error(config_path, versions.lines[version],
+                      f"Version `{version}` uses folder `{folder}`, but `{conanfile_path}` does not exist")
+            continue
+        if not os.path.isfile(conandata_path):
+            continue  # Some recipes don't download sources (e.g. system packages)
+
+        try:
+            conandata = load_yaml(conandata_path)
+        except yaml.YAMLError:
+            continue  # Reported by conandata_yaml_linter.py
+        sources = _section(conandata, "sources")
+        for version in folder_versions:
+            if version not in sources:
+                error(config_path, versions.lines[version],
+                      f"Version `{version}` is listed in config.yml, but there is no `sources` entry for it"
+                      f" in `{conandata_path}`")
+
+        for version, patches in _section(conandata, "patches").items():
+            if not isinstance(patches, list):
+                continue
+            for patch in patches:
+                if not isinstance(patch, dict) or not isinstance(patch.get("patch_file"), str):
+                    continue
+                if not os.path.isfile(os.path.join(folder_path, patch["patch_file"])):
+                    error(conandata_path, patch.lines["patch_file"],
+                          f"Patch file `{patch['patch_file']}` listed for version `{version}` does not exist")
+    return annotations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check the consistency between ConanCenterIndex's config.yml, conandata.yml and patch files."
+    )
+    add_batch_arguments(parser, "recipes/*/config.yml")
+    args = parser.parse_args()
+
+    run_batch(check_recipe, expand_paths(parser, args.paths), jobs=args.jobs, output_format=args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,9 @@
 import argparse
+import functools
+import glob
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 
 def file_path(a_string):
@@ -7,3 +12,92 @@ def file_path(a_string):
     if not isfile(a_string):
         raise argparse.ArgumentTypeError(f"{a_string} does not point to a file")
     return a_string
+
+
+def add_batch_arguments(parser, default_pattern):
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[default_pattern],
+        help=f"files or glob patterns to validate (default: {default_pattern}).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of processes used to validate many files (default: all CPUs).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["github", "json"],
+        default="github",
+        help="print GitHub annotations or a JSON list of them.",
+    )
+
+
+def expand_paths(parser, patterns):
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            try:
+                paths.append(file_path(pattern))
+            except argparse.ArgumentTypeError as error:
+                parser.error(str(error))
+    return paths
+
+
+def annotation(level, path, line, endline, title, message):
+    return {
+        "level": level,
+        "file": path,
+        "line": line,
+        "endline": endline,
+        "title": title,
+        "message": message,
+    }
+
+
+def format_annotation(annotation):
+    return (
+        f"::{annotation['level']} file={annotation['file']},line={annotation['line']},"
+        f"endline={annotation['endline']},title={annotation['title']}::{annotation['message']}"
+    )
+
+
+def _lint_isolated(lint_file, path):
+    """ Run `lint_file` on one path, an unexpected failure becomes an annotation instead of aborting the batch """
+    try:
+        return lint_file(path)
+    except Exception as error:
+        message = f"{type(error).__name__}: {error}".replace("\n", "%0A")
+        return [annotation("error", path, 1, 1, "linter failure", message)]
+
+
+def run_batch(lint_file, paths, jobs=None, output_format="github", out=sys.stdout):
+    """ Validate all paths with `lint_file(path) -> [annotation]` and report them to a single stream """
+    lint_file = functools.partial(_lint_isolated, lint_file)
+    if len(paths) <= 1 or jobs == 1:
+        results = map(lint_file, paths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        results = executor.map(lint_file, paths, chunksize=32)
+
+    annotations = []
+    try:
+        for file_annotations in results:
+            if output_format == "json":
+                annotations.extend(file_annotations)
+            else:
+                for item in file_annotations:
+                    print(format_annotation(item), file=out)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if output_format == "json":
+        json.dump(annotations, out, indent=2)
+        out.write("\n")
@@ -143,7 +143,7 @@ class AbseilConan(ConanFile):
         rmdir(self, cmake_folder)
 
         # Create a json helper file in order to populate package_info() at consume time
-        self._create_components_file(self._components_helper_filepath, components)
+        self._create_components_file(self._components_table_filepath, components)
 
         # Create a build-module that will propagate the required cxx_std to consumers of this recipe's targets
         # TODO: Revisit with feedback from https://github.com/conan-io/conan/issues/10281
@@ -223,12 +223,32 @@ class AbseilConan(ConanFile):
 
         return components
 
+    def _components_table(self, components):
+        """cpp_info of each component, ready to be applied as is by package_info()
+
+        Only the data of the package is stored: what depends on the consumer's settings is added by package_info().
+        """
+        table = {}
+        for pkgconfig_name, values in components.items():
+            component = {"properties": {"cmake_target_name": values["cmake_target"], "pkg_config_name": pkgconfig_name}}
+            for attribute in ["libs", "defines", "system_libs", "frameworks", "requires"]:
+                value = values.get(attribute, [])
+                if value:
+                    component[attribute] = value
+            table[pkgconfig_name] = component
+        return table
+
     def _create_components_file(self, output_file, components):
-        content = json.dumps(components, indent=4)
+        content = json.dumps(self._components_table(components), separators=(",", ":"))
         save(self, output_file, content)
 
+    @property
+    def _components_table_filepath(self):
+        return os.path.join(self.package_folder, "lib", "conan_components.json")
+
     @property
     def _components_helper_filepath(self):
+        # Written by previous revisions of the recipe, with the components as parsed from abseil's CMake files
         return os.path.join(self.package_folder, "lib", "components.json")
 
     def _create_cxx_std_module_file(self, output_file, components):
@@ -246,27 +266,25 @@ class AbseilConan(ConanFile):
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "absl")
 
-        components_json_file = load(self, self._components_helper_filepath)
-        abseil_components = json.loads(components_json_file)
+        # The table written by package() only has to be applied
+        if os.path.isfile(self._components_table_filepath):
+            abseil_components = json.loads(load(self, self._components_table_filepath))
+        else:
+            abseil_components = self._components_table(json.loads(load(self, self._components_helper_filepath)))
         for pkgconfig_name, values in abseil_components.items():
-            cmake_target = values["cmake_target"]
-            self.cpp_info.components[pkgconfig_name].set_property(
-                "cmake_target_name", f"absl::{cmake_target}"
-            )
-            self.cpp_info.components[pkgconfig_name].set_property("cmake_target_name", cmake_target)
-            self.cpp_info.components[pkgconfig_name].set_property("pkg_config_name", pkgconfig_name)
-            self.cpp_info.components[pkgconfig_name].libs = values.get("libs", [])
-            self.cpp_info.components[pkgconfig_name].defines = values.get("defines", [])
-            self.cpp_info.components[pkgconfig_name].system_libs = values.get("system_libs", [])
-            self.cpp_info.components[pkgconfig_name].frameworks = values.get("frameworks", [])
-            self.cpp_info.components[pkgconfig_name].requires = values.get("requires", [])
+            component = self.cpp_info.components[pkgconfig_name]
+            for name, value in values.pop("properties").items():
+                component.set_property(name, value)
+            for attribute, value in values.items():
+                setattr(component, attribute, value)
             if is_msvc(self) and self.settings.compiler.get_safe("cppstd") == "20":
-                self.cpp_info.components[pkgconfig_name].defines.extend(
+                component.defines.extend(
                     ["_HAS_DEPRECATED_RESULT_OF", "_SILENCE_CXX17_RESULT_OF_DEPRECATION_WARNING"]
                 )
 
-            self.cpp_info.components[pkgconfig_name].names["cmake_find_package"] = cmake_target
-            self.cpp_info.components[pkgconfig_name].names["cmake_find_package_multi"] = cmake_target
+            cmake_target = component.get_property("cmake_target_name")
+            component.names["cmake_find_package"] = cmake_target
+            component.names["cmake_find_package_multi"] = cmake_target
 
         self.cpp_info.names["cmake_find_package"] = "absl"
         self.cpp_info.names["cmake_find_package_multi"] = "absl"
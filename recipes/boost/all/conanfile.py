@@ -24,6 +24,44 @@ import yaml
 required_conan_version = ">=1.53.0"
 
 
+# Parsed dependencies-x.y.z.yml files, with the transitive closures of their module dependencies.
+# Shared by all the instances of the recipe, so each file is parsed and closed only once per process.
+_DEPENDENCIES_CACHE = {}
+
+
+def _load_dependencies(dependencies_filepath):
+    if dependencies_filepath not in _DEPENDENCIES_CACHE:
+        with open(dependencies_filepath, encoding="utf-8") as f:
+            dependencies = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        direct = dependencies["dependencies"]
+
+        # Forward closure of every module (itself included): one walk with its own visited set per
+        # module, which unlike memoizing partial closures stays correct if the dependencies have a cycle
+        dependent_modules = {}
+        for module in set(direct).union(*direct.values()):
+            result = {module}
+            pending = [module]
+            while pending:
+                for dependency in direct.get(pending.pop(), []):
+                    if dependency not in result:
+                        result.add(dependency)
+                        pending.append(dependency)
+            dependent_modules[module] = result
+
+        # Reverse closure: the modules which (transitively) depend on each module, itself included
+        super_modules = {}
+        for module, modules in dependent_modules.items():
+            for dependency in modules:
+                super_modules.setdefault(dependency, {dependency}).add(module)
+
+        _DEPENDENCIES_CACHE[dependencies_filepath] = (
+            dependencies,
+            {module: frozenset(modules) for module, modules in dependent_modules.items()},
+            {module: frozenset(modules) for module, modules in super_modules.items()},
+        )
+    return _DEPENDENCIES_CACHE[dependencies_filepath]
+
+
 # When adding (or removing) an option, also add this option to the list in
 # `rebuild-dependencies.yml` and re-run that script.
 CONFIGURE_OPTIONS = (
@@ -188,40 +226,23 @@ class BoostConan(ConanFile):
         return f"dependencies-{self.version}.yml"
 
     @property
-    def _dependencies(self):
+    def _loaded_dependencies(self):
         if self._cached_dependencies is None:
             dependencies_filepath = os.path.join(self.recipe_folder, "dependencies", self._dependency_filename)
             if not os.path.isfile(dependencies_filepath):
                 raise ConanException(f"Cannot find {dependencies_filepath}")
-            with open(dependencies_filepath, encoding='utf-8') as f:
-                self._cached_dependencies = yaml.safe_load(f)
+            self._cached_dependencies = _load_dependencies(dependencies_filepath)
         return self._cached_dependencies
 
+    @property
+    def _dependencies(self):
+        return self._loaded_dependencies[0]
+
     def _all_dependent_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set()
-            for dependency in dependencies:
-                new_dependencies.update(set(self._dependencies["dependencies"][dependency]))
-                new_dependencies.update(dependencies)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return set(self._loaded_dependencies[1][name])
 
     def _all_super_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set(dependencies)
-            for module in self._dependencies["dependencies"]:
-                if dependencies.intersection(set(self._dependencies["dependencies"][module])):
-                    new_dependencies.add(module)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return set(self._loaded_dependencies[2].get(name, {name}))
 
     @property
     def _bcp_dir(self):
@@ -9,6 +9,7 @@ from pathlib import Path
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple
 import logging
 import pprint
@@ -172,6 +173,7 @@ class BoostDependencyBuilder(object):
         git_url: str,
         outputdir: Path,
         unsafe: bool,
+        git_jobs: int = 8,
     ):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
@@ -179,52 +181,95 @@ class BoostDependencyBuilder(object):
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
+        self.git_jobs = git_jobs
 
     @property
-    def boost_path(self) -> Path:
+    def mirror_path(self) -> Path:
+        # Persistent clone of boost with all its submodules, shared by the worktrees of every version
         return self.tmppath / "boost"
 
+    @property
+    def boost_path(self) -> Path:
+        return self.tmppath / "boost-worktrees" / self.boost_version
+
+    @property
+    def boostdep_path(self) -> Path:
+        return self.tmppath / "boostdep-{}".format(self.boostdep_version)
+
     def do_git_update(self) -> None:
-        if not self.boost_path.exists():
+        if not self.mirror_path.exists():
             with chdir(self, str(self.tmppath)):
                 print("Cloning boost git")
                 subprocess.check_call(["git", "clone", "--", self.git_url, "boost"])
-            with chdir(self, str(self.boost_path)):
+            with chdir(self, str(self.mirror_path)):
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
                 print("Removing master branch")
                 subprocess.check_call(["git", "branch", "-D", "master"])
         else:
-            with chdir(self, str(self.boost_path)):
+            with chdir(self, str(self.mirror_path)):
                 print("Updating git repo")
-                subprocess.check_call(["git", "fetch", "origin"])
+                subprocess.check_call(["git", "fetch", "--tags", "origin"])
                 print("Removing all local changes to git repo")
                 subprocess.check_call(["git", "reset", "--hard", "HEAD"])
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
+        with chdir(self, str(self.mirror_path)):
+            print("Updating git submodules")
+            subprocess.check_call(["git", "submodule", "update", "--init", "--jobs", str(self.git_jobs)])
+            subprocess.check_call(["git", "submodule", "foreach", "--quiet", "git fetch --quiet --tags origin"])
+
+    def _submodules(self) -> Dict[str, str]:
+        """name -> path of the submodules of the checked out version"""
+        output = subprocess.check_output(
+            ["git", "config", "--file", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"], text=True
+        )
+        submodules = {}
+        for line in output.splitlines():
+            key, path = line.split(" ", 1)
+            submodules[key[len("submodule.") : -len(".path")]] = path
+        return submodules
 
     def do_git_submodule_update(self):
-        with chdir(self, str(self.boost_path)):
-            if not self.unsafe:
-                # De-init + init to make sure that boostdep won't detect a new or removed boost library
-                print("De-init git submodules")
-                subprocess.check_call(["git", "submodule", "deinit", "--all", "-f"])
+        if self.unsafe and self.boost_path.exists():
+            print("Reusing the worktree of version {} as is".format(self.boost_version))
+            return
 
-            try:
-                print("Checking out version {}".format(self.boost_version))
-                subprocess.check_call(["git", "checkout", "boost-{}".format(self.boost_version)])
-            except subprocess.CalledProcessError:
-                print("version {} does not exist".format(self.boost_version))
-                raise
+        if not self.boost_path.exists():
+            with chdir(self, str(self.mirror_path)):
+                try:
+                    print("Creating a worktree for version {}".format(self.boost_version))
+                    subprocess.check_call(
+                        ["git", "worktree", "add", "--detach", "--force", str(self.boost_path),
+                         "boost-{}".format(self.boost_version)]
+                    )
+                except subprocess.CalledProcessError:
+                    print("version {} does not exist".format(self.boost_version))
+                    raise
 
-            print("Re-init git submodules")
-            subprocess.check_call(["git", "submodule", "update", "--init"])
+        with chdir(self, str(self.boost_path)):
+            # Submodules are cloned from the persistent clone (hard links, no network),
+            # only the ones unknown to it (removed from master) are fetched from their url.
+            subprocess.check_call(["git", "submodule", "init"])
+            for name, path in self._submodules().items():
+                local = self.mirror_path / path
+                if (local / ".git").exists():
+                    subprocess.check_call(["git", "config", "submodule.{}.url".format(name), str(local)])
+
+            print("Updating git submodules of version {}".format(self.boost_version))
+            subprocess.check_call(
+                ["git", "-c", "protocol.file.allow=always", "submodule", "update", "--init", "--force",
+                 "--jobs", str(self.git_jobs)]
+            )
 
             print("Removing unknown files/directories")
-            subprocess.check_call(["git", "clean", "-d", "-f"])
+            subprocess.check_call(["git", "clean", "-d", "-f", "-f"])
 
     def do_install_boostdep(self):
-        with chdir(self, str(self.boost_path)):
+        if (self.boostdep_path / "conanbuildinfo.json").is_file():
+            return
+        self.boostdep_path.mkdir(parents=True, exist_ok=True)
+        with chdir(self, str(self.boostdep_path)):
             print("Installing boostdep/{}".format(self.boostdep_version))
             subprocess.check_call(
                 ["conan", "install", "boostdep/{}@".format(self.boostdep_version), "-g", "json"]
@@ -232,9 +277,14 @@ class BoostDependencyBuilder(object):
 
     @property
     def _bin_paths(self):
-        with chdir(self, str(self.boost_path)):
-            data = json.loads(open("conanbuildinfo.json").read())
-            return data["dependencies"][0]["bin_paths"]
+        data = json.loads((self.boostdep_path / "conanbuildinfo.json").read_text())
+        return data["dependencies"][0]["bin_paths"]
+
+    @property
+    def _boostdep_env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        env["PATH"] = os.pathsep.join(self._bin_paths + [env.get("PATH", "")])
+        return env
 
     _GREP_IGNORE_PREFIX = ("#", '"')
     _GREP_IGNORE_PARTS = ("boost", "<", ">")
@@ -301,33 +351,33 @@ class BoostDependencyBuilder(object):
 
     def do_boostdep_collect(self) -> BoostDependencies:
         with chdir(self, str(self.boost_path)):
-            with environment_append(self, {"PATH": self._bin_paths}):
-                buildables = subprocess.check_output(["boostdep", "--list-buildable"], text=True)
-                buildables = buildables.splitlines()
-                log.debug("`boostdep --list--buildable` returned these buildables: %s", buildables)
+            env = self._boostdep_env
+            buildables = subprocess.check_output(["boostdep", "--list-buildable"], text=True, env=env)
+            buildables = buildables.splitlines()
+            log.debug("`boostdep --list--buildable` returned these buildables: %s", buildables)
 
-                # modules = subprocess.check_output(["boostdep", "--list-modules"])
-                # modules = modules.decode().splitlines()
+            # modules = subprocess.check_output(["boostdep", "--list-modules"])
+            # modules = modules.decode().splitlines()
 
-                dep_modules = buildables
+            dep_modules = buildables
 
-                dependency_tree = {}
-                buildable_dependencies = subprocess.check_output(
-                    ["boostdep", "--list-buildable-dependencies"], text=True
-                )
-                log.debug("boostdep --list-buildable-dependencies returns: %s", buildable_dependencies)
-                for line in buildable_dependencies.splitlines():
-                    if re.match(r"^[\s]*#.*", line):
-                        continue
-                    match = re.match(r"([\S]+)\s*=\s*([^;]+)\s*;\s*", line)
-                    if not match:
-                        continue
-                    master = match.group(1)
-                    dependencies = re.split(r"\s+", match.group(2).strip())
-                    dependency_tree[master] = dependencies
-
-                log.debug("Using `boostdep --track-sources`, the following dependency tree was calculated:")
-                log.debug(pprint.pformat(dependency_tree))
+            dependency_tree = {}
+            buildable_dependencies = subprocess.check_output(
+                ["boostdep", "--list-buildable-dependencies"], text=True, env=env
+            )
+            log.debug("boostdep --list-buildable-dependencies returns: %s", buildable_dependencies)
+            for line in buildable_dependencies.splitlines():
+                if re.match(r"^[\s]*#.*", line):
+                    continue
+                match = re.match(r"([\S]+)\s*=\s*([^;]+)\s*;\s*", line)
+                if not match:
+                    continue
+                master = match.group(1)
+                dependencies = re.split(r"\s+", match.group(2).strip())
+                dependency_tree[master] = dependencies
+
+            log.debug("Using `boostdep --track-sources`, the following dependency tree was calculated:")
+            log.debug(pprint.pformat(dependency_tree))
 
         filtered_dependency_tree = {
             k: [d for d in v if d in buildables] for k, v in dependency_tree.items() if k in buildables
@@ -518,24 +568,31 @@ class BoostDependencyBuilder(object):
             yaml.dump(data, fout)
 
 
+def _create_dependency_file(boost_collector: BoostDependencyBuilder) -> str:
+    boost_collector.do_create_dependency_file()
+    return boost_collector.boost_version
+
+
 def main(args=None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", dest="verbose", action="store_true", help="verbose output")
     parser.add_argument(
         "-t",
         dest="tmppath",
-        help="temporary folder where to clone boost (default is system temporary folder)",
+        type=Path,
+        help="folder where boost is cloned and the worktree of each version is kept (default is system temporary folder)",
     )
     parser.add_argument("-d", dest="boostdep_version", default="1.75.0", type=str, help="boostdep version")
     parser.add_argument("-u", dest="git_url", default=BOOST_GIT_URL, help="boost git url")
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
-    parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation: reuse existing worktrees as is")
+    parser.add_argument("-j", dest="jobs", default=None, type=int, help="number of versions processed in parallel")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
-    version_group.add_argument("-v", dest="boost_version", help="boost version")
+    version_group.add_argument("-v", dest="boost_versions", nargs="+", help="boost version(s)")
     version_group.add_argument(
-        "-A", dest="boost_version", action="store_const", const=None, help="All boost versions"
+        "-A", dest="boost_versions", action="store_const", const=None, help="All boost versions"
     )
     ns = parser.parse_args(args)
 
@@ -552,17 +609,14 @@ def main(args=None) -> int:
 
     ns.outputdir.mkdir(exist_ok=True)
 
-    git_update_done = False
-
-    if ns.boost_version is None:
+    if ns.boost_versions is None:
         conan_data = yaml.safe_load(Path("conandata.yml").open())
         boost_versions = list(conan_data["sources"].keys())
     else:
-        boost_versions = [ns.boost_version]
+        boost_versions = ns.boost_versions
 
-    for boost_version in boost_versions:
-        print("Starting {}".format(boost_version))
-        boost_collector = BoostDependencyBuilder(
+    boost_collectors = [
+        BoostDependencyBuilder(
             boost_version=boost_version,
             boostdep_version=ns.boostdep_version,
             git_url=ns.git_url,
@@ -570,20 +624,27 @@ def main(args=None) -> int:
             tmppath=ns.tmppath,
             unsafe=ns.unsafe,
         )
+        for boost_version in boost_versions
+    ]
 
-        if not ns.git_update and not boost_collector.boost_path.exists():
-            log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
-            return 1
+    if not ns.git_update and not boost_collectors[0].mirror_path.exists():
+        log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
+        return 1
 
-        if ns.git_update and not git_update_done:
-            boost_collector.do_git_update()
-            git_update_done = True
+    if ns.git_update:
+        boost_collectors[0].do_git_update()
 
-        boost_collector.do_git_submodule_update()
+    boost_collectors[0].do_install_boostdep()
 
-        boost_collector.do_install_boostdep()
+    # Worktrees share the git repository of the clone: prepare them one at a time
+    for boost_collector in boost_collectors:
+        print("Preparing {}".format(boost_collector.boost_version))
+        boost_collector.do_git_submodule_update()
 
-        boost_collector.do_create_dependency_file()
+    # Each version has its own worktree, they can be analyzed concurrently
+    with ProcessPoolExecutor(max_workers=ns.jobs) as executor:
+        for boost_version in executor.map(_create_dependency_file, boost_collectors):
+            print("Done {}".format(boost_version))
     return 0
 
 
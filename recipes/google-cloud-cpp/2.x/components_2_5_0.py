@@ -1,1592 +0,0 @@
-# Automatically generated by /usr/local/google/home/coryan/cci-develop/recipes/google-cloud-cpp/2.x/extract_dependencies.py DO NOT EDIT
-DEPENDENCIES = {
-    "accessapproval_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "accesscontextmanager_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "apigateway_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "apigeeconnect_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "appengine_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "logging_type_type_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "artifactregistry_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "asset_protos": [
-        "accesscontextmanager_protos",
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "osconfig_protos",
-        "protobuf::libprotobuf",
-        "rpc_code_protos",
-        "rpc_status_protos",
-        "type_date_protos",
-        "type_datetime_protos",
-        "type_dayofweek_protos",
-        "type_expr_protos",
-        "type_timeofday_protos",
-    ],
-    "assuredworkloads_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "automl_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "baremetalsolution_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "batch_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "beyondcorp_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "cloud_bigquery_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_distribution_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_label_protos",
-        "api_launch_stage_protos",
-        "api_metric_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "rpc_error_details_protos",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "bigtable_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "api_routing_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "billing_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_date_protos",
-        "type_expr_protos",
-        "type_money_protos",
-    ],
-    "binaryauthorization_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grafeas_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "certificatemanager_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "channel_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_date_protos",
-        "type_datetime_protos",
-        "type_decimal_protos",
-        "type_money_protos",
-        "type_postal_address_protos",
-    ],
-    "cloudbuild_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_httpbody_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "cloud_common_common_protos": [
-        "api_field_behavior_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "composer_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_date_protos",
-    ],
-    "connectors_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "contactcenterinsights_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "container_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_code_protos",
-        "rpc_status_protos",
-    ],
-    "containeranalysis_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grafeas_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "datacatalog_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "datamigration_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "dataplex_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "dataproc_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "datastream_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "debugger_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "devtools_source_v1_source_context_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "deploy_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_date_protos",
-    ],
-    "cloud_dialogflow_v2_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_latlng_protos",
-    ],
-    "dialogflow_cx_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_latlng_protos",
-    ],
-    "dlp_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_date_protos",
-        "type_dayofweek_protos",
-        "type_timeofday_protos",
-    ],
-    "documentai_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_launch_stage_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_color_protos",
-        "type_date_protos",
-        "type_datetime_protos",
-        "type_money_protos",
-        "type_postal_address_protos",
-    ],
-    "edgecontainer_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "eventarc_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_code_protos",
-        "rpc_status_protos",
-    ],
-    "filestore_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "cloud_common_common_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "functions_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "gameservices_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "gkehub_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "grafeas_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "iam_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "iap_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "ids_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "iot_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "kms_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "language_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "logging_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_distribution_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_label_protos",
-        "api_launch_stage_protos",
-        "api_metric_protos",
-        "api_monitored_resource_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "logging_type_type_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "logging_type_type_protos": [
-        "api_annotations_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "managedidentities_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "memcache_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "monitoring_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_distribution_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_label_protos",
-        "api_launch_stage_protos",
-        "api_metric_protos",
-        "api_monitored_resource_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_calendar_period_protos",
-    ],
-    "networkconnectivity_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "networkmanagement_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "notebooks_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "optimization_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_latlng_protos",
-    ],
-    "orgpolicy_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "osconfig_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_date_protos",
-        "type_datetime_protos",
-        "type_dayofweek_protos",
-        "type_timeofday_protos",
-    ],
-    "oslogin_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "policytroubleshooter_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "privateca_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "profiler_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "pubsub_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "recommender_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "type_money_protos",
-    ],
-    "redis_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_dayofweek_protos",
-        "type_timeofday_protos",
-    ],
-    "resourcemanager_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "resourcesettings_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "retail_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_httpbody_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_date_protos",
-    ],
-    "run_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_launch_stage_protos",
-        "api_resource_protos",
-        "api_routing_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "scheduler_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "secretmanager_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "securitycenter_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "servicecontrol_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_distribution_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "logging_type_type_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "servicedirectory_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_expr_protos",
-    ],
-    "servicemanagement_protos": [
-        "api_annotations_protos",
-        "api_auth_protos",
-        "api_backend_protos",
-        "api_billing_protos",
-        "api_client_protos",
-        "api_config_change_protos",
-        "api_context_protos",
-        "api_control_protos",
-        "api_documentation_protos",
-        "api_endpoint_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_label_protos",
-        "api_launch_stage_protos",
-        "api_log_protos",
-        "api_logging_protos",
-        "api_metric_protos",
-        "api_monitored_resource_protos",
-        "api_monitoring_protos",
-        "api_quota_protos",
-        "api_resource_protos",
-        "api_service_protos",
-        "api_source_info_protos",
-        "api_system_parameter_protos",
-        "api_usage_protos",
-        "api_visibility_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "serviceusage_protos": [
-        "api_annotations_protos",
-        "api_auth_protos",
-        "api_client_protos",
-        "api_documentation_protos",
-        "api_endpoint_protos",
-        "api_http_protos",
-        "api_label_protos",
-        "api_launch_stage_protos",
-        "api_monitored_resource_protos",
-        "api_monitoring_protos",
-        "api_quota_protos",
-        "api_usage_protos",
-        "api_visibility_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "shell_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "spanner_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "cloud_speech_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "storage_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "api_routing_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "type_date_protos",
-        "type_expr_protos",
-    ],
-    "storagetransfer_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_code_protos",
-        "rpc_status_protos",
-        "type_date_protos",
-        "type_timeofday_protos",
-    ],
-    "talent_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_latlng_protos",
-        "type_money_protos",
-        "type_postal_address_protos",
-        "type_timeofday_protos",
-    ],
-    "tasks_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "iam_v1_iam_policy_protos",
-        "iam_v1_options_protos",
-        "iam_v1_policy_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_expr_protos",
-    ],
-    "cloud_texttospeech_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "tpu_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "devtools_cloudtrace_v2_trace_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "translate_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "video_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "videointelligence_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "vision_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-        "type_color_protos",
-        "type_latlng_protos",
-    ],
-    "vmmigration_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_error_details_protos",
-        "rpc_status_protos",
-    ],
-    "vmwareengine_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "vpcaccess_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "webrisk_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "websecurityscanner_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "protobuf::libprotobuf",
-    ],
-    "workflows_protos": [
-        "api_annotations_protos",
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "api_http_protos",
-        "api_resource_protos",
-        "grpc::_grpc",
-        "grpc::grpc++",
-        "longrunning_operations_protos",
-        "protobuf::libprotobuf",
-        "rpc_status_protos",
-    ],
-    "api_annotations_protos": ["api_http_protos"],
-    "api_auth_protos": ["api_annotations_protos"],
-    "api_billing_protos": ["api_annotations_protos", "api_metric_protos"],
-    "api_client_protos": ["api_launch_stage_protos"],
-    "api_distribution_protos": ["api_annotations_protos"],
-    "api_endpoint_protos": ["api_annotations_protos"],
-    "api_log_protos": ["api_label_protos"],
-    "api_logging_protos": ["api_annotations_protos", "api_label_protos"],
-    "api_metric_protos": ["api_label_protos", "api_launch_stage_protos"],
-    "api_monitored_resource_protos": ["api_label_protos", "api_launch_stage_protos"],
-    "api_monitoring_protos": ["api_annotations_protos"],
-    "api_quota_protos": ["api_annotations_protos"],
-    "api_service_protos": [
-        "api_annotations_protos",
-        "api_auth_protos",
-        "api_backend_protos",
-        "api_billing_protos",
-        "api_client_protos",
-        "api_context_protos",
-        "api_control_protos",
-        "api_documentation_protos",
-        "api_endpoint_protos",
-        "api_http_protos",
-        "api_label_protos",
-        "api_log_protos",
-        "api_logging_protos",
-        "api_metric_protos",
-        "api_monitored_resource_protos",
-        "api_monitoring_protos",
-        "api_quota_protos",
-        "api_resource_protos",
-        "api_source_info_protos",
-        "api_system_parameter_protos",
-        "api_usage_protos",
-    ],
-    "api_usage_protos": ["api_annotations_protos", "api_visibility_protos"],
-    "devtools_cloudtrace_v2_tracing_protos": [
-        "api_client_protos",
-        "api_field_behavior_protos",
-        "devtools_cloudtrace_v2_trace_protos",
-        "devtools_cloudtrace_v2_trace_protos",
-        "rpc_status_protos",
-    ],
-}
-
-PROTO_COMPONENTS = {
-    "accessapproval_protos",
-    "accesscontextmanager_protos",
-    "api_annotations_protos",
-    "api_auth_protos",
-    "api_backend_protos",
-    "api_billing_protos",
-    "api_client_protos",
-    "api_config_change_protos",
-    "api_context_protos",
-    "api_control_protos",
-    "api_distribution_protos",
-    "api_documentation_protos",
-    "api_endpoint_protos",
-    "api_field_behavior_protos",
-    "api_http_protos",
-    "api_httpbody_protos",
-    "api_label_protos",
-    "api_launch_stage_protos",
-    "api_log_protos",
-    "api_logging_protos",
-    "api_metric_protos",
-    "api_monitored_resource_protos",
-    "api_monitoring_protos",
-    "api_quota_protos",
-    "api_resource_protos",
-    "api_routing_protos",
-    "api_service_protos",
-    "api_source_info_protos",
-    "api_system_parameter_protos",
-    "api_usage_protos",
-    "api_visibility_protos",
-    "apigateway_protos",
-    "apigeeconnect_protos",
-    "appengine_protos",
-    "artifactregistry_protos",
-    "asset_protos",
-    "assuredworkloads_protos",
-    "automl_protos",
-    "baremetalsolution_protos",
-    "batch_protos",
-    "beyondcorp_protos",
-    "bigtable_protos",
-    "billing_protos",
-    "binaryauthorization_protos",
-    "certificatemanager_protos",
-    "channel_protos",
-    "cloud_bigquery_protos",
-    "cloud_common_common_protos",
-    "cloud_dialogflow_v2_protos",
-    "cloud_speech_protos",
-    "cloud_texttospeech_protos",
-    "cloudbuild_protos",
-    "composer_protos",
-    "connectors_protos",
-    "contactcenterinsights_protos",
-    "container_protos",
-    "containeranalysis_protos",
-    "datacatalog_protos",
-    "datamigration_protos",
-    "dataplex_protos",
-    "dataproc_protos",
-    "datastream_protos",
-    "debugger_protos",
-    "deploy_protos",
-    "devtools_cloudtrace_v2_trace_protos",
-    "devtools_cloudtrace_v2_tracing_protos",
-    "devtools_source_v1_source_context_protos",
-    "dialogflow_cx_protos",
-    "dlp_protos",
-    "documentai_protos",
-    "edgecontainer_protos",
-    "eventarc_protos",
-    "filestore_protos",
-    "functions_protos",
-    "gameservices_protos",
-    "gkehub_protos",
-    "grafeas_protos",
-    "iam_protos",
-    "iam_v1_iam_policy_protos",
-    "iam_v1_options_protos",
-    "iam_v1_policy_protos",
-    "iap_protos",
-    "ids_protos",
-    "iot_protos",
-    "kms_protos",
-    "language_protos",
-    "logging_protos",
-    "logging_type_type_protos",
-    "longrunning_operations_protos",
-    "managedidentities_protos",
-    "memcache_protos",
-    "monitoring_protos",
-    "networkconnectivity_protos",
-    "networkmanagement_protos",
-    "notebooks_protos",
-    "optimization_protos",
-    "orgpolicy_protos",
-    "osconfig_protos",
-    "oslogin_protos",
-    "policytroubleshooter_protos",
-    "privateca_protos",
-    "profiler_protos",
-    "pubsub_protos",
-    "recommender_protos",
-    "redis_protos",
-    "resourcemanager_protos",
-    "resourcesettings_protos",
-    "retail_protos",
-    "rpc_code_protos",
-    "rpc_error_details_protos",
-    "rpc_status_protos",
-    "run_protos",
-    "scheduler_protos",
-    "secretmanager_protos",
-    "securitycenter_protos",
-    "servicecontrol_protos",
-    "servicedirectory_protos",
-    "servicemanagement_protos",
-    "serviceusage_protos",
-    "shell_protos",
-    "spanner_protos",
-    "storage_protos",
-    "storagetransfer_protos",
-    "talent_protos",
-    "tasks_protos",
-    "tpu_protos",
-    "translate_protos",
-    "type_calendar_period_protos",
-    "type_color_protos",
-    "type_date_protos",
-    "type_datetime_protos",
-    "type_dayofweek_protos",
-    "type_decimal_protos",
-    "type_expr_protos",
-    "type_latlng_protos",
-    "type_money_protos",
-    "type_postal_address_protos",
-    "type_timeofday_protos",
-    "video_protos",
-    "videointelligence_protos",
-    "vision_protos",
-    "vmmigration_protos",
-    "vmwareengine_protos",
-    "vpcaccess_protos",
-    "webrisk_protos",
-    "websecurityscanner_protos",
-    "workflows_protos",
-}
-
-COMPONENTS = {
-    "accessapproval",
-    "accesscontextmanager",
-    "apigateway",
-    "apigeeconnect",
-    "appengine",
-    "artifactregistry",
-    "asset",
-    "assuredworkloads",
-    "automl",
-    "baremetalsolution",
-    "batch",
-    "beyondcorp",
-    "bigquery",
-    "bigtable",
-    "billing",
-    "binaryauthorization",
-    "certificatemanager",
-    "channel",
-    "cloudbuild",
-    "composer",
-    "connectors",
-    "contactcenterinsights",
-    "container",
-    "containeranalysis",
-    "datacatalog",
-    "datamigration",
-    "dataplex",
-    "dataproc",
-    "datastream",
-    "debugger",
-    "deploy",
-    "dialogflow_cx",
-    "dialogflow_es",
-    "dlp",
-    "documentai",
-    "edgecontainer",
-    "eventarc",
-    "filestore",
-    "functions",
-    "gameservices",
-    "gkehub",
-    "iam",
-    "iap",
-    "ids",
-    "iot",
-    "kms",
-    "language",
-    "logging",
-    "managedidentities",
-    "memcache",
-    "monitoring",
-    "networkconnectivity",
-    "networkmanagement",
-    "notebooks",
-    "optimization",
-    "orgpolicy",
-    "osconfig",
-    "oslogin",
-    "policytroubleshooter",
-    "privateca",
-    "profiler",
-    "pubsub",
-    "recommender",
-    "redis",
-    "resourcemanager",
-    "resourcesettings",
-    "retail",
-    "run",
-    "scheduler",
-    "secretmanager",
-    "securitycenter",
-    "servicecontrol",
-    "servicedirectory",
-    "servicemanagement",
-    "serviceusage",
-    "shell",
-    "spanner",
-    "speech",
-    "storage",
-    "storagetransfer",
-    "talent",
-    "tasks",
-    "texttospeech",
-    "tpu",
-    "trace",
-    "translate",
-    "video",
-    "videointelligence",
-    "vision",
-    "vmmigration",
-    "vmwareengine",
-    "vpcaccess",
-    "webrisk",
-    "websecurityscanner",
-    "workflows",
-}
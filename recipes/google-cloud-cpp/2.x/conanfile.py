@@ -1,3 +1,4 @@
+import json
 import os
 
 from conan import ConanFile
@@ -16,19 +17,6 @@ from conan.tools.microsoft import check_min_vs, is_msvc
 from conan.tools.scm import Version
 from conan.errors import ConanInvalidConfiguration
 
-# Load the generated component dependency information.
-#
-# `google-cloud-cpp` has well over 200 components. Conan cannot use the CMake
-# files generated by `google-cloud-cpp`. Manually maintaining this dependency
-# information is error prone and fairly tedious. A helper script in this
-# directory reproduces the algorithms used by `google-cloud-cpp` to generate its
-# dependency information. With each new revision of `google-cloud-cpp` the
-# script will be used to generate a new file with the component dependency
-# information. The expectation is that maintaining this script will be easier
-# than writing long lists of dependencies by hand.
-import components_2_5_0
-import components_2_12_0
-
 required_conan_version = ">=1.56.0"
 
 
@@ -53,37 +41,61 @@ class GoogleCloudCppConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        # Comma-separated list of the GA components to build (e.g. "storage,pubsub"), or "all".
+        # The proto libraries they need are built as well.
+        "components": ["ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "components": "all",
     }
 
-    _GA_COMPONENTS = {"2.5.0": components_2_5_0.COMPONENTS, "2.12.0": components_2_12_0.COMPONENTS}
+    _cached_component_tables = None
 
-    _PROTO_COMPONENTS = {
-        "2.5.0": components_2_5_0.PROTO_COMPONENTS,
-        "2.12.0": components_2_12_0.PROTO_COMPONENTS,
-    }
-    _PROTO_COMPONENT_DEPENDENCIES = {
-        "2.5.0": components_2_5_0.DEPENDENCIES,
-        "2.12.0": components_2_12_0.DEPENDENCIES,
-    }
-    # Some components require custom dependency definitions.
-    _REQUIRES_CUSTOM_DEPENDENCIES = {
-        "bigquery",
-        "bigtable",
-        "iam",
-        "pubsub",
-        "spanner",
-        "storage",
-    }
+    def export(self):
+        copy(self, self._component_tables_filename, src=self.recipe_folder, dst=self.export_folder)
 
     def export_sources(self):
-        copy(self, "components_2_5_0.py", self.recipe_folder, self.export_sources_folder)
-        copy(self, "components_2_12_0.py", self.recipe_folder, self.export_sources_folder)
         export_conandata_patches(self)
 
+    # Load the generated component dependency information.
+    #
+    # `google-cloud-cpp` has well over 200 components. Conan cannot use the CMake
+    # files generated by `google-cloud-cpp`. Manually maintaining this dependency
+    # information is error prone and fairly tedious. A helper script in this
+    # directory reproduces the algorithms used by `google-cloud-cpp` to generate its
+    # dependency information. With each new revision of `google-cloud-cpp` the
+    # script will be used to generate a new `components-<version>.json` file with
+    # the component dependency information. The expectation is that maintaining
+    # this script will be easier than writing long lists of dependencies by hand.
+    # Only the file of the resolved version is exported and loaded.
+    @property
+    def _component_tables_filename(self):
+        return f"components-{self.version}.json"
+
+    @property
+    def _component_tables(self):
+        if self._cached_component_tables is None:
+            path = os.path.join(self.recipe_folder, self._component_tables_filename)
+            if not os.path.isfile(path):
+                return None
+            with open(path, encoding="utf-8") as f:
+                self._cached_component_tables = json.load(f)
+        return self._cached_component_tables
+
+    @property
+    def _ga_components(self):
+        return self._component_tables["components"] if self._component_tables else []
+
+    @property
+    def _all_proto_components(self):
+        return self._component_tables["proto_components"] if self._component_tables else []
+
+    @property
+    def _proto_component_dependencies(self):
+        return self._component_tables["dependencies"] if self._component_tables else {}
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -97,9 +109,18 @@ class GoogleCloudCppConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        # normalize the components option (sorted+comma separated, "all" for every available component)
+        if self._all_components_requested(info=True):
+            self.info.options.components = "all"
+        else:
+            self.info.options.components = ",".join(self._requested_components(info=True))
+
     def requirements(self):
-        self.requires("protobuf/3.21.12", transitive_headers=True)
-        self.requires("grpc/1.54.3", transitive_headers=True)
+        # google-cloud-cpp only looks for protobuf and gRPC when a gRPC based component is enabled
+        if self._uses_grpc:
+            self.requires("protobuf/3.21.12", transitive_headers=True)
+            self.requires("grpc/1.54.3", transitive_headers=True)
         self.requires("nlohmann_json/3.11.2")
         self.requires("crc32c/1.1.2")
         self.requires("abseil/20230125.3", transitive_headers=True)
@@ -119,15 +140,17 @@ class GoogleCloudCppConan(ConanFile):
         if hasattr(self, "settings_build") and cross_building(self):
             raise ConanInvalidConfiguration("Recipe not prepared for cross-building (yet)")
 
-        if self.version not in self._GA_COMPONENTS:
-            raise ConanInvalidConfiguration("The components are unknown for version %s" % self.version)
-
-        if self.version not in self._PROTO_COMPONENTS:
-            raise ConanInvalidConfiguration("The proto components are unknown for version %s" % self.version)
-
-        if self.version not in self._PROTO_COMPONENT_DEPENDENCIES:
+        # raises when the component tables of the version are missing
+        requested_components = self._requested_components(info=True)
+        if not requested_components:
             raise ConanInvalidConfiguration(
-                "The inter-component dependencies are unknown for version %s" % self.version
+                f"{self.ref} option components selects no component. Use 'all' or a comma separated list of components."
+            )
+        unknown_components = set(requested_components) - set(self._available_components())
+        if unknown_components:
+            raise ConanInvalidConfiguration(
+                f"{self.ref} option components has unknown or unsupported values: {', '.join(sorted(unknown_components))}."
+                f" Available components are: {', '.join(sorted(self._available_components()))}"
             )
 
         if self.settings.compiler == "clang" and Version(self.settings.compiler.version) < "6.0":
@@ -139,7 +162,7 @@ class GoogleCloudCppConan(ConanFile):
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version) < "5.4":
             raise ConanInvalidConfiguration("Building requires GCC >= 5.4")
 
-        if self.info.options.shared and (
+        if self.info.options.shared and self._uses_grpc and (
             not self.dependencies["protobuf"].options.shared or not self.dependencies["grpc"].options.shared
         ):
             raise ConanInvalidConfiguration(
@@ -149,7 +172,8 @@ class GoogleCloudCppConan(ConanFile):
 
     def build_requirements(self):
         # For the grpc-cpp-plugin executable
-        self.tool_requires("grpc/1.54.3")
+        if self._uses_grpc:
+            self.tool_requires("grpc/1.54.3")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -190,8 +214,7 @@ class GoogleCloudCppConan(ConanFile):
         cmake.build()
 
     def _generate_proto_requires(self, component):
-        deps = self._PROTO_COMPONENT_DEPENDENCIES.get(self.version, dict())
-        return deps.get(component, [])
+        return self._proto_component_dependencies.get(component, [])
 
     _SKIPPED_COMPONENTS = {
         # Some protos do not compile due to inconvenient system macros clashing
@@ -207,27 +230,94 @@ class GoogleCloudCppConan(ConanFile):
         "certificatemanager",
     }
 
-    def _components(self):
-        result = self._GA_COMPONENTS.get(self.version, []).copy()
-        for c in self._SKIPPED_COMPONENTS:
-            result.remove(c)
+    def _available_components(self):
+        if self._component_tables is None:
+            raise ConanInvalidConfiguration(
+                f"The components are unknown for version {self.version}: {self._component_tables_filename} is missing"
+            )
+        skipped = set(self._SKIPPED_COMPONENTS)
         # TODO - these do not build on Android due to conflicts between OS
         # macros and Proto enums. Revisit after Protobuf >= 4.23.x
         if self.settings.os == "Android":
-            result.remove("accesscontextmanager")
-            result.remove("talent")
-        return result
+            skipped.update(["accesscontextmanager", "talent"])
+        return [c for c in self._ga_components if c not in skipped]
+
+    def _requested_components(self, info=False):
+        options = self.info.options if info else self.options
+        if str(options.components) == "all":
+            return sorted(self._available_components())
+        return sorted(set(filter(None, "".join(str(options.components).split()).split(","))))
+
+    def _all_components_requested(self, info=False):
+        options = self.info.options if info else self.options
+        return str(options.components) == "all" or self._requested_components(info) == sorted(self._available_components())
+
+    def _components(self):
+        return [c for c in self._requested_components() if c in self._available_components()]
+
+    @property
+    def _uses_grpc(self):
+        # `storage` is the only GA component which does not use gRPC
+        if str(self.options.components) == "all":
+            return True
+        return any(c != "storage" for c in self._requested_components())
+
+    # Interface libraries for backwards compatibility
+    _PROTO_ALIASES = {
+        "dialogflow_es_protos": ["cloud_dialogflow_v2_protos"],
+        "logging_type_protos": ["logging_type_type_protos"],
+        "speech_protos": ["cloud_speech_protos"],
+        "texttospeech_protos": ["cloud_texttospeech_protos"],
+        "trace_protos": [
+            "devtools_cloudtrace_v2_trace_protos",
+            "devtools_cloudtrace_v2_tracing_protos",
+        ],
+    }
+
+    # A small number of gRPC-generated stubs are used directly in the common components
+    # shared by all gRPC-based libraries.  These must be defined without reference to `grpc_utils`.
+    _GRPC_UTILS_REQUIRED_PROTOS = {
+        "iam_protos",
+        "longrunning_operations_protos",
+        "rpc_error_details_protos",
+        "rpc_status_protos",
+    }
+
+    @staticmethod
+    def _component_protos(component):
+        # bigquery and dialogflow_es proto libraries predate the adoption of more consistent naming
+        return {
+            "bigquery": "cloud_bigquery_protos",
+            "dialogflow_es": "cloud_dialogflow_v2_protos",
+        }.get(component, f"{component}_protos")
 
     def _proto_components(self):
-        result = self._PROTO_COMPONENTS.get(self.version, []).copy()
+        available = set(self._all_proto_components)
         for c in self._SKIPPED_COMPONENTS:
-            result.remove(c + "_protos")
+            available.discard(c + "_protos")
         # TODO - these do not build on Android due to conflicts between OS
         # macros and Proto enums. Revisit after Protobuf >= 4.23.x
         if self.settings.os == "Android":
-            result.remove("accesscontextmanager_protos")
-            result.remove("talent_protos")
-        return result
+            available.discard("accesscontextmanager_protos")
+            available.discard("talent_protos")
+        if not self._uses_grpc:
+            return []
+        if self._all_components_requested():
+            return sorted(available)
+
+        # The protos of the selected components, and their transitive proto dependencies
+        deps = self._proto_component_dependencies
+        pending = list(self._GRPC_UTILS_REQUIRED_PROTOS)
+        pending.extend(self._component_protos(c) for c in self._components() if c != "storage")
+        result = set()
+        while pending:
+            component = pending.pop()
+            if component in self._PROTO_ALIASES:
+                pending.extend(self._PROTO_ALIASES[component])
+            elif component in available and component not in result:
+                result.add(component)
+                pending.extend(d for d in deps.get(component, []) if d.endswith("_protos"))
+        return sorted(result)
 
     def package(self):
         copy(self, "LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
@@ -265,92 +355,63 @@ class GoogleCloudCppConan(ConanFile):
         self.cpp_info.components["common"].libs = ["google_cloud_cpp_common"]
         self.cpp_info.components["common"].set_property("pkg_config_name", "google_cloud_cpp_common")
 
-        self.cpp_info.components["rest_internal"].requires = [
-            "common",
-            "libcurl::libcurl",
-            "openssl::ssl",
-            "openssl::crypto",
-            "zlib::zlib",
-        ]
-        self.cpp_info.components["rest_internal"].libs = ["google_cloud_cpp_rest_internal"]
-        self.cpp_info.components["rest_internal"].set_property("pkg_config_name", "google_cloud_cpp_common")
-
-        # A small number of gRPC-generated stubs are used directly in the common components
-        # shared by all gRPC-based libraries.  These must be defined without reference to `grpc_utils`.
-        GRPC_UTILS_REQUIRED_PROTOS = {
-            "iam_protos",
-            "longrunning_operations_protos",
-            "rpc_error_details_protos",
-            "rpc_status_protos",
-        }
-        for component in GRPC_UTILS_REQUIRED_PROTOS:
+        if "storage" in self._components():
+            self.cpp_info.components["rest_internal"].requires = [
+                "common",
+                "libcurl::libcurl",
+                "openssl::ssl",
+                "openssl::crypto",
+                "zlib::zlib",
+            ]
+            self.cpp_info.components["rest_internal"].libs = ["google_cloud_cpp_rest_internal"]
+            self.cpp_info.components["rest_internal"].set_property("pkg_config_name", "google_cloud_cpp_common")
+
+        # Only the libraries built for the selected components are declared
+        proto_components = self._proto_components()
+        for component in proto_components:
             self._add_proto_component(component)
 
-        self.cpp_info.components["grpc_utils"].requires = list(GRPC_UTILS_REQUIRED_PROTOS) + [
-            "common",
-            "abseil::absl_function_ref",
-            "abseil::absl_memory",
-            "abseil::absl_time",
-            "grpc::grpc++",
-            "grpc::_grpc",
-        ]
-        self.cpp_info.components["grpc_utils"].libs = ["google_cloud_cpp_grpc_utils"]
-        self.cpp_info.components["grpc_utils"].set_property("pkg_config_name", "google_cloud_cpp_grpc_utils")
-
-        for component in self._proto_components():
-            if component not in GRPC_UTILS_REQUIRED_PROTOS:
-                self._add_proto_component(component)
-
-        # Interface libraries for backwards compatibility
-        self.cpp_info.components["dialogflow_es_protos"].requires = ["cloud_dialogflow_v2_protos"]
-        self.cpp_info.components["logging_type_protos"].requires = ["logging_type_type_protos"]
-        self.cpp_info.components["speech_protos"].requires = ["cloud_speech_protos"]
-        self.cpp_info.components["texttospeech_protos"].requires = ["cloud_texttospeech_protos"]
-        self.cpp_info.components["trace_protos"].requires = [
-            "devtools_cloudtrace_v2_trace_protos",
-            "devtools_cloudtrace_v2_tracing_protos",
-        ]
-
+        if self._uses_grpc:
+            self.cpp_info.components["grpc_utils"].requires = sorted(self._GRPC_UTILS_REQUIRED_PROTOS) + [
+                "common",
+                "abseil::absl_function_ref",
+                "abseil::absl_memory",
+                "abseil::absl_time",
+                "grpc::grpc++",
+                "grpc::_grpc",
+            ]
+            self.cpp_info.components["grpc_utils"].libs = ["google_cloud_cpp_grpc_utils"]
+            self.cpp_info.components["grpc_utils"].set_property("pkg_config_name", "google_cloud_cpp_grpc_utils")
+
+        for alias, targets in self._PROTO_ALIASES.items():
+            if all(target in proto_components for target in targets):
+                self.cpp_info.components[alias].requires = targets
+
+        CUSTOM_EXTRA_REQUIRES = {
+            "pubsub": ["abseil::absl_flat_hash_map"],
+            "spanner": ["abseil::absl_fixed_array", "abseil::absl_numeric", "abseil::absl_strings", "abseil::absl_time"],
+        }
         for component in self._components():
-            # bigquery proto library predates the adoption of more consistent naming
-            if component == "bigquery":
-                self._add_proto_component("cloud_bigquery_protos")
-                self._add_grpc_component(component, "cloud_bigquery_protos")
-                continue
-            if component == "dialogflow_es":
-                self._add_proto_component("cloud_dialogflow_v2_protos")
-                self._add_grpc_component(component, "cloud_dialogflow_v2_protos")
-                continue
             # `storage` is the only component that does not depend on a matching `*_protos` library
-            protos = f"{component}_protos"
-            if component in self._REQUIRES_CUSTOM_DEPENDENCIES:
+            if component == "storage":
                 continue
-            self._add_grpc_component(component, protos)
-
-        self._add_grpc_component("bigquery", "cloud_bigquery_protos")
-        self._add_grpc_component("bigtable", "bigtable_protos")
-        self._add_grpc_component("iam", "iam_protos")
-        self._add_grpc_component("pubsub", "pubsub_protos", ["abseil::absl_flat_hash_map"])
-        self._add_grpc_component(
-            "spanner",
-            "spanner_protos",
-            ["abseil::absl_fixed_array", "abseil::absl_numeric", "abseil::absl_strings", "abseil::absl_time"],
-        )
-
-        self.cpp_info.components["storage"].requires = [
-            "rest_internal",
-            "common",
-            "nlohmann_json::nlohmann_json",
-            "abseil::absl_memory",
-            "abseil::absl_strings",
-            "abseil::absl_str_format",
-            "abseil::absl_time",
-            "abseil::absl_variant",
-            "crc32c::crc32c",
-            "libcurl::libcurl",
-            "openssl::ssl",
-            "openssl::crypto",
-            "zlib::zlib",
-        ]
-        self.cpp_info.components["storage"].libs = ["google_cloud_cpp_storage"]
-        self.cpp_info.components["storage"].set_property("pkg_config_name", "google_cloud_cpp_storage")
+            self._add_grpc_component(component, self._component_protos(component), CUSTOM_EXTRA_REQUIRES.get(component))
+
+        if "storage" in self._components():
+            self.cpp_info.components["storage"].requires = [
+                "rest_internal",
+                "common",
+                "nlohmann_json::nlohmann_json",
+                "abseil::absl_memory",
+                "abseil::absl_strings",
+                "abseil::absl_str_format",
+                "abseil::absl_time",
+                "abseil::absl_variant",
+                "crc32c::crc32c",
+                "libcurl::libcurl",
+                "openssl::ssl",
+                "openssl::crypto",
+                "zlib::zlib",
+            ]
+            self.cpp_info.components["storage"].libs = ["google_cloud_cpp_storage"]
+            self.cpp_info.components["storage"].set_property("pkg_config_name", "google_cloud_cpp_storage")
@@ -2,7 +2,10 @@
 
 import argparse
 import glob
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 """Extract google-cloud-cpp's component dependency info for use in Conan.
 
@@ -17,6 +20,11 @@ and convert them to CMake dependencies.
 
 The *.deps files themselves are generated (and committed to GitHub) from
 Bazel rules.
+
+The result is a `components-<version>.json` file, exported with the recipe and
+loaded only for the version being used:
+
+    python3 extract_dependencies.py -s <source folder> -o components-2.12.0.json
 """
 
 # Used in _generate_proto_requires(): common requirements
@@ -311,46 +319,67 @@ def _generate_proto_requires(depfile):
     return list(_PROTO_DEPS_COMMON_REQUIRES) + requires
 
 
-def main():
-    """Generate a python file representing the google-cloud-cpp proto deps."""
-    parser = argparse.ArgumentParser(description=(__doc__))
-    parser.add_argument(
-        "-s", "--source-folder", help="a directory where `google-cloud-cpp` source has been extracted"
-    )
-    args = parser.parse_args()
-    source_folder = vars(args)["source_folder"]
+def _load_deps_file(filename):
+    component = os.path.basename(filename).replace(".deps", "")
+    return _PROTO_DEPS_REPLACED_NAMES.get(component, component), _generate_proto_requires(filename)
+
+
+def extract_components(source_folder, jobs=None):
+    """Return the component tables: GA components, proto components and their dependencies."""
     deps_folder = os.path.join(source_folder, "external", "googleapis", "protodeps")
-    print("# Automatically generated by %s DO NOT EDIT" % __file__)
-    print("DEPENDENCIES = {")
     proto_components = _PROTO_BASE_COMPONENTS.copy()
     files = sorted(glob.glob(os.path.join(deps_folder, "*.deps")))
     experimental = set(_experimental_components(source_folder))
-    for filename in files:
-        component = os.path.basename(filename).replace(".deps", "")
-        component = _PROTO_DEPS_REPLACED_NAMES.get(component, component)
-        if component in experimental or component in _PROTO_DEPS_UNUSED:
-            # Experimental components have an associated *_protos, component.
-            # The Conan package only compiles the GA components, so we need
-            # to skip these.
-            continue
-        component = component + "_protos"
-        deps = _generate_proto_requires(filename)
-        proto_components.add(component)
-        proto_components.update(deps)
-        print(f'    "{component}": {sorted(deps)},')
+    dependencies = {}
+    # The *.deps files are independent, they are loaded concurrently
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for component, deps in executor.map(_load_deps_file, files, chunksize=16):
+            if component in experimental or component in _PROTO_DEPS_UNUSED:
+                # Experimental components have an associated *_protos, component.
+                # The Conan package only compiles the GA components, so we need
+                # to skip these.
+                continue
+            component = component + "_protos"
+            proto_components.add(component)
+            proto_components.update(deps)
+            dependencies[component] = sorted(deps)
     for component in sorted(_HARD_CODED_DEPENDENCIES.keys()):
         deps = _HARD_CODED_DEPENDENCIES[component]
         proto_components.add(component)
         proto_components.update(deps)
-        print(f'    "{component}": {sorted(deps)},')
-    print("}")
-    proto_components = proto_components - _PROTO_DEPS_COMMON_REQUIRES
-    names = ['"%s"' % c for c in proto_components]
-    joined = ",\n    ".join(sorted(names))
-    print(f"\nPROTO_COMPONENTS = {{\n    {joined}\n}}")
-    names = ['"%s"' % c for c in _components(source_folder)]
-    joined = ",\n    ".join(sorted(names))
-    print(f"\nCOMPONENTS = {{\n    {joined}\n}}")
+        dependencies[component] = sorted(deps)
+    return {
+        "components": sorted(_components(source_folder)),
+        "proto_components": sorted(proto_components - _PROTO_DEPS_COMMON_REQUIRES),
+        "dependencies": dependencies,
+    }
+
+
+def dump_components(tables, f):
+    """Write the component tables as JSON, with one line per list to keep the diffs readable."""
+    f.write("{\n")
+    f.write(f'"components": {json.dumps(tables["components"])},\n')
+    f.write(f'"proto_components": {json.dumps(tables["proto_components"])},\n')
+    f.write('"dependencies": {\n')
+    f.write(",\n".join(f"{json.dumps(k)}: {json.dumps(v)}" for k, v in tables["dependencies"].items()))
+    f.write("\n}\n}\n")
+
+
+def main():
+    """Generate a JSON file representing the google-cloud-cpp proto deps."""
+    parser = argparse.ArgumentParser(description=(__doc__), formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "-s", "--source-folder", help="a directory where `google-cloud-cpp` source has been extracted"
+    )
+    parser.add_argument("-o", "--output", help="the components-<version>.json file to write (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes loading the *.deps files")
+    args = parser.parse_args()
+    tables = extract_components(args.source_folder, jobs=args.jobs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            dump_components(tables, f)
+    else:
+        dump_components(tables, sys.stdout)
 
 
 if __name__ == "__main__":
@@ -35,4 +35,6 @@ class TestPackageConan(ConanFile):
             return
         for test in ["bigtable", "pubsub", "spanner", "speech", "storage"]:
             cmd = os.path.join(self.cpp.build.bindir, test)
+            if not any(os.path.isfile(cmd + ext) for ext in ["", ".exe"]):
+                continue  # component not built
             self.run(cmd, env="conanrun")
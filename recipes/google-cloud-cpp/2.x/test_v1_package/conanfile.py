@@ -18,4 +18,6 @@ class TestPackageConan(ConanFile):
             return
         for test in ["bigtable", "pubsub", "spanner", "speech", "storage"]:
             cmd = os.path.join("bin", test)
+            if not any(os.path.isfile(cmd + ext) for ext in ["", ".exe"]):
+                continue  # component not built
             self.run(cmd, run_environment=True)
@@ -1,5 +1,4 @@
 import os
-import functools
 import glob
 
 from conan import ConanFile
@@ -13,7 +12,7 @@ from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 
 
-from helpers import parse_proto_libraries
+from helpers import dump_proto_libraries, load_proto_libraries, parse_proto_libraries
 
 required_conan_version = ">=1.53.0"
 
@@ -37,6 +36,11 @@ class GoogleAPIS(ConanFile):
         "fPIC": True,
     }
 
+    # Components of the package (target, LIB or INTERFACE, dependencies), read by package_info()
+    _DEPS_FILE = os.path.join("res", "generated_targets.deps")
+    # Parsed proto libraries, computed once in build() and reused by package()
+    _INDEX_FILE = "proto_libraries.json"
+
     @property
     def _protobuf_version(self):
         return "3.21.9"
@@ -101,7 +105,6 @@ class GoogleAPIS(ConanFile):
         deps = CMakeDeps(self)
         deps.generate()
 
-    @functools.lru_cache(1)
     def _parse_proto_libraries(self):
         # Generate the libraries to build dynamically
         proto_libraries = []
@@ -116,23 +119,24 @@ class GoogleAPIS(ConanFile):
             proto_libraries += parse_proto_libraries(filename, self.source_folder, self.output.error)
 
         # Validate that all files exist and all dependencies are found
-        all_deps = [f"{it.qname}:{it.name}" for it in proto_libraries]
-        all_deps += ["protobuf::libprotobuf"]
+        all_deps = {f"{it.qname}:{it.name}" for it in proto_libraries}
+        all_deps.add("protobuf::libprotobuf")
         for it in proto_libraries:
             it.validate(self.source_folder, all_deps)
 
         # Mark the libraries we need recursively (C++ context)
         all_dict = {f"{it.qname}:{it.name}": it for it in proto_libraries}
 
-        def activate_library(proto_library):
+        pending = [it for it in proto_libraries if it.is_used]
+        visited = set()
+        while pending:
+            proto_library = pending.pop()
+            key = f"{proto_library.qname}:{proto_library.name}"
+            if key in visited:
+                continue
+            visited.add(key)
             proto_library.is_used = True
-            for it_dep in proto_library.deps:
-                if it_dep == "protobuf::libprotobuf":
-                    continue
-                activate_library(all_dict[it_dep])
-
-        for it in filter(lambda u: u.is_used, proto_libraries):
-            activate_library(it)
+            pending.extend(all_dict[it_dep] for it_dep in proto_library.deps if it_dep != "protobuf::libprotobuf")
 
         # Tweaks
         def deactivate_library(key):
@@ -188,6 +192,7 @@ class GoogleAPIS(ConanFile):
     def build(self):
         apply_conandata_patches(self)
         proto_libraries = self._parse_proto_libraries()
+        dump_proto_libraries(proto_libraries, os.path.join(self.build_folder, self._INDEX_FILE))
         # Use a separate file to host the generated code, which is generated in full each time.
         # This is safe to call multiple times, for example, if you need to invoke `conan build` more than
         # once.
@@ -230,8 +235,13 @@ class GoogleAPIS(ConanFile):
              dst=os.path.join(self.package_folder, "lib"),
              keep_path=False)
 
+        index_file = os.path.join(self.build_folder, self._INDEX_FILE)
+        if os.path.isfile(index_file):
+            proto_libraries = load_proto_libraries(index_file)
+        else:
+            proto_libraries = self._parse_proto_libraries()
         with open(os.path.join(self.package_folder, self._DEPS_FILE), "w", encoding="utf-8") as f:
-            for lib in filter(lambda u: u.is_used, self._parse_proto_libraries()):
+            for lib in filter(lambda u: u.is_used, proto_libraries):
                 interface = "LIB" if lib.srcs else "INTERFACE"
                 f.write(f"{lib.cmake_target} {interface} {','.join(lib.cmake_deps)}\n")
 
@@ -41,6 +41,26 @@ class _ProtoLibrary:
             indent=4,
         )
 
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "qname": self.qname,
+            "srcs": self.srcs,
+            "deps": sorted(self.deps),
+            "is_cc": self.is_cc,
+            "is_used": self.is_used,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        proto_library = cls(is_cc=data["is_cc"])
+        proto_library.name = data["name"]
+        proto_library.qname = data["qname"]
+        proto_library.srcs = data["srcs"]
+        proto_library.deps = set(data["deps"])
+        proto_library.is_used = data["is_used"]
+        return proto_library
+
     @property
     def cmake_target(self):
         qname = self.qname
@@ -201,3 +221,17 @@ def parse_proto_libraries(filename, source_folder, error):
                     action(line)
 
     return proto_libraries
+
+
+def dump_proto_libraries(proto_libraries, filename):
+    import json
+
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump([it.to_dict() for it in proto_libraries], f)
+
+
+def load_proto_libraries(filename):
+    import json
+
+    with open(filename, "r", encoding="utf-8") as f:
+        return [_ProtoLibrary.from_dict(it) for it in json.load(f)]
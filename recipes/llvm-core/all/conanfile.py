@@ -380,15 +380,35 @@ class LLVMCoreConan(ConanFile):
             if self.options.get_safe("with_zlib", False):
                 if not "z" in components["LLVMSupport"]:
                     components["LLVMSupport"].append("z")
-            components_path = os.path.join(self.package_folder, "lib", "components.json")
+            components_path = os.path.join(self.package_folder, "lib", "conan_components.json")
             with open(components_path, "w") as components_file:
-                json.dump(components, components_file, indent=4)
+                json.dump(self._components_table(components), components_file, separators=(",", ":"))
         else:
             suffixes = [".dylib", ".so"]
             for name in os.listdir(lib_path):
                 if not any(suffix in name for suffix in suffixes):
                     os.remove(os.path.join(lib_path, name))
 
+    def _components_table(self, components):
+        """cpp_info of each component, ready to be applied as is by package_info()"""
+        dependencies = ["ffi", "z", "iconv", "xml2"]
+        targets = {
+            "ffi": "libffi::libffi",
+            "z": "zlib::zlib",
+            "xml2": "libxml2::libxml2",
+        }
+        table = {}
+        for component, deps in components.items():
+            values = {
+                "properties": {"cmake_target_name": component},
+                "libs": [component],
+                "requires": [dep for dep in deps if dep.startswith("LLVM")]
+                            + [target for lib, target in targets.items() if lib in deps],
+                "system_libs": [dep for dep in deps if not dep.startswith("LLVM") and dep not in dependencies],
+            }
+            table[component] = {attribute: value for attribute, value in values.items() if value}
+        return table
+
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "LLVM")
 
@@ -400,46 +420,38 @@ class LLVMCoreConan(ConanFile):
                 self.cpp_info.system_libs = ["m"]
             return
 
-        components_path = os.path.join(self.package_folder, "lib", "components.json")
-        with open(components_path, "r") as components_file:
-            components = json.load(components_file)
-
-        dependencies = ["ffi", "z", "iconv", "xml2"]
-        targets = {
-            "ffi": "libffi::libffi",
-            "z": "zlib::zlib",
-            "xml2": "libxml2::libxml2",
-        }
-
-        for component, deps in components.items():
-            self.cpp_info.components[component].libs = [component]
-            self.cpp_info.components[component].requires.extend(dep for dep in deps if dep.startswith("LLVM"))
-
-            for lib, target in targets.items():
-                if lib in deps:
-                    self.cpp_info.components[component].requires.append(target)
-
-            self.cpp_info.components[component].system_libs = [
-                dep for dep in deps if not dep.startswith("LLVM") and dep not in dependencies
-            ]
-
-            self.cpp_info.components[component].set_property("cmake_target_name", component)
-            self.cpp_info.components[component].builddirs.append(self._module_subfolder)
-
-            self.cpp_info.components[component].names["cmake_find_package"] = component
-            self.cpp_info.components[component].names["cmake_find_package_multi"] = component
-            self.cpp_info.components[component].build_modules["cmake_find_package"].extend(
+        # The table written by package() only has to be applied
+        components_path = os.path.join(self.package_folder, "lib", "conan_components.json")
+        if os.path.isfile(components_path):
+            with open(components_path, "r") as components_file:
+                components = json.load(components_file)
+        else:
+            # Package made by a previous revision of the recipe, with the raw dependencies of each component
+            with open(os.path.join(self.package_folder, "lib", "components.json"), "r") as components_file:
+                components = self._components_table(json.load(components_file))
+
+        for name, values in components.items():
+            component = self.cpp_info.components[name]
+            for property_name, value in values.pop("properties").items():
+                component.set_property(property_name, value)
+            for attribute, value in values.items():
+                setattr(component, attribute, value)
+            component.builddirs.append(self._module_subfolder)
+
+            component.names["cmake_find_package"] = name
+            component.names["cmake_find_package_multi"] = name
+            component.build_modules["cmake_find_package"].extend(
                 [self._alias_module_file_rel_path, self._old_alias_module_file_rel_path]
             )
-            self.cpp_info.components[component].build_modules["cmake_find_package_multi"].extend(
+            component.build_modules["cmake_find_package_multi"].extend(
                 [self._alias_module_file_rel_path, self._old_alias_module_file_rel_path]
             )
 
             if self.options.use_llvm_cmake_files:
-                self.cpp_info.components[component].build_modules["cmake_find_package"].append(
+                component.build_modules["cmake_find_package"].append(
                     os.path.join(self._module_subfolder, "LLVMConfigInternal.cmake")
                 )
-                self.cpp_info.components[component].build_modules["cmake_find_package_multi"].append(
+                component.build_modules["cmake_find_package_multi"].append(
                     os.path.join(self._module_subfolder, "LLVMConfigInternal.cmake")
                 )
 
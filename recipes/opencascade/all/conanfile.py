@@ -579,8 +579,37 @@ class OpenCascadeConan(ConanFile):
 
         return modules
 
+    def _components_table(self, modules):
+        """cpp_info of each component, ready to be applied as is by package_info()"""
+        def _to_qualified_name(target):
+            return "occt_{}".format(target.lower())
+
+        defines = ["OCCT_STATIC_BUILD"] if self.settings.os == "Windows" and not self.options.shared else []
+        table = {}
+        for module, targets in modules.items():
+            # FIXME: in this "module" target we would like to model COMPONENTS for find_package() but
+            #       for the moment it generates in CMakeDeps some weird component name like
+            #       opencascade::FoundationClasses instead of FoundationClasses.
+            #       see https://github.com/conan-io/conan/issues/10258
+            table[_to_qualified_name(module)] = {
+                "properties": {"cmake_target_name": module},
+                "requires": [_to_qualified_name(target_lib) for target_lib in targets],
+            }
+            for target_lib, target_deps in targets.items():
+                values = {
+                    "properties": {"cmake_target_name": target_lib},
+                    "libs": [target_lib],
+                    "requires": [_to_qualified_name(internal) for internal in target_deps.get("internals", [])]
+                                + target_deps.get("externals", []),
+                    "system_libs": target_deps.get("system_libs", []),
+                    "frameworks": target_deps.get("frameworks", []),
+                    "defines": defines,
+                }
+                table[_to_qualified_name(target_lib)] = {attribute: value for attribute, value in values.items() if value}
+        return table
+
     def _create_modules_json_file(self, modules):
-        save(self._modules_helper_filepath, json.dumps(modules, indent=4))
+        save(self, self._modules_helper_filepath, json.dumps(self._components_table(modules), separators=(",", ":")))
 
     @property
     def _modules_helper_filepath(self):
@@ -589,53 +618,22 @@ class OpenCascadeConan(ConanFile):
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "OpenCASCADE")
 
-        def _to_qualified_name(target):
-            return "occt_{}".format(target.lower())
-
-        def _register_components(modules_dict):
-            for module, targets in modules_dict.items():
-                conan_component_module_name = _to_qualified_name(module)
-                # FIXME: in this "module" target we would like to model COMPONENTS for find_package() but
-                #       for the moment it generates in CMakeDeps some weird component name like
-                #       opencascade::FoundationClasses instead of FoundationClasses.
-                #       see https://github.com/conan-io/conan/issues/10258
-                self.cpp_info.components[conan_component_module_name].set_property(
-                    "cmake_target_name", module
-                )
-
-                for target_lib, target_deps in targets.items():
-                    conan_component_target_name = _to_qualified_name(target_lib)
-                    requires = [_to_qualified_name(internal) for internal in target_deps.get("internals", [])]
-                    requires += target_deps.get("externals", [])
-                    system_libs = target_deps.get("system_libs", [])
-                    frameworks = target_deps.get("frameworks", [])
-
-                    component = self.cpp_info.components[conan_component_target_name]
-                    component.set_property("cmake_target_name", target_lib)
-                    component.libs = [target_lib]
-                    component.requires = requires
-                    component.system_libs = system_libs
-                    component.frameworks = frameworks
-                    if self.settings.os == "Windows" and not self.options.shared:
-                        component.defines.append("OCCT_STATIC_BUILD")
-
-                    component.requires.append(conan_component_target_name)
-
-                    # TODO: to remove in conan v2 once cmake_find_package* generators removed
-                    component.names["cmake_find_package"] = target_lib
-                    component.names["cmake_find_package_multi"] = target_lib
-                    component.build_modules["cmake_find_package"] = [self._cmake_module_file_rel_path]
-                    component.build_modules["cmake_find_package_multi"] = [self._cmake_module_file_rel_path]
-
-                # TODO: to remove in conan v2 once cmake_find_package* generators removed
-                self.cpp_info.components[conan_component_module_name].names["cmake_find_package"] = module
-                self.cpp_info.components[conan_component_module_name].names[
-                    "cmake_find_package_multi"
-                ] = module
-
-        occt_modules_json_content = load(self._modules_helper_filepath)
-        occt_modules = json.loads(occt_modules_json_content)
-        _register_components(occt_modules)
+        # The table written by package() only has to be applied
+        components = json.loads(load(self, self._modules_helper_filepath))
+        for name, values in components.items():
+            component = self.cpp_info.components[name]
+            for property_name, value in values.pop("properties").items():
+                component.set_property(property_name, value)
+            for attribute, value in values.items():
+                setattr(component, attribute, value)
+
+            # TODO: to remove in conan v2 once cmake_find_package* generators removed
+            cmake_target = component.get_property("cmake_target_name")
+            component.names["cmake_find_package"] = cmake_target
+            component.names["cmake_find_package_multi"] = cmake_target
+            if "libs" in values:
+                component.build_modules["cmake_find_package"] = [self._cmake_module_file_rel_path]
+                component.build_modules["cmake_find_package_multi"] = [self._cmake_module_file_rel_path]
 
         # DRAWEXE executable is not created if static build
         if self.options.shared:
@@ -23,12 +23,83 @@ from conan.tools.scm import Version
 import configparser
 import glob
 import itertools
+import json
 import os
 import textwrap
 import shutil
 
 required_conan_version = ">=1.59.0"
 
+_MODULE_TREES = {}
+
+
+def _transitive_depends(tree):
+    """Replace the "depends" of each module of the tree by all its transitive dependencies
+
+    One walk with its own visited set per module: unlike memoizing partial closures, this stays correct
+    if the dependencies have a cycle. Shared by qt/5.x.x and qt/6.x.x, keep both copies identical.
+    """
+    closures = {}
+    for module in tree:
+        result = set()
+        pending = [module]
+        while pending:
+            for dependency in tree[pending.pop()]["depends"]:
+                if dependency not in result:
+                    result.add(dependency)
+                    pending.append(dependency)
+        result.discard(module)
+        closures[module] = result
+    for module in tree:
+        tree[module]["depends"] = sorted(closures[module])
+
+
+def _parse_module_tree(conf_path, known_modules):
+    """{module: {"status", "path", "depends"}} from a qtmodules.conf, the .gitmodules of qt5.git
+
+    "depends" lists all the transitive dependencies of the module.
+    """
+    config = configparser.ConfigParser()
+    config.read(conf_path)
+    tree = {}
+    assert config.sections(), f"no qtmodules.conf file {conf_path}"
+    for s in config.sections():
+        section = str(s)
+        assert section.startswith("submodule ")
+        assert section.count('"') == 2
+        modulename = section[section.find('"') + 1 : section.rfind('"')]
+        status = str(config.get(section, "status"))
+        if status not in ("obsolete", "ignore"):
+            tree[modulename] = {
+                "status": status,
+                "path": str(config.get(section, "path")),
+                "depends": [str(i) for i in config.get(section, "depends", fallback="").split()],
+            }
+
+    for m in tree:
+        assert (
+            m in ["qtbase", "qtqa", "qtrepotools"] or m in known_modules
+        ), "module %s is not present in recipe options : (%s)" % (m, ",".join(known_modules))
+
+    _transitive_depends(tree)
+    return tree
+
+
+def _dump_module_tree(tree):
+    return "{\n" + ",\n".join(f"{json.dumps(module)}: {json.dumps(info)}" for module, info in tree.items()) + "\n}\n"
+
+
+def _load_module_tree(recipe_folder, version, known_modules):
+    path = os.path.join(recipe_folder, f"qtmodules{version}.json")
+    if path not in _MODULE_TREES:
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                _MODULE_TREES[path] = json.load(f)
+        else:
+            # recipe used from its source folder, where export() didn't run
+            _MODULE_TREES[path] = _parse_module_tree(os.path.join(recipe_folder, f"qtmodules{version}.conf"), known_modules)
+    return _MODULE_TREES[path]
+
 
 class QtConan(ConanFile):
     _submodules = [
@@ -173,14 +244,22 @@ class QtConan(ConanFile):
 
     no_copy_source = True
 
+    _submodules_tree = None
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
 
+    @property
+    def _get_module_tree(self):
+        if self._submodules_tree is None:
+            self._submodules_tree = _load_module_tree(self.recipe_folder, self.version, self._submodules)
+        return self._submodules_tree
+
     def export(self):
-        copy(self, f"qtmodules{self.version}.conf",
-             src=self.recipe_folder,
-             dst=self.export_folder)
+        # only the precomputed tree is exported, it is read as is by every graph resolution
+        tree = _parse_module_tree(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"), self._submodules)
+        save(self, os.path.join(self.export_folder, f"qtmodules{self.version}.json"), _dump_module_tree(tree))
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -251,45 +330,15 @@ class QtConan(ConanFile):
         if self.options.multiconfiguration:
             self.settings.rm_safe("build_type")
 
-        config = configparser.ConfigParser()
-        config.read(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"))
-        submodules_tree = {}
-        assert config.sections(), f"no qtmodules.conf file for version {self.version}"
-        for s in config.sections():
-            section = str(s)
-            assert section.startswith("submodule ")
-            assert section.count('"') == 2
-            modulename = section[section.find('"') + 1 : section.rfind('"')]
-            status = str(config.get(section, "status"))
-            if status not in ("obsolete", "ignore"):
-                submodules_tree[modulename] = {
-                    "status": status,
-                    "path": str(config.get(section, "path")),
-                    "depends": [],
-                }
-                if config.has_option(section, "depends"):
-                    submodules_tree[modulename]["depends"] = [
-                        str(i) for i in config.get(section, "depends").split()
-                    ]
-
-        for m in submodules_tree:
-            assert (
-                m in ["qtbase", "qtqa", "qtrepotools"] or m in self._submodules
-            ), "module %s is not present in recipe options : (%s)" % (m, ",".join(self._submodules))
-
         for m in self._submodules:
-            if m not in submodules_tree:
+            if m not in self._get_module_tree:
                 delattr(self.options, m)
 
-        def _enablemodule(mod):
-            if mod != "qtbase":
-                setattr(self.options, mod, True)
-            for req in submodules_tree[mod]["depends"]:
-                _enablemodule(req)
-
         for module in self._submodules:
             if self.options.get_safe(module):
-                _enablemodule(module)
+                for req in self._get_module_tree[module]["depends"]:
+                    if req != "qtbase":
+                        setattr(self.options, req, True)
 
         for module in self._submodules:
             if module in self.options and not self.options.get_safe(module):
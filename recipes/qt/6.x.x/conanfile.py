@@ -1,6 +1,8 @@
 import configparser
 import glob
+import json
 import os
+import tarfile
 import textwrap
 
 from conan import ConanFile
@@ -8,7 +10,7 @@ from conan.tools.apple import is_apple_os
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.build import cross_building, check_min_cppstd, default_cppstd
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv, Environment
-from conan.tools.files import copy, get, replace_in_file, apply_conandata_patches, save, rm, rmdir, export_conandata_patches
+from conan.tools.files import copy, download, load, patch, replace_in_file, save, rm, rmdir, export_conandata_patches
 from conan.tools.gnu import PkgConfigDeps
 from conan.tools.microsoft import msvc_runtime_flag, is_msvc
 from conan.tools.scm import Version
@@ -16,6 +18,71 @@ from conan.errors import ConanInvalidConfiguration
 
 required_conan_version = ">=1.55.0"
 
+_MODULE_TREES = {}
+
+
+def _transitive_depends(tree):
+    """Replace the "depends" of each module of the tree by all its transitive dependencies
+
+    One walk with its own visited set per module: unlike memoizing partial closures, this stays correct
+    if the dependencies have a cycle. Shared by qt/5.x.x and qt/6.x.x, keep both copies identical.
+    """
+    closures = {}
+    for module in tree:
+        result = set()
+        pending = [module]
+        while pending:
+            for dependency in tree[pending.pop()]["depends"]:
+                if dependency not in result:
+                    result.add(dependency)
+                    pending.append(dependency)
+        result.discard(module)
+        closures[module] = result
+    for module in tree:
+        tree[module]["depends"] = sorted(closures[module])
+
+
+def _parse_module_tree(conf_path, known_modules):
+    """{module: {"status", "path", "depends"}} from a qtmodules.conf, the .gitmodules of qt5.git
+
+    "depends" lists all the transitive dependencies of the module.
+    """
+    config = configparser.ConfigParser()
+    config.read(conf_path)
+    assert config.sections(), f"no qtmodules.conf file {conf_path}"
+    tree = {}
+    for s in config.sections():
+        section = str(s)
+        assert section.startswith("submodule ")
+        assert section.count('"') == 2
+        modulename = section[section.find('"') + 1: section.rfind('"')]
+        status = str(config.get(section, "status"))
+        if status not in ["obsolete", "ignore", "additionalLibrary"]:
+            tree[modulename] = {"status": status, "path": str(config.get(section, "path")),
+                                "depends": [str(i) for i in config.get(section, "depends", fallback="").split()]}
+
+    for m in tree:
+        assert m in ["qtbase", "qtqa", "qtrepotools"] or m in known_modules, f"module {m} not in self._submodules"
+
+    _transitive_depends(tree)
+    return tree
+
+
+def _dump_module_tree(tree):
+    return "{\n" + ",\n".join(f"{json.dumps(module)}: {json.dumps(info)}" for module, info in tree.items()) + "\n}\n"
+
+
+def _load_module_tree(recipe_folder, version, known_modules):
+    path = os.path.join(recipe_folder, f"qtmodules{version}.json")
+    if path not in _MODULE_TREES:
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                _MODULE_TREES[path] = json.load(f)
+        else:
+            # recipe used from its source folder, where export() didn't run
+            _MODULE_TREES[path] = _parse_module_tree(os.path.join(recipe_folder, f"qtmodules{version}.conf"), known_modules)
+    return _MODULE_TREES[path]
+
 
 class QtConan(ConanFile):
     _submodules = ["qtsvg", "qtdeclarative", "qttools", "qttranslations", "qtdoc",
@@ -128,34 +195,17 @@ class QtConan(ConanFile):
 
     @property
     def _get_module_tree(self):
-        if self._submodules_tree:
-            return self._submodules_tree
-        config = configparser.ConfigParser()
-        config.read(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"))
-        self._submodules_tree = {}
-        assert config.sections(), f"no qtmodules.conf file for version {self.version}"
-        for s in config.sections():
-            section = str(s)
-            assert section.startswith("submodule ")
-            assert section.count('"') == 2
-            modulename = section[section.find('"') + 1: section.rfind('"')]
-            status = str(config.get(section, "status"))
-            if status not in ["obsolete", "ignore", "additionalLibrary"]:
-                self._submodules_tree[modulename] = {"status": status,
-                                "path": str(config.get(section, "path")), "depends": []}
-                if config.has_option(section, "depends"):
-                    self._submodules_tree[modulename]["depends"] = [str(i) for i in config.get(section, "depends").split()]
-
-        for m in self._submodules_tree:
-            assert m in ["qtbase", "qtqa", "qtrepotools"] or m in self._submodules, f"module {m} not in self._submodules"
-
+        if self._submodules_tree is None:
+            self._submodules_tree = _load_module_tree(self.recipe_folder, self.version, self._submodules)
         return self._submodules_tree
 
     def export_sources(self):
         export_conandata_patches(self)
 
     def export(self):
-        copy(self, f"qtmodules{self.version}.conf", self.recipe_folder, self.export_folder)
+        # only the precomputed tree is exported, it is read as is by every graph resolution
+        tree = _parse_module_tree(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"), self._submodules)
+        save(self, os.path.join(self.export_folder, f"qtmodules{self.version}.json"), _dump_module_tree(tree))
 
     def config_options(self):
         if self.settings.os not in ["Linux", "FreeBSD"]:
@@ -210,15 +260,11 @@ class QtConan(ConanFile):
         if self.options.multiconfiguration:
             del self.settings.build_type
 
-        def _enablemodule(mod):
-            if mod != "qtbase":
-                setattr(self.options, mod, True)
-            for req in self._get_module_tree[mod]["depends"]:
-                _enablemodule(req)
-
         for module in self._get_module_tree:
             if self.options.get_safe(module):
-                _enablemodule(module)
+                for req in self._get_module_tree[module]["depends"]:
+                    if req != "qtbase":
+                        setattr(self.options, req, True)
 
     def validate(self):
         if os.getenv('NOT_ON_C3I', '0') == '0':
@@ -599,39 +645,71 @@ class QtConan(ConanFile):
         if self.info.settings.os == "Android":
             del self.info.options.android_sdk
 
-    def source(self):
-        destination = self.source_folder
-        if self.info.settings.os == "Windows":
-            # Don't use os.path.join, or it removes the \\?\ prefix, which enables long paths
-            destination = rf"\\?\{self.source_folder}"
-        get(self, **self.conan_data["sources"][self.version],
-                  strip_root=True, destination=destination)
+    @property
+    def _source_archive(self):
+        return os.path.join(self.source_folder, f"qt-everywhere-src-{self.version}.tar.xz")
 
-        # patching in source method because of no_copy_source attribute
+    @property
+    def _qt_source_folder(self):
+        return os.path.join(self.build_folder, "qt-src")
 
-        apply_conandata_patches(self)
-        for f in ["renderer", os.path.join("renderer", "core"), os.path.join("renderer", "platform")]:
-            replace_in_file(self, os.path.join(self.source_folder, "qtwebengine", "src", "3rdparty", "chromium", "third_party", "blink", f, "BUILD.gn"),
-                                  "  if (enable_precompiled_headers) {\n    if (is_win) {",
-                                  "  if (enable_precompiled_headers) {\n    if (false) {"
-                                  )
+    def source(self):
+        # The source folder is shared by all the configurations, but the submodules to extract depend on
+        # the options: only the archive is downloaded here, _extract_sources() unpacks it in build()
+        download(self, **self.conan_data["sources"][self.version], filename=self._source_archive)
+
+    def _extract_sources(self):
+        enabled = sorted(module for module in self._get_module_tree if module == "qtbase" or self.options.get_safe(module))
+        disabled_paths = {self._get_module_tree[module]["path"] for module in self._get_module_tree if module not in enabled}
+        marker = os.path.join(self.build_folder, "qt-src-modules.txt")
+        if os.path.isfile(marker) and load(self, marker) == " ".join(enabled):
+            return  # keep the timestamps of the sources for incremental builds
+        rmdir(self, self._qt_source_folder)
+        destination = self._qt_source_folder
+        if self.settings.os == "Windows":
+            # Don't use os.path.join, or it removes the \\?\ prefix, which enables long paths
+            destination = rf"\\?\{self._qt_source_folder}"
+        extract_args = {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+        # the archive is streamed once, the members of the disabled submodules are skipped without being written
+        with tarfile.open(self._source_archive, "r|*") as tar:
+            for member in tar:
+                name = member.name.partition("/")[2]  # strip_root
+                if not name or name.split("/", 1)[0] in disabled_paths:
+                    continue
+                member.name = name
+                if member.islnk():
+                    member.linkname = member.linkname.partition("/")[2]
+                tar.extract(member, destination, **extract_args)
+
+        for patch_data in self.conan_data.get("patches", {}).get(self.version, []):
+            base_path = patch_data.get("base_path", "")
+            if base_path.split("/", 1)[0] not in disabled_paths:
+                patch(self, **dict(patch_data, patch_file=os.path.join(self.export_sources_folder, patch_data["patch_file"]),
+                                   base_path=os.path.join(self._qt_source_folder, base_path)))
+        if self.options.get_safe("qtwebengine"):
+            for f in ["renderer", os.path.join("renderer", "core"), os.path.join("renderer", "platform")]:
+                replace_in_file(self, os.path.join(self._qt_source_folder, "qtwebengine", "src", "3rdparty", "chromium", "third_party", "blink", f, "BUILD.gn"),
+                                      "  if (enable_precompiled_headers) {\n    if (is_win) {",
+                                      "  if (enable_precompiled_headers) {\n    if (false) {"
+                                      )
 
-        replace_in_file(self, os.path.join(self.source_folder, "qtbase", "cmake", "QtInternalTargets.cmake"),
+        replace_in_file(self, os.path.join(self._qt_source_folder, "qtbase", "cmake", "QtInternalTargets.cmake"),
                               "-Zc:wchar_t",
                               "-Zc:wchar_t -Zc:twoPhase-")
         for f in ["FindPostgreSQL.cmake"]:
-            file = os.path.join(self.source_folder, "qtbase", "cmake", f)
+            file = os.path.join(self._qt_source_folder, "qtbase", "cmake", f)
             if os.path.isfile(file):
                 os.remove(file)
 
         # workaround QTBUG-94356
-        replace_in_file(self, os.path.join(self.source_folder, "qtbase", "cmake", "FindWrapSystemZLIB.cmake"), '"-lz"', 'ZLIB::ZLIB')
-        replace_in_file(self, os.path.join(self.source_folder, "qtbase", "configure.cmake"),
+        replace_in_file(self, os.path.join(self._qt_source_folder, "qtbase", "cmake", "FindWrapSystemZLIB.cmake"), '"-lz"', 'ZLIB::ZLIB')
+        replace_in_file(self, os.path.join(self._qt_source_folder, "qtbase", "configure.cmake"),
             "set_property(TARGET ZLIB::ZLIB PROPERTY IMPORTED_GLOBAL TRUE)",
             "")
         if Version(self.version) <= "6.4.0":
             # use official variable name https://cmake.org/cmake/help/latest/module/FindFontconfig.html
-            replace_in_file(self, os.path.join(self.source_folder, "qtbase", "src", "gui", "configure.cmake"), "FONTCONFIG_FOUND", "Fontconfig_FOUND")
+            replace_in_file(self, os.path.join(self._qt_source_folder, "qtbase", "src", "gui", "configure.cmake"), "FONTCONFIG_FOUND", "Fontconfig_FOUND")
+        save(self, marker, " ".join(enabled))
 
     def _xplatform(self):
         if self.settings.os == "Linux":
@@ -735,8 +813,9 @@ class QtConan(ConanFile):
         if self.settings.os == "Macos":
             save(self, ".qmake.stash" , "")
             save(self, ".qmake.super" , "")
+        self._extract_sources()
         cmake = CMake(self)
-        cmake.configure()
+        cmake.configure(build_script_folder=self._qt_source_folder)
         cmake.build()
 
     @property
@@ -756,10 +835,7 @@ class QtConan(ConanFile):
             save(self, ".qmake.super" , "")
         cmake = CMake(self)
         cmake.install()
-        copy(self, "*LICENSE*", self.source_folder, os.path.join(self.package_folder, "licenses"))
-        for module in self._get_module_tree:
-            if module != "qtbase" and not self.options.get_safe(module):
-                rmdir(self, os.path.join(self.package_folder, "licenses", module))
+        copy(self, "*LICENSE*", self._qt_source_folder, os.path.join(self.package_folder, "licenses"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         for mask in ["Find*.cmake", "*Config.cmake", "*-config.cmake"]:
             rm(self, mask, self.package_folder, recursive=True)
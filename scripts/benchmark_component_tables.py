@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of package_info() for the recipes applying a precomputed component table
+
+abseil, llvm-core and opencascade describe their components in a JSON file written by package().
+This script compares their package_info() as of a git REF with the working tree, on a consumer
+graph containing the three of them. The package folders are the synthetic packages of
+benchmark_recipes.py: the same component data, sized like the real packages, written in the format
+of each revision (the layout of REF, and the table of the current `_components_table()`).
+
+REF defaults to the revision before the component tables were introduced, found in the git history.
+
+    python3 scripts/benchmark_component_tables.py --repeat 20
+    python3 scripts/benchmark_component_tables.py --ref origin/master
+"""
+
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmark_recipes import PROFILES, benchmark, latest_versions
+from index_utils import extract_at, recipes_dir, root_dir
+
+RECIPES = ["abseil", "llvm-core", "opencascade"]
+
+
+def _revision_before_tables():
+    """Parent of the first commit defining `_components_table()` in one of the recipes, None if not found"""
+    paths = [f"recipes/{name}" for name in RECIPES]
+    try:
+        commits = subprocess.check_output(["git", "log", "--reverse", "--format=%H", "-S", "def _components_table",
+                                           "--", *paths], cwd=root_dir, text=True, stderr=subprocess.DEVNULL).split()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commits[0]}~1" if commits else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare package_info() of component-heavy recipes with a git revision.")
+    parser.add_argument("--ref", help="git revision to compare with (default: the one before the component tables)")
+    parser.add_argument("--profile", default="linux-gcc", choices=sorted(PROFILES))
+    parser.add_argument("--repeat", type=int, default=10, help="warm runs after the first one")
+    args = parser.parse_args()
+    ref = args.ref or _revision_before_tables()
+    if not ref:
+        parser.error("the revision before the component tables isn't in the git history, give it with --ref")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp:
+        for name, version, folder in latest_versions(RECIPES):
+            revisions = {}
+            previous_path = extract_at(ref, name, folder, os.path.join(temp, "ref"))
+            if previous_path:
+                revisions["ref"] = previous_path
+            revisions["current"] = recipes_dir / name / folder / "conanfile.py"
+
+            for revision, conanfile_path in revisions.items():
+                # All the revisions run in this process: don't let one pay for the garbage of another
+                gc.collect()
+                entry = benchmark(name, version, folder, args.profile, repeat=args.repeat,
+                                  conanfile_path=conanfile_path)
+                results[name, revision] = entry
+
+    print(f"{'recipe':<30} {'revision':<8} {'first ms':>9} {'median ms':>10} {'peak KiB':>9}")
+    for (name, revision), entry in results.items():
+        phase = entry["phases"].get("package_info")
+        if entry["status"] != "ok" or not phase:
+            print(f"{name:<30} {revision:<8} {entry['status']}: {entry['message']}")
+            continue
+        print(f"{name:<30} {revision:<8} {phase['first_ms']:>9.2f} {phase['median_ms']:>10.2f} {phase['peak_kib']:>9.0f}")
+    # The graph totals only count the recipes which ran in both revisions
+    compared = [name for name in RECIPES
+                if all(results.get((name, revision), {}).get("status") == "ok" for revision in ("ref", "current"))]
+    for revision in ("ref", "current"):
+        phases = [results[name, revision]["phases"]["package_info"] for name in compared]
+        skipped = sorted(set(RECIPES) - set(compared))
+        print(f"{'graph':<30} {revision:<8} {sum(p['first_ms'] for p in phases):>9.2f} "
+              f"{sum(p['median_ms'] for p in phases):>10.2f}"
+              + (f"  (without {', '.join(skipped)})" if skipped else ""))
+    # Errors of REF are reported, but only the working tree can be fixed
+    if any(entry["status"] != "ok" for (_, revision), entry in results.items() if revision == "current"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
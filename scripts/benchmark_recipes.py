@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""Benchmark the methods of the recipes that run during every graph resolution and install
+
+`config_options()`/`configure()`, `requirements()` and `package_info()` run for every consumer of a
+package, even when the binary is already built. This script loads each recipe with Conan's loader and
+runs those methods against a built-in profile, with the dependencies mocked, recording their wall
+time and the peak memory they allocate.
+
+`package_info()` runs in an empty package folder, except for the recipes reading files of their
+package (abseil, boost, llvm-core, opencascade, qt): they get a synthetic package, sized like the
+real one, in the layout their `package()` writes. `--package-folder` gives a real package instead.
+
+The first run of each recipe is the one a `conan install` pays (module import and caches included),
+the median of the next runs shows the cost of every further instance. Recipes are ranked by the
+first run. A previous JSON report can be given as a baseline to spot regressions.
+
+    python3 scripts/benchmark_recipes.py boost qt opencv --repeat 10
+    python3 scripts/benchmark_recipes.py --all --profile linux-gcc --format json > report.json
+    python3 scripts/benchmark_recipes.py --all --baseline report.json
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from conans.client.conf import get_default_settings_yml
+from conans.client.graph.python_requires import ConanPythonRequire
+from conans.client.loader import ConanFileLoader
+from conans.client.output import ConanOutput
+from conans.errors import ConanInvalidConfiguration
+from conans.model.build_info import CppInfo, CppInfoDefaultValues
+from conans.model.env_info import EnvInfo
+from conans.model.new_build_info import fill_old_cppinfo
+from conans.model.profile import Profile
+from conans.model.ref import ConanFileReference
+from conans.model.settings import Settings
+from conans.model.user_info import UserInfo
+from conan.tools.microsoft import is_msvc
+
+from index_utils import COMMON_MODULES, recipes_dir, version_key
+
+PROFILES = {
+    "linux-gcc": {"os": "Linux", "arch": "x86_64", "compiler": "gcc", "compiler.version": "11",
+                  "compiler.libcxx": "libstdc++11", "compiler.cppstd": "gnu17", "build_type": "Release"},
+    "windows-msvc": {"os": "Windows", "arch": "x86_64", "compiler": "msvc", "compiler.version": "193",
+                     "compiler.runtime": "dynamic", "compiler.runtime_type": "Release", "compiler.cppstd": "14",
+                     "build_type": "Release"},
+    "macos-clang": {"os": "Macos", "arch": "armv8", "compiler": "apple-clang", "compiler.version": "14",
+                    "compiler.libcxx": "libc++", "compiler.cppstd": "gnu17", "build_type": "Release"},
+}
+PHASES = ["configure", "requirements", "package_info"]
+
+_profiles = {}
+
+
+def _profile(name):
+    if name not in _profiles:
+        profile = Profile()
+        profile.settings.update(PROFILES[name])
+        profile.process_settings(types.SimpleNamespace(settings=Settings.loads(get_default_settings_yml())))
+        _profiles[name] = profile
+    return _profiles[name]
+
+
+class _MockDependency:
+    def __init__(self, ref, settings, package_folder):
+        self.ref = ref
+        self.pref = mock.MagicMock(ref=ref)
+        self.settings = settings
+        self.options = mock.MagicMock()
+        self.cpp_info = mock.MagicMock()
+        self.conf_info = mock.MagicMock()
+        self.buildenv_info = mock.MagicMock()
+        self.runenv_info = mock.MagicMock()
+        self.package_folder = package_folder
+        self.recipe_folder = package_folder
+
+
+class _MockDependencies:
+    """Stands for `self.dependencies`: the recipe's requirements, resolved to their declared version"""
+
+    def __init__(self, conanfile, package_folder):
+        self._settings = conanfile.settings
+        self._package_folder = package_folder
+        self._dependencies = {}
+        for name, requirement in conanfile.requires.items():
+            self._dependencies[name] = (requirement, self._dependency(requirement.ref))
+
+    def _dependency(self, ref):
+        version = str(ref.version).strip("[]").split(",")[0].split()[0].lstrip("<>=~^")
+        ref = ConanFileReference(ref.name, version or "1.0", ref.user, ref.channel, validate=False)
+        return _MockDependency(ref, self._settings, self._package_folder)
+
+    def __getitem__(self, name):
+        if name not in self._dependencies:
+            return self._dependency(ConanFileReference(name, "1.0", None, None, validate=False))
+        return self._dependencies[name][1]
+
+    def get(self, name, *args, **kwargs):
+        return self[name]
+
+    def __contains__(self, name):
+        return name in self._dependencies
+
+    def items(self):
+        return [(requirement, dependency) for requirement, dependency in self._dependencies.values()]
+
+    def values(self):
+        return [dependency for _, dependency in self._dependencies.values()]
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    host = direct_host = build = direct_build = test = property(lambda self: self)
+
+
+def _load(loader, conanfile_path, reference, profile_name):
+    return loader.load_conanfile(str(conanfile_path), _profile(profile_name), ConanFileReference.loads(reference))
+
+
+def _run_phase(conanfile, phase, package_folder):
+    if phase == "configure":
+        conanfile.config_options()
+        conanfile.configure()
+        conanfile.settings.validate()
+        if hasattr(conanfile, "layout"):
+            conanfile.layout()
+    elif phase == "requirements":
+        if hasattr(conanfile, "requirements"):
+            conanfile.requirements()
+    else:
+        conanfile.folders.set_base_package(package_folder)
+        default_values = CppInfoDefaultValues() if hasattr(conanfile, "layout") else None
+        conanfile.cpp_info = CppInfo(conanfile.name, package_folder, default_values=default_values)
+        conanfile.env_info = EnvInfo()
+        conanfile.user_info = UserInfo()
+        if hasattr(conanfile, "layout"):
+            # Like Conan's installer: the folders declared by the layout are the defaults of cpp_info
+            fill_old_cppinfo(conanfile.cpp.package, conanfile.cpp_info)
+        conanfile._conan_dependencies = _MockDependencies(conanfile, package_folder)
+        current = os.getcwd()
+        os.chdir(package_folder)
+        try:
+            conanfile.package_info()
+        finally:
+            os.chdir(current)
+
+
+def _write_file(package_folder, relative_path, content=""):
+    path = Path(package_folder) / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _abseil_components(rng):
+    components = {}
+    for i in range(180):
+        target = f"target_{i}"
+        components[f"absl_{target}"] = {
+            "cmake_target": target,
+            "libs": [f"absl_{target}"] if i % 4 else [],
+            "requires": sorted({f"absl_target_{rng.randrange(i)}" for _ in range(rng.randint(0, 6))}) if i else [],
+            "system_libs": ["pthread", "m"] if i % 10 == 0 else [],
+            "defines": ["ABSL_CONSUME_DLL"] if i % 30 == 0 else [],
+        }
+    return components
+
+
+def _llvm_components(rng):
+    components = {}
+    for i in range(190):
+        deps = sorted({f"LLVMComponent{rng.randrange(i)}" for _ in range(rng.randint(1, 8))}) if i else []
+        deps += [dep for dep in ["z", "ffi", "m", "pthread", "rt", "dl"] if rng.random() < 0.1]
+        components[f"LLVMComponent{i}"] = deps
+    return components
+
+
+def _occt_modules(rng):
+    modules = {}
+    toolkits = []
+    for module in ["FoundationClasses", "ModelingData", "ModelingAlgorithms", "Visualization",
+                   "ApplicationFramework", "DataExchange", "Draw"]:
+        modules[module] = {}
+        for _ in range(9):
+            name = f"TK{len(toolkits)}"
+            deps = {"internals": sorted({rng.choice(toolkits) for _ in range(rng.randint(1, 8))}) if toolkits else []}
+            if rng.random() < 0.3:
+                deps["externals"] = ["freetype::freetype"]
+            if rng.random() < 0.2:
+                deps["system_libs"] = ["pthread", "rt"]
+            modules[module][name] = deps
+            toolkits.append(name)
+    return modules
+
+
+# Synthetic components of the recipes describing them in a JSON file: the file package() wrote before
+# precomputed component tables, and the one the table is written to when the recipe has `_components_table()`
+COMPONENT_FILES = {
+    "abseil": (_abseil_components, os.path.join("lib", "components.json"),
+               os.path.join("lib", "conan_components.json")),
+    "llvm-core": (_llvm_components, os.path.join("lib", "components.json"),
+                  os.path.join("lib", "conan_components.json")),
+    "opencascade": (_occt_modules, os.path.join("lib", "occt_modules.json"), os.path.join("lib", "occt_modules.json")),
+}
+
+
+def _components_package(conanfile, package_folder):
+    generate, legacy_path, table_path = COMPONENT_FILES[conanfile.name]
+    components = generate(random.Random(0))  # the same components for every revision of a recipe
+    if hasattr(conanfile, "_components_table"):
+        _write_file(package_folder, table_path,
+                    json.dumps(conanfile._components_table(components), separators=(",", ":")))
+    else:
+        _write_file(package_folder, legacy_path, json.dumps(components, indent=4))
+
+
+def _boost_package(conanfile, package_folder):
+    """The libraries package_info() expects in lib/ (the default `system` layout, no python)"""
+    if conanfile.options.header_only:
+        return
+    msvc = is_msvc(conanfile)
+    for module, libs in conanfile._dependencies["libs"].items():
+        if any(conanfile.options.get_safe(f"without_{m}", False) for m in conanfile._all_dependent_modules(module)):
+            continue
+        for lib in libs:
+            if conanfile.settings.os == "Windows":
+                if lib in ("boost_stacktrace_addr2line", "boost_stacktrace_backtrace", "boost_stacktrace_basic"):
+                    continue
+            elif lib in ("boost_stacktrace_windbg", "boost_stacktrace_windbg_cached"):
+                continue
+            if lib == "boost_stacktrace_addr2line" and not conanfile._stacktrace_addr2line_available:
+                continue
+            if lib == "boost_stacktrace_backtrace" and conanfile.options.get_safe("with_stacktrace_backtrace") == False:
+                continue
+            if "_numa" in lib and not conanfile.options.get_safe("numa"):
+                continue
+            if msvc:
+                static = not conanfile._shared or lib in conanfile._dependencies["static_only"]
+                _write_file(package_folder, os.path.join("lib", ("lib" if static else "") + lib + ".lib"))
+            else:
+                extension = ".a" if not conanfile._shared else ".dylib" if conanfile.settings.os == "Macos" else ".so"
+                _write_file(package_folder, os.path.join("lib", f"lib{lib}{extension}"))
+
+
+def _qt_package(conanfile, package_folder):
+    """lib/cmake with a folder per Qt module, like the CMake config files installed by Qt"""
+    major = str(conanfile.version).split(".")[0]
+    _write_file(package_folder, os.path.join("lib", "cmake", f"Qt{major}Core", f"Qt{major}CoreMacros.cmake"))
+    if major == "5":
+        _write_file(package_folder, os.path.join("lib", "cmake", "Qt5Core", "Qt5CoreConfigExtrasMkspecDir.cmake"),
+                    'set(_qt5_corelib_extra_includes "${_qt5Core_install_prefix}/bin/archdatadir/mkspecs/linux-g++")\n')
+        os.makedirs(os.path.join(package_folder, "bin", "archdatadir", "mkspecs", "linux-g++"), exist_ok=True)
+    else:
+        _write_file(package_folder, os.path.join("lib", "cmake", "Qt6", "QtPublicCMakeHelpers.cmake"))
+    # The modules are the components the recipe declares, plugins are installed in the folders of their module
+    _run_phase(conanfile, "package_info", package_folder)
+    for component in conanfile.cpp_info.components:
+        if component.startswith("qt") and "Plugin" not in component:
+            os.makedirs(os.path.join(package_folder, "lib", "cmake", f"Qt{major}{component[2:]}"), exist_ok=True)
+
+
+SYNTHETIC_PACKAGES = {
+    "abseil": _components_package,
+    "boost": _boost_package,
+    "llvm-core": _components_package,
+    "opencascade": _components_package,
+    "qt": _qt_package,
+}
+
+
+def synthetic_package(name, conanfile_path, reference, profile_name, package_folder):
+    """Write the synthetic package of a recipe into `package_folder`, False if it has none
+
+    The recipe is loaded with its own loader: the runs benchmarked afterwards still import it cold.
+    """
+    if name not in SYNTHETIC_PACKAGES:
+        return False
+    loader = ConanFileLoader(None, ConanOutput(io.StringIO()), ConanPythonRequire(None, None))
+    conanfile = _load(loader, conanfile_path, reference, profile_name)
+    for phase in ["configure", "requirements"]:
+        _run_phase(conanfile, phase, package_folder)
+    SYNTHETIC_PACKAGES[name](conanfile, package_folder)
+    return True
+
+
+def benchmark(name, version, folder, profile_name, repeat=5, package_folder=None, conanfile_path=None):
+    """Timings (ms) and peak allocations (KiB) of the methods of one recipe, as a report entry
+
+    `package_info()` runs in the synthetic package of the recipe, if any (see SYNTHETIC_PACKAGES), or
+    an empty folder, unless `package_folder` (e.g. the package of a previous `conan create`) is given.
+    `conanfile_path` overrides the recipe of the index, e.g. with another revision of it.
+    """
+    for module in COMMON_MODULES:
+        importlib.import_module(module)
+    _profile(profile_name)
+    entry = {"name": name, "version": version, "folder": folder, "profile": profile_name,
+             "status": "ok", "message": None, "load_ms": None, "phases": {}}
+    conanfile_path = conanfile_path or recipes_dir / name / folder / "conanfile.py"
+    reference = f"{name}/{version}"
+    loader = ConanFileLoader(None, ConanOutput(io.StringIO()), ConanPythonRequire(None, None))
+    with tempfile.TemporaryDirectory() as synthetic_folder, \
+            contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        if not package_folder:
+            package_folder = synthetic_folder
+            try:
+                synthetic_package(name, conanfile_path, reference, profile_name, synthetic_folder)
+            except Exception:
+                pass  # the benchmarked runs report the error of the phase that fails
+        timings = {phase: [] for phase in PHASES}
+        peaks = {}
+        # One cold run, `repeat` warm runs, then one run under tracemalloc (which slows everything down)
+        for run in range(repeat + 2):
+            traced = run == repeat + 1
+            try:
+                start = time.perf_counter()
+                conanfile = _load(loader, conanfile_path, reference, profile_name)
+                if run == 0:
+                    entry["load_ms"] = (time.perf_counter() - start) * 1000
+            except Exception as e:
+                entry["status"], entry["message"] = "error", f"load: {str(e).strip().splitlines()[-1]}"
+                break
+            if traced:
+                tracemalloc.start()
+            try:
+                for phase in PHASES:
+                    if traced:
+                        if hasattr(tracemalloc, "reset_peak"):
+                            tracemalloc.reset_peak()
+                        else:  # Python < 3.9
+                            tracemalloc.stop()
+                            tracemalloc.start()
+                        before = tracemalloc.get_traced_memory()[0]
+                    start = time.perf_counter()
+                    try:
+                        _run_phase(conanfile, phase, package_folder)
+                    except ConanInvalidConfiguration as e:
+                        entry["status"], entry["message"] = "invalid", f"{phase}: {e}"
+                        break
+                    except Exception as e:
+                        entry["status"], entry["message"] = "error", f"{phase}: {type(e).__name__}: {e}"
+                        break
+                    if traced:
+                        peaks[phase] = (tracemalloc.get_traced_memory()[1] - before) / 1024
+                    else:
+                        timings[phase].append((time.perf_counter() - start) * 1000)
+            finally:
+                if traced:
+                    tracemalloc.stop()
+            if entry["status"] != "ok":
+                break
+    for phase in PHASES:
+        if timings[phase]:
+            entry["phases"][phase] = {"first_ms": timings[phase][0],
+                                      "median_ms": statistics.median(timings[phase][1:] or timings[phase]),
+                                      "peak_kib": peaks.get(phase)}
+    entry["total_ms"] = (entry["load_ms"] or 0) + sum(phase["first_ms"] for phase in entry["phases"].values())
+    return entry
+
+
+def _benchmark(args):
+    return benchmark(*args)
+
+
+def latest_versions(names):
+    """(name, version, folder) of the newest version of each folder of the recipes"""
+    targets = []
+    for name in names:
+        with open(recipes_dir / name / "config.yml", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+        folders = {}
+        for version, info in (config.get("versions") or {}).items():
+            folders.setdefault(str(info["folder"]), []).append(str(version))
+        for folder, versions in sorted(folders.items()):
+            targets.append((name, max(versions, key=version_key), folder))
+    return targets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark configure(), requirements() and package_info() of recipes.")
+    parser.add_argument("names", nargs="*", help="recipes to benchmark")
+    parser.add_argument("--all", action="store_true", help="benchmark every recipe")
+    parser.add_argument("--profile", dest="profiles", action="append", choices=sorted(PROFILES),
+                        help="profiles to use (repeatable, default: linux-gcc)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm runs after the first one")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of processes (more than one makes the timings noisier)")
+    parser.add_argument("--package-folder", action="append", default=[], metavar="NAME=PATH",
+                        help="existing package folder to run package_info() of recipe NAME in (repeatable)")
+    parser.add_argument("--baseline", help="previous JSON report to compare the first-run totals with")
+    parser.add_argument("--top", type=int, default=None, help="only show the N most expensive recipes")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    args = parser.parse_args()
+
+    if args.all:
+        names = sorted(path.parent.name for path in recipes_dir.glob("*/config.yml"))
+    elif args.names:
+        names = args.names
+    else:
+        parser.error("give the recipes to benchmark, or --all")
+    missing = [name for name in names if not (recipes_dir / name / "config.yml").is_file()]
+    if missing:
+        parser.error(f"unknown recipes: {', '.join(missing)}")
+
+    package_folders = dict(value.split("=", 1) for value in args.package_folder)
+    jobs = [(name, version, folder, profile, args.repeat, package_folders.get(name))
+            for name, version, folder in latest_versions(names) for profile in args.profiles or ["linux-gcc"]]
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        report = list(executor.map(_benchmark, jobs))
+    report.sort(key=lambda entry: entry["total_ms"], reverse=True)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = {(entry["name"], entry["version"], entry["profile"]): entry for entry in json.load(f)}
+    for entry in report:
+        previous = baseline.get((entry["name"], entry["version"], entry["profile"]))
+        if previous and previous["status"] == "ok" and entry["status"] == "ok" and previous["total_ms"]:
+            entry["baseline_ms"] = previous["total_ms"]
+
+    if args.format == "json":
+        print(json.dumps(report, indent=1))
+    else:
+        print(f"{'rank':>4} {'recipe':<40} {'profile':<13} {'total':>9} {'load':>8} "
+              + " ".join(f"{phase:>21}" for phase in PHASES) + "  (ms first/median, KiB peak)")
+        for rank, entry in enumerate(report[:args.top], start=1):
+            line = f"{rank:>4} {entry['name'] + '/' + entry['version']:<40} {entry['profile']:<13} " \
+                   f"{entry['total_ms']:>9.1f} {entry['load_ms'] or 0:>8.1f} "
+            line += " ".join(f"{phase['first_ms']:>7.1f}/{phase['median_ms']:>6.1f}/{phase['peak_kib'] or 0:>6.0f}"
+                             if phase else " " * 21 for phase in (entry["phases"].get(p) for p in PHASES))
+            if "baseline_ms" in entry:
+                line += f"  {(entry['total_ms'] / entry['baseline_ms'] - 1) * 100:+.0f}%"
+            if entry["status"] != "ok":
+                line += f"  {entry['status']}: {entry['message']}"
+            print(line)
+    counts = {status: sum(1 for entry in report if entry["status"] == status) for status in ["ok", "invalid", "error"]}
+    print(f"{len(report)} benchmarks: {counts['ok']} ok, {counts['invalid']} invalid configurations, "
+          f"{counts['error']} errors", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Check that the patches listed in conandata.yml still apply to their sources
+
+Each source archive is downloaded once into a download cache (see prefetch_sources.py) and extracted
+once into a folder keyed by its sha256. Every version is then checked in parallel: its extracted tree
+is cloned with hard links, and the `patches[version]` entries are applied in order like
+`apply_conandata_patches` does (patch-ng, `base_path` relative to the source folder, no fuzz).
+
+Sources are assumed to be extracted like `get(..., strip_root=True)` into the source folder, which is
+what almost every recipe does; versions whose sources aren't a single archive are skipped.
+
+    python3 scripts/check_patches.py zlib openssl
+    python3 scripts/check_patches.py --all --jobs 16 --format json
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import patch_ng
+
+from index_utils import recipes_dir, root_dir
+from prefetch_sources import DEFAULT_CACHE, Prefetcher, load_yaml, source_files
+
+DEFAULT_EXTRACT_CACHE = root_dir / ".cache" / "extracted_sources"
+
+
+def version_checks(names, versions=None):
+    """One check per (recipe, version) having patches: dicts with the folder, sha256, urls and patches"""
+    checks = []
+    for name in names:
+        config = load_yaml(recipes_dir / name / "config.yml")
+        conandatas = {}
+        for version, info in (config.get("versions") or {}).items():
+            version = str(version)
+            if versions and version not in versions:
+                continue
+            folder = recipes_dir / name / str(info["folder"])
+            if folder not in conandatas:
+                conandata_path = folder / "conandata.yml"
+                conandatas[folder] = load_yaml(conandata_path) if conandata_path.is_file() else {}
+            conandata = conandatas[folder]
+            patches = (conandata.get("patches") or {}).get(version)
+            if not patches:
+                continue
+            files = source_files((conandata.get("sources") or {}).get(version))
+            check = {"name": name, "version": version, "folder": str(folder), "patches": patches,
+                     "sha256": None, "urls": []}
+            if len(files) == 1 and files[0][1]:
+                check["urls"], check["sha256"] = files[0][0], files[0][1].lower()
+            checks.append(check)
+    return checks
+
+
+def extract(archive, sha256, extract_cache):
+    """Extract `archive` once into `<extract_cache>/<sha256>`, returns the source root (strip_root)
+
+    Versions sharing an archive may be checked concurrently: each worker extracts into its own
+    temporary folder, renamed into place when complete. The first one wins, the others drop theirs.
+    """
+    destination = Path(extract_cache) / sha256
+    if not (destination / ".complete").is_file():
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp = Path(tempfile.mkdtemp(prefix=f".{sha256}.", dir=destination.parent))
+        try:
+            if zipfile.is_zipfile(archive):
+                with zipfile.ZipFile(archive) as z:
+                    z.extractall(temp)
+            else:
+                with tarfile.open(archive) as tar:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(temp, filter="data")
+                    else:
+                        tar.extractall(temp)
+            (temp / ".complete").touch()
+            while True:
+                try:
+                    os.replace(temp, destination)
+                    break
+                except OSError:
+                    if (destination / ".complete").is_file():
+                        break  # extracted by another worker meanwhile
+                    # Incomplete folder left by an older version of this script: move it away and retry
+                    stale = Path(tempfile.mkdtemp(prefix=f".{sha256}.", dir=destination.parent))
+                    try:
+                        os.replace(destination, stale / sha256)
+                    except FileNotFoundError:
+                        pass  # moved away by another worker
+                    shutil.rmtree(stale)
+        finally:
+            shutil.rmtree(temp, ignore_errors=True)
+    entries = [entry for entry in destination.iterdir() if entry.name != ".complete"]
+    if len(entries) == 1 and entries[0].is_dir():
+        return entries[0]
+    return destination
+
+
+class _Messages(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def check_version(check, download_cache, extract_cache):
+    """Apply the patches of one version, returns the list of failures"""
+    archive = Path(download_cache) / "s" / check["sha256"]
+    try:
+        source_root = extract(archive, check["sha256"], extract_cache)
+    except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+        return [{"patch_file": None, "base_path": None, "message": f"can't extract {archive}: {e}"}]
+
+    failures = []
+    handler = _Messages()
+    logger = logging.getLogger("patch_ng")
+    logger.addHandler(handler)
+    try:
+        # Next to the extracted sources: hard links can't cross filesystems (e.g. a tmpfs TMPDIR)
+        with tempfile.TemporaryDirectory(prefix=".work.", dir=extract_cache) as temp:
+            source_folder = os.path.join(temp, "src")
+            # patch-ng moves the original files away before writing them, hard links are never modified
+            shutil.copytree(source_root, source_folder, copy_function=os.link, symlinks=True)
+            for patch in check["patches"]:
+                patch_file = patch.get("patch_file")
+                base_path = patch.get("base_path")
+                handler.messages = []
+                if patch_file:
+                    patchset = patch_ng.fromfile(os.path.join(check["folder"], patch_file))
+                else:
+                    patchset = patch_ng.fromstring(patch.get("patch_string", "").encode())
+                root = os.path.join(source_folder, base_path) if base_path else source_folder
+                if not patchset:
+                    message = "can't be parsed"
+                elif not os.path.isdir(root):
+                    message = f"base_path `{base_path}` does not exist"
+                elif not patchset.apply(strip=0, root=root, fuzz=False):
+                    message = "; ".join(handler.messages) or "does not apply"
+                else:
+                    continue
+                failures.append({"patch_file": patch_file, "base_path": base_path, "message": message})
+    finally:
+        logger.removeHandler(handler)
+    return failures
+
+
+def _check_version(args):
+    try:
+        return check_version(*args)
+    except Exception as e:
+        # One broken version (unreadable patch, filesystem error...) must not abort the whole run
+        return [{"patch_file": None, "base_path": None, "message": f"check failed: {type(e).__name__}: {e}"}]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the patches listed in conandata.yml still apply.")
+    parser.add_argument("names", nargs="*", help="recipes to check")
+    parser.add_argument("--all", action="store_true", help="check every recipe")
+    parser.add_argument("--version", dest="versions", action="append", help="only these versions (repeatable)")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE), help="download cache folder (see prefetch_sources.py)")
+    parser.add_argument("--extract-cache", default=str(DEFAULT_EXTRACT_CACHE), help="folder of the extracted sources")
+    parser.add_argument("--backup-url", help="backup sources server tried before the original urls")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes applying patches")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    args = parser.parse_args()
+
+    if args.all:
+        names = sorted(path.parent.name for path in recipes_dir.glob("*/config.yml"))
+    elif args.names:
+        names = args.names
+    else:
+        parser.error("give the recipes to check, or --all")
+
+    checks = version_checks(names, versions=args.versions)
+    skipped = [check for check in checks if not check["sha256"]]
+    checks = [check for check in checks if check["sha256"]]
+
+    files = {}
+    for check in checks:
+        entry = files.setdefault(check["sha256"], {"urls": check["urls"], "references": {}})
+        entry["references"][f"{check['name']}/{check['version']}"] = check["urls"]
+    downloads = Prefetcher(args.cache, backup_url=args.backup_url).fetch_all(files)
+
+    report = []
+    for check in skipped:
+        report.append(dict(check, failures=[], status="skipped"))
+    checkable = []
+    for check in checks:
+        status, message = downloads[check["sha256"]]
+        if status == "failed":
+            report.append(dict(check, failures=[{"patch_file": None, "base_path": None, "message": message}],
+                               status="failed"))
+        else:
+            checkable.append(check)
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = executor.map(_check_version, [(check, args.cache, args.extract_cache) for check in checkable])
+        for check, failures in zip(checkable, results):
+            report.append(dict(check, failures=failures, status="failed" if failures else "ok"))
+    report.sort(key=lambda check: (check["name"], check["version"]))
+
+    if args.format == "json":
+        print(json.dumps([{key: check[key] for key in ["name", "version", "folder", "status", "failures"]}
+                          for check in report], indent=2))
+    else:
+        for check in report:
+            if check["status"] == "skipped":
+                print(f"{check['name']}/{check['version']}: skipped, the sources are not a single archive")
+            for failure in check["failures"]:
+                where = failure["patch_file"] or "sources"
+                if failure["base_path"]:
+                    where += f" (base_path: {failure['base_path']})"
+                print(f"{check['name']}/{check['version']}: {where}: {failure['message']}")
+    failed = sum(1 for check in report if check["status"] == "failed")
+    print(f"{len(report)} versions checked, {failed} with failures", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
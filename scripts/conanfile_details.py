@@ -0,0 +1,467 @@
+"""Static extraction of the details of a recipe (class attributes and methods source)
+
+The conanfile is parsed with `ast` and never imported, so neither Conan nor the recipe imports
+are needed and any number of recipes can be processed in the same process.
+"""
+
+import ast
+import collections
+import re
+from pathlib import Path
+
+
+def extract_definitions(source):
+    lines = source.splitlines(keepends=True)
+    tree = ast.parse(source)
+    definitions = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            lineno = node.lineno
+            if "@" in lines[lineno - 2]:
+                lineno -= 1
+            definitions[node.name] = {
+                "type": type(node).__name__,
+                "start_line": lineno,
+                "end_line": node.end_lineno,
+            }
+    return definitions
+
+
+class SourceExpression(str):
+    """Class attribute value that can't be evaluated statically, kept as its source code"""
+
+    def __repr__(self):
+        return str(self)
+
+
+_COMPARISONS = {
+    ast.Eq: lambda a, b: a == b,
+    ast.NotEq: lambda a, b: a != b,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+_PURE_BUILTINS = {"list": list, "tuple": tuple, "set": set, "dict": dict, "range": range, "sorted": sorted}
+
+
+def static_value(node, namespace):
+    """Evaluate a literal expression without executing any code
+
+    Besides what ast.literal_eval() accepts, names of previously evaluated attributes,
+    dict unpacking, simple comprehensions and namedtuples are supported, e.g.
+    `options = {"shared": [True, False], **{p: [True, False] for p in _providers}}`.
+    Raises ValueError for anything else.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id not in namespace:
+            raise ValueError(f"unknown name {node.id}")
+        return namespace[node.id]
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        values = [static_value(element, namespace) for element in node.elts]
+        return {ast.Tuple: tuple, ast.List: list, ast.Set: set}[type(node)](values)
+    if isinstance(node, ast.Dict):
+        result = {}
+        for key, value in zip(node.keys, node.values):
+            if key is None:
+                result.update(static_value(value, namespace))
+            else:
+                result[static_value(key, namespace)] = static_value(value, namespace)
+        return result
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = static_value(node.operand, namespace)
+        return -value if isinstance(node.op, ast.USub) else +value
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in _COMPARISONS:
+        left = static_value(node.left, namespace)
+        right = static_value(node.comparators[0], namespace)
+        return _COMPARISONS[type(node.ops[0])](left, right)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return not static_value(node.operand, namespace)
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(value.value)
+            elif value.conversion == -1 and value.format_spec is None:
+                parts.append(str(static_value(value.value, namespace)))
+            else:
+                raise ValueError("unsupported f-string")
+        return "".join(parts)
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        obj = static_value(node.value, namespace)
+        if not _is_namedtuple(obj) or node.attr not in obj._fields:
+            raise ValueError(f"unsupported attribute {node.attr}")
+        return getattr(obj, node.attr)
+    if _is_namedtuple_definition(node):
+        return collections.namedtuple(*[static_value(arg, namespace) for arg in node.args])
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+            and isinstance(namespace.get(node.func.id), type) and hasattr(namespace[node.func.id], "_fields"):
+        # instance of a namedtuple defined by a previous statement
+        return namespace[node.func.id](*[static_value(arg, namespace) for arg in node.args],
+                                       **{kw.arg: static_value(kw.value, namespace) for kw in node.keywords})
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        if node.func.id not in _PURE_BUILTINS or node.func.id in namespace:
+            raise ValueError(f"unsupported call to {node.func.id}")
+        return _PURE_BUILTINS[node.func.id](*[static_value(arg, namespace) for arg in node.args])
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and not node.keywords:
+        args = [static_value(arg, namespace) for arg in node.args]
+        if isinstance(node.func.value, ast.Name) and node.func.value.id == "dict" and node.func.attr == "fromkeys":
+            return dict.fromkeys(*args)
+        obj = static_value(node.func.value, namespace)
+        if isinstance(obj, dict) and node.func.attr in ["keys", "values", "items"] and not args:
+            return list(getattr(obj, node.func.attr)())
+        raise ValueError(f"unsupported call to {node.func.attr}")
+    if isinstance(node, (ast.ListComp, ast.SetComp, ast.DictComp)) and len(node.generators) == 1:
+        generator = node.generators[0]
+        if generator.ifs or generator.is_async or not isinstance(generator.target, ast.Name):
+            raise ValueError("unsupported comprehension")
+        items = []
+        for item in static_value(generator.iter, namespace):
+            scope = {**namespace, generator.target.id: item}
+            if isinstance(node, ast.DictComp):
+                items.append((static_value(node.key, scope), static_value(node.value, scope)))
+            else:
+                items.append(static_value(node.elt, scope))
+        return {ast.ListComp: list, ast.SetComp: set, ast.DictComp: dict}[type(node)](items)
+    raise ValueError(f"unsupported expression {type(node).__name__}")
+
+
+def _is_namedtuple(value):
+    return isinstance(value, tuple) and hasattr(value, "_fields")
+
+
+def _is_namedtuple_definition(node):
+    """`namedtuple("Name", fields)` or `collections.namedtuple("Name", fields)`"""
+    return (
+        isinstance(node, ast.Call)
+        and ((isinstance(node.func, ast.Name) and node.func.id == "namedtuple")
+             or (isinstance(node.func, ast.Attribute) and node.func.attr == "namedtuple"
+                 and isinstance(node.func.value, ast.Name) and node.func.value.id == "collections"))
+        and len(node.args) == 2
+        and not node.keywords
+    )
+
+
+def _is_conanfile_class(node):
+    return isinstance(node, ast.ClassDef) and any(
+        (isinstance(base, ast.Name) and base.id == "ConanFile")
+        or (isinstance(base, ast.Attribute) and base.attr == "ConanFile")
+        for base in node.bases
+    )
+
+
+def _assignments(body):
+    """(name, value node) of the simple `name = value` statements of a body"""
+    for statement in body:
+        if isinstance(statement, ast.Assign):
+            targets = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+            for target in targets:
+                yield target, statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            if isinstance(statement.target, ast.Name):
+                yield statement.target.id, statement.value
+
+
+def _is_dict_update(statement):
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Attribute)
+        and isinstance(statement.value.func.value, ast.Name)
+        and statement.value.func.attr == "update"
+        and len(statement.value.args) == 1
+        and not statement.value.keywords
+    )
+
+
+def _is_item_assignment(statement):
+    return (
+        isinstance(statement, ast.Assign)
+        and len(statement.targets) == 1
+        and isinstance(statement.targets[0], ast.Subscript)
+        and isinstance(statement.targets[0].value, ast.Name)
+    )
+
+
+# Requirement kind of each ConanFile method/attribute declaring dependencies
+REQUIREMENT_KINDS = {
+    "requires": "requires",
+    "tool_requires": "tool_requires",
+    "build_requires": "tool_requires",
+    "test_requires": "test_requires",
+}
+
+
+def _reference_string(node, source):
+    """Reference passed to a requirement, f-string fields are kept as `{expression}`"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(value.value)
+            else:
+                parts.append("{" + ast.get_source_segment(source, value.value) + "}")
+        return "".join(parts)
+    return None
+
+
+def extract_requirements(source):
+    """Requirements declared by a recipe, without executing it
+
+    Both `self.requires(...)`-like calls and class attributes (`requires = ...`) are collected.
+    Returns a list of dicts with the requirement `kind` (requires, tool_requires or test_requires),
+    the `reference` string, the `method` declaring it (None for class attributes), its `line` and
+    whether it is `conditional` (nested in an if/for/while/try block of the method).
+    """
+    tree = ast.parse(source)
+    requirements = []
+
+    def visit(node, method, conditional):
+        for child in ast.iter_child_nodes(node):
+            child_method, child_conditional = method, conditional
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                child_method, child_conditional = child.name, False
+            elif isinstance(child, (ast.If, ast.For, ast.While, ast.Try, ast.With, ast.IfExp)) and method:
+                child_conditional = True
+            elif isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute) \
+                    and isinstance(child.func.value, ast.Name) and child.func.value.id == "self" \
+                    and child.func.attr in REQUIREMENT_KINDS and child.args:
+                reference = _reference_string(child.args[0], source)
+                if reference:
+                    requirements.append({
+                        "kind": REQUIREMENT_KINDS[child.func.attr],
+                        "reference": reference,
+                        "method": method,
+                        "line": child.lineno,
+                        "conditional": conditional,
+                    })
+            visit(child, child_method, child_conditional)
+
+    for node in tree.body:
+        if not _is_conanfile_class(node):
+            continue
+        for attr, value_node in _assignments(node.body):
+            if attr not in REQUIREMENT_KINDS:
+                continue
+            elements = value_node.elts if isinstance(value_node, (ast.Tuple, ast.List)) else [value_node]
+            for element in elements:
+                reference = _reference_string(element, source)
+                if reference:
+                    requirements.append({
+                        "kind": REQUIREMENT_KINDS[attr],
+                        "reference": reference,
+                        "method": None,
+                        "line": element.lineno,
+                        "conditional": False,
+                    })
+        visit(node, None, False)
+    return requirements
+
+
+class ConanFileDetails:
+    """Static description of a recipe, extracted from its source with `ast` without importing it"""
+
+    def __init__(self, conanfile_path):
+        conanfile_path = Path(conanfile_path)
+        conanfile_source = conanfile_path.read_text(encoding="utf-8-sig")
+        conanfile_lines = conanfile_source.splitlines(keepends=True)
+        tree = ast.parse(conanfile_source, filename=str(conanfile_path))
+        class_node = next((node for node in tree.body if _is_conanfile_class(node)), None)
+        if class_node is None:
+            raise ValueError(f"No ConanFile class found in {conanfile_path}")
+
+        defs = extract_definitions(conanfile_source)
+        # Keep only methods
+        class_def = defs[class_node.name]
+        defs = {
+            name: details
+            for name, details in defs.items()
+            if details["start_line"] > class_def["start_line"]
+            and details["end_line"] <= class_def["end_line"]
+            and details["type"] == "FunctionDef"
+        }
+        # Exclude inner functions
+        defs = {
+            name: details
+            for name, details in defs.items()
+            if not any(
+                details["start_line"] > other["start_line"] and details["end_line"] <= other["end_line"]
+                for other in defs.values()
+            )
+        }
+
+        def get_method_source(method):
+            if method not in defs:
+                raise ValueError(f"Method {method} not found")
+            start_line = defs[method]["start_line"]
+            end_line = defs[method]["end_line"]
+            return "".join(conanfile_lines[start_line - 1 : end_line])
+
+        # Module-level constants can be referenced by class attributes
+        namespace = {}
+        for name, value_node in _assignments(tree.body):
+            try:
+                namespace[name] = static_value(value_node, namespace)
+            except (ValueError, TypeError):
+                pass
+
+        attrs = {}
+
+        def run_in_loop(statement):
+            """Statements of a class-level loop, e.g. `for comp in _components.values(): options[comp.option] = ...`"""
+            if isinstance(statement, ast.If):
+                for child in statement.body if static_value(statement.test, namespace) else statement.orelse:
+                    run_in_loop(child)
+            elif isinstance(statement, ast.Pass):
+                pass
+            elif _is_dict_update(statement) or _is_item_assignment(statement):
+                update_attribute(statement)
+            else:
+                raise ValueError(f"Can't statically evaluate the class-level statement at line {statement.lineno}")
+
+        def update_attribute(statement):
+            if _is_dict_update(statement):
+                # e.g. `options.update({a: [True, False] for a in _archs})`
+                attr = statement.value.func.value.id
+                if not isinstance(attrs.get(attr), dict):
+                    raise ValueError(f"Can't statically update '{attr}' at line {statement.lineno}")
+                attrs[attr].update(static_value(statement.value.args[0], namespace))
+            else:
+                # e.g. `default_options["fPIC"] = True`
+                target = statement.targets[0]
+                attr = target.value.id
+                if not isinstance(attrs.get(attr), dict):
+                    raise ValueError(f"Can't statically update '{attr}' at line {statement.lineno}")
+                attrs[attr][static_value(target.slice, namespace)] = static_value(statement.value, namespace)
+
+        for statement in class_node.body:
+            if isinstance(statement, ast.For) and isinstance(statement.target, ast.Name) and not statement.orelse:
+                # Options added in a loop, the loop variable is left in the namespace like Python does
+                for item in static_value(statement.iter, namespace):
+                    namespace[statement.target.id] = item
+                    for child in statement.body:
+                        run_in_loop(child)
+                continue
+            if isinstance(statement, ast.Delete) and all(isinstance(target, ast.Name) for target in statement.targets):
+                # e.g. `del comp` after a loop
+                for target in statement.targets:
+                    attrs.pop(target.id, None)
+                    namespace.pop(target.id, None)
+                continue
+            if isinstance(statement, (ast.For, ast.While, ast.If, ast.With, ast.Try, ast.AugAssign)):
+                # Could modify any attribute
+                raise ValueError(f"Can't statically evaluate the class-level statement at line {statement.lineno}")
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                # A method (or property) replaces an attribute with the same name
+                attrs.pop(statement.name, None)
+                namespace.pop(statement.name, None)
+                continue
+            if _is_dict_update(statement) or _is_item_assignment(statement):
+                update_attribute(statement)
+                continue
+            for attr, value_node in _assignments([statement]):
+                if attr.startswith("__"):
+                    continue
+                try:
+                    value = static_value(value_node, namespace)
+                except (ValueError, TypeError):
+                    value = SourceExpression(ast.get_source_segment(conanfile_source, value_node))
+                namespace[attr] = value
+                if value is not None:
+                    attrs[attr] = value
+
+        methods = {}
+        for method in defs:
+            source = get_method_source(method)
+            if f"# TODO: fill in {method}" not in source:
+                methods[method] = source
+
+        self.head: str = "".join(conanfile_lines[: class_def["start_line"] - 1])
+        self.tail: str = "".join(conanfile_lines[class_def["end_line"] :])
+        self.class_name: str = class_node.name
+        self.attrs: dict[str, object] = attrs
+        self.methods: dict[str, str] = methods
+
+    def is_method_empty(self, method):
+        if method not in self.methods:
+            return True
+        body = self.methods[method]
+        body = re.sub(r"#.*", "", body)
+        return re.match(r":\s+pass\s*$", body) is not None
+
+    @property
+    def is_header_only(self):
+        if "package_info" in self.methods and 'self.cpp_info.libs = ["' in self.methods["package_info"]:
+            return False
+        if "package_type" in self.attrs:
+            return self.attrs["package_type"] == "header-library"
+        if "shared" in self.attrs.get("options", {}) or "fPIC" in self.attrs.get("options", {}):
+            return False
+        if self.attrs.get("no_copy_source") is True:
+            return True
+        if "package_id" in self.methods:
+            return (
+                "self.info.header_only()" in self.methods["package_id"]
+                or "self.info.clear()" in self.methods["package_id"]
+            )
+        return False
+
+    @property
+    def is_application(self):
+        if self.is_header_only:
+            return False
+        if "package_info" in self.methods and 'self.cpp_info.libs = ["' in self.methods["package_info"]:
+            return False
+        if "package_type" in self.attrs:
+            return self.attrs["package_type"] == "application"
+        if self.build_system is not None:
+            return False
+        if "shared" in self.attrs.get("options", []) or "fPIC" in self.attrs.get("options", []):
+            return False
+        if "layout" in self.methods and self.is_method_empty("layout"):
+            return True
+        if "source" in self.methods and self.is_method_empty("source"):
+            return True
+        if "build" in self.methods and (
+            self.is_method_empty("build")
+            or '**self.conan_data["sources"][self.version]' in self.methods["build"]
+        ):
+            return True
+        if "package_id" in self.methods and (
+            "del self.info.settings.compiler" in self.methods["package_id"]
+            or 'self.info.settings.rm_safe("compiler")' in self.methods["package_id"]
+        ):
+            return True
+        if "package_info" in self.methods and (
+            "self.cpp_info.libdirs = []" in self.methods["package_info"]
+            or "self.cpp_info.includedirs = []" in self.methods["package_info"]
+            or "self.env_info.PATH" in self.methods["package_info"]
+        ):
+            return True
+        return False
+
+    @property
+    def generators(self):
+        if "generate" not in self.methods:
+            return set()
+        return set(re.findall(r"(\w+(?:Deps|Toolchain))", self.methods["generate"]))
+
+    @property
+    def build_system(self):
+        generators = self.generators
+        build = self.methods.get("build", "")
+        if generators.intersection({"AutotoolsDeps", "AutotoolsToolchain"}) or "Autotools" in build:
+            return "Autotools"
+        if generators.intersection({"BazelDeps", "BazelToolchain"}) or "Bazel" in build:
+            return "Bazel"
+        if generators.intersection({"CMakeDeps", "CMakeToolchain"}) or "CMake" in build:
+            return "CMake"
+        if generators.intersection({"MesonToolchain"}) or "Meson" in build:
+            return "Meson"
+        if generators.intersection({"MSBuildDeps", "MSBuildToolchain"}) or "MSBuild" in build:
+            return "MSBuild"
+        if generators.intersection({"XCodeDeps", "XCodeToolchain"}) or "XCode" in build:
+            return "XCode"
+        return None
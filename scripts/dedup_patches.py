@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Find the duplicated patch files of the recipes, and make conandata.yml share a single copy
+
+All the files under `recipes/*/*/patches` are hashed. Files with the same content are reported as
+exact duplicates, files only differing by whitespace (line endings, trailing spaces, trailing blank
+lines) as near duplicates. Groups are ranked by the bytes they waste.
+
+With `--rewrite`, the exact duplicates of a same recipe folder are merged: the `patch_file` entries
+of conandata.yml pointing to a copy are rewritten to the copy used by the newest version, and the
+copies which are no longer referenced are deleted. Near duplicates, and duplicates across folders
+(a recipe only exports the files of its own folder), are only reported: they must be merged by hand.
+
+    python3 scripts/dedup_patches.py --all
+    python3 scripts/dedup_patches.py poco opencolorio --rewrite
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import yaml
+
+from index_utils import recipes_dir, root_dir, version_key
+
+
+def _normalized(content):
+    lines = content.replace(b"\r\n", b"\n").split(b"\n")
+    return b"\n".join(line.rstrip() for line in lines).strip(b"\n")
+
+
+def hash_patches(names):
+    """{path: (sha256, whitespace-normalized sha256, size)} of the patch files of the recipes"""
+    hashes = {}
+    for name in names:
+        for path in sorted((recipes_dir / name).glob("*/patches/**/*")):
+            if path.is_file():
+                content = path.read_bytes()
+                hashes[path] = (hashlib.sha256(content).hexdigest(), hashlib.sha256(_normalized(content)).hexdigest(),
+                                len(content))
+    return hashes
+
+
+def _scope(paths):
+    folders = {path.relative_to(recipes_dir).parts[:2] for path in paths}
+    if len(folders) == 1:
+        return "folder"
+    return "recipe" if len({folder[0] for folder in folders}) == 1 else "index"
+
+
+def duplicate_groups(hashes):
+    """Groups of exact and whitespace-only duplicates, the most wasteful first"""
+    exact = defaultdict(list)
+    normalized = defaultdict(set)
+    for path, (sha256, normalized_sha256, _) in hashes.items():
+        exact[sha256].append(path)
+        normalized[normalized_sha256].add(sha256)
+    groups = []
+    for sha256, paths in exact.items():
+        if len(paths) > 1:
+            groups.append({"kind": "exact", "scope": _scope(paths), "files": sorted(paths),
+                           "wasted": sum(hashes[path][2] for path in paths[1:])})
+    for normalized_sha256, sha256s in normalized.items():
+        if len(sha256s) > 1:
+            paths = sorted(path for sha256 in sha256s for path in exact[sha256])
+            sizes = sorted(hashes[path][2] for path in paths)
+            groups.append({"kind": "whitespace", "scope": _scope(paths), "files": paths, "wasted": sum(sizes[:-1])})
+    groups.sort(key=lambda group: (-group["wasted"], group["files"]))
+    return groups
+
+
+def _patch_users(conandata):
+    """{patch_file: [versions]} of a conandata.yml"""
+    users = defaultdict(list)
+    for version, patches in (conandata.get("patches") or {}).items():
+        for patch in patches or []:
+            if patch.get("patch_file"):
+                users[patch["patch_file"]].append(str(version))
+    return users
+
+
+def _mentioned(folder, relative_path):
+    """Whether a file of the recipe folder other than conandata.yml and the patches mentions the patch"""
+    for path in folder.rglob("*"):
+        if path.is_file() and path.name != "conandata.yml" and "patches" not in path.relative_to(folder).parts:
+            try:
+                if relative_path in path.read_text(encoding="utf-8", errors="ignore") \
+                        or Path(relative_path).name in path.read_text(encoding="utf-8", errors="ignore"):
+                    return True
+            except OSError:
+                continue
+    return False
+
+
+def _check_rewrite(conandata_path, original, rewritten, replacements):
+    """Assert that only the replaced paths of the patch_file entries differ between both texts"""
+    remaining = _patch_users(yaml.safe_load(rewritten) or {})
+    assert not set(replacements) & set(remaining), f"{conandata_path}: some patch_file entries were not rewritten"
+    original_lines = original.splitlines(keepends=True)
+    rewritten_lines = rewritten.splitlines(keepends=True)
+    assert len(original_lines) == len(rewritten_lines), f"{conandata_path}: lines were added or removed"
+    for before, after in zip(original_lines, rewritten_lines):
+        if before != after:
+            assert any(before.replace(old, new, 1) == after for old, new in replacements.items()), \
+                f"{conandata_path}: unexpected change of `{before.rstrip()}` into `{after.rstrip()}`"
+
+
+def rewrite_folder(folder, groups):
+    """Point the conandata.yml of `folder` to one copy of each group of its files, returns the removed files"""
+    conandata_path = folder / "conandata.yml"
+    if not conandata_path.is_file():
+        return []
+    # As bytes: the file is written back unchanged but for the rewritten paths (line endings included)
+    conandata_text = conandata_path.read_bytes().decode("utf-8")
+    users = _patch_users(yaml.safe_load(conandata_text) or {})
+    replacements = {}
+    for paths in groups:
+        relatives = [path.relative_to(folder).as_posix() for path in paths]
+        used = [relative for relative in relatives if relative in users]
+        if len(used) < 2:
+            continue
+        canonical = max(used, key=lambda relative: max(version_key(v) for v in users[relative]))
+        replacements.update({relative: canonical for relative in used if relative != canonical})
+    if not replacements:
+        return []
+
+    def replace(match):
+        quote = match.group(2)
+        return f"{match.group(1)}{quote}{replacements[match.group(3)]}{quote}{match.group(4)}"
+    # [ \t] rather than \s: in MULTILINE mode \s would match (and drop) the line breaks around the entry
+    pattern = re.compile(r"^([ \t]*(?:-[ \t]*)?patch_file:[ \t]*)([\"']?)(" + "|".join(map(re.escape, replacements))
+                         + r")\2([ \t]*\r?)$", re.MULTILINE)
+    rewritten = pattern.sub(replace, conandata_text)
+    _check_rewrite(conandata_path, conandata_text, rewritten, replacements)
+    conandata_path.write_bytes(rewritten.encode("utf-8"))
+
+    removed = []
+    for relative in replacements:
+        if not _mentioned(folder, relative):
+            (folder / relative).unlink()
+            removed.append(folder / relative)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report duplicated patch files, and optionally merge them.")
+    parser.add_argument("names", nargs="*", help="recipes to check")
+    parser.add_argument("--all", action="store_true", help="check every recipe")
+    parser.add_argument("--rewrite", action="store_true",
+                        help="merge the exact duplicates of each recipe folder in its conandata.yml")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    args = parser.parse_args()
+
+    if args.all:
+        names = sorted(path.parent.name for path in recipes_dir.glob("*/config.yml"))
+    elif args.names:
+        names = args.names
+    else:
+        parser.error("give the recipes to check, or --all")
+
+    hashes = hash_patches(names)
+    groups = duplicate_groups(hashes)
+
+    removed = []
+    if args.rewrite:
+        by_folder = defaultdict(list)
+        for group in groups:
+            if group["kind"] != "exact":
+                continue
+            folders = defaultdict(list)
+            for path in group["files"]:
+                folders[path.relative_to(recipes_dir).parts[:2]].append(path)
+            for (name, folder), paths in folders.items():
+                if len(paths) > 1:
+                    by_folder[recipes_dir / name / folder].append(paths)
+        for folder, folder_groups in sorted(by_folder.items()):
+            removed.extend(rewrite_folder(folder, folder_groups))
+
+    if args.format == "json":
+        print(json.dumps({"groups": [dict(group, files=[str(path.relative_to(root_dir)) for path in group["files"]])
+                                     for group in groups],
+                          "removed": [str(path.relative_to(root_dir)) for path in removed]}, indent=2))
+    else:
+        for group in groups:
+            print(f"{group['kind']} duplicates ({group['scope']}, {group['wasted']} bytes):")
+            for path in group["files"]:
+                print(f"    {path.relative_to(root_dir)}")
+        for path in removed:
+            print(f"removed {path.relative_to(root_dir)}")
+    wasted = sum(group["wasted"] for group in groups if group["kind"] == "exact")
+    print(f"{len(hashes)} patch files, {sum(1 for g in groups if g['kind'] == 'exact')} groups of exact duplicates "
+          f"({wasted} bytes), {sum(1 for g in groups if g['kind'] == 'whitespace')} groups of whitespace duplicates, "
+          f"{len(removed)} files removed", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
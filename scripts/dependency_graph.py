@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Reverse dependency graph of the index and rebuild "waves"
+
+The requirements come from the recipe catalog (see recipe_catalog.py), so no recipe is imported.
+Nodes are recipe names: a recipe depends on all the recipes required by any of its folders.
+
+The recipes of a wave only depend on recipes of the previous waves, so all of them can be built
+concurrently once the previous waves are done.
+
+    python3 scripts/dependency_graph.py zlib                      # waves to rebuild after a zlib change
+    python3 scripts/dependency_graph.py openssl --version 3.2.1   # only consumers accepting openssl/3.2.1
+    python3 scripts/dependency_graph.py --format json             # waves of the whole index
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+
+from index_utils import version_key
+from recipe_catalog import DEFAULT_DATABASE, Catalog
+
+DEFAULT_KINDS = ["requires", "tool_requires"]
+
+
+def _satisfies_condition(version, condition):
+    match = re.fullmatch(r"(>=|<=|>|<|=|~|\^)?v?(.+)", condition)
+    operator, expected = match.group(1) or "=", match.group(2)
+    if operator in ["~", "^"]:
+        # Like Conan's (node-semver) ranges: >=X <next(X), ~ bumps the minor (the major of ~1), ^ the
+        # first non-zero component (the last one of ^0.0): ~1.2.3 is >=1.2.3 <1.3, ^0.2.3 is >=0.2.3 <0.3
+        parts = expected.split(".")
+        if operator == "~":
+            index = min(1, len(parts) - 1)
+        else:
+            index = next((i for i, part in enumerate(parts) if part != "0"), len(parts) - 1)
+        if not parts[index].isdigit():
+            return version.split(".")[:index + 1] == parts[:index + 1]
+        upper = ".".join(parts[:index] + [str(int(parts[index]) + 1)])
+        return version_key(expected) <= version_key(version) < version_key(upper)
+    if "*" in expected or expected.lower().endswith(".x"):
+        return re.fullmatch(re.escape(expected.rstrip("*").rstrip("x")) + ".*", version) is not None
+    ordering = (version_key(version) > version_key(expected)) - (version_key(version) < version_key(expected))
+    return {"=": ordering == 0, ">": ordering > 0, "<": ordering < 0,
+            ">=": ordering >= 0, "<=": ordering <= 0}[operator]
+
+
+def satisfies(version, reference):
+    """Whether `version` can be resolved for the `name/<version or [range]>` reference
+
+    References which can't be evaluated statically (with `{...}` placeholders, or `<host_version>`)
+    accept any version.
+    """
+    spec = reference.split("/", 1)[1].split("@")[0].split("#")[0] if "/" in reference else ""
+    if not spec or "{" in spec or spec.startswith("<host_version"):
+        return True
+    if not (spec.startswith("[") and spec.endswith("]")):
+        return spec == version
+    expression = spec[1:-1].split(",")[0].strip()  # Options after the comma (include_prerelease...) are ignored
+    if not expression:
+        return True
+    return any(all(_satisfies_condition(version, condition) for condition in alternative.split())
+               for alternative in expression.split("||"))
+
+
+class DependencyGraph:
+    def __init__(self, catalog, kinds=DEFAULT_KINDS):
+        self.requirements = defaultdict(set)   # name -> names it requires
+        self.references = defaultdict(set)     # (consumer, requirement) -> references used
+        placeholders = ", ".join("?" * len(kinds))
+        recipes = {name for name, in catalog.query("SELECT DISTINCT name FROM versions")}
+        for name, requirement, reference in catalog.query(
+                f"SELECT name, requirement, reference FROM requirements WHERE kind IN ({placeholders})", tuple(kinds)):
+            # Ignore requirements on itself (cross-building) and on names unknown to the index
+            if requirement != name and requirement in recipes:
+                self.requirements[name].add(requirement)
+                self.references[name, requirement].add(reference)
+        self.nodes = recipes
+        self.consumers = defaultdict(set)
+        for name, requirements in self.requirements.items():
+            for requirement in requirements:
+                self.consumers[requirement].add(name)
+
+    def affected(self, names, version=None):
+        """Recipes to rebuild when `names` change: themselves and their direct and transitive consumers
+
+        With `version`, the direct consumers of `names` are restricted to those whose references accept it.
+        """
+        affected = set(names)
+        pending = []
+        for name in names:
+            for consumer in self.consumers[name]:
+                if version is None or any(satisfies(version, reference)
+                                          for reference in self.references[consumer, name]):
+                    pending.append(consumer)
+        while pending:
+            name = pending.pop()
+            if name not in affected:
+                affected.add(name)
+                pending.extend(self.consumers[name])
+        return affected
+
+    def waves(self, nodes=None):
+        """Topological levels of `nodes` (all the recipes by default)
+
+        Returns (waves, cycle) where `cycle` lists the recipes involved in (or depending on) a
+        dependency cycle, which can't be ordered.
+        """
+        nodes = set(self.nodes if nodes is None else nodes)
+        remaining = {name: len(self.requirements[name] & nodes) for name in nodes}
+        wave = sorted(name for name, count in remaining.items() if count == 0)
+        waves = []
+        while wave:
+            waves.append(wave)
+            for name in wave:
+                del remaining[name]
+            next_wave = set()
+            for name in wave:
+                for consumer in self.consumers[name] & remaining.keys():
+                    remaining[consumer] -= 1
+                    if remaining[consumer] == 0:
+                        next_wave.add(consumer)
+            wave = sorted(next_wave)
+        return waves, sorted(remaining)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute the recipes to rebuild after a change, in parallel waves.")
+    parser.add_argument("names", nargs="*", help="changed recipes (default: the whole index)")
+    parser.add_argument("--version", help="changed version, only consumers whose requirement accepts it are kept")
+    parser.add_argument("--kinds", nargs="+", default=DEFAULT_KINDS,
+                        choices=["requires", "tool_requires", "test_requires"], help="requirement kinds to follow")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--database", default=str(DEFAULT_DATABASE), help="path of the SQLite recipe catalog")
+    args = parser.parse_args()
+
+    catalog = Catalog(args.database)
+    catalog.update()
+    graph = DependencyGraph(catalog, kinds=args.kinds)
+    unknown = set(args.names) - graph.nodes
+    if unknown:
+        parser.error(f"unknown recipes: {', '.join(sorted(unknown))}")
+
+    nodes = graph.affected(args.names, version=args.version) if args.names else None
+    waves, cycle = graph.waves(nodes)
+    if args.format == "json":
+        print(json.dumps({"waves": waves, "cycle": cycle}, indent=2))
+    else:
+        for i, wave in enumerate(waves, start=1):
+            print(f"wave {i} ({len(wave)}): {' '.join(wave)}")
+        if cycle:
+            print(f"cycle ({len(cycle)}): {' '.join(cycle)}")
+    if cycle:
+        print(f"{len(cycle)} recipes are part of, or depend on, a dependency cycle", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Helpers shared by the scripts working on the recipes of the index
+
+Only the standard library is imported here: importing this module must stay cheap (it is used by
+profile_recipe_imports.py, which measures import times).
+"""
+
+import io
+import re
+import subprocess
+import tarfile
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent.absolute()
+recipes_dir = root_dir / "recipes"
+
+# Modules imported by (almost) every recipe: benchmarks import them beforehand, so they are not counted
+COMMON_MODULES = ["conan", "conan.errors", "conan.tools.apple", "conan.tools.build", "conan.tools.cmake",
+                  "conan.tools.env", "conan.tools.files", "conan.tools.gnu", "conan.tools.layout",
+                  "conan.tools.microsoft", "conan.tools.scm"]
+
+
+def version_key(version):
+    """Sort key of a version: numeric components compare as numbers and above any textual one, like Conan does"""
+    return tuple((1, int(part), "") if part.isdigit() else (0, 0, part)
+                 for part in re.split(r"[.\-+]", version))
+
+
+def extract_at(ref, name, folder, destination):
+    """Extract recipes/<name>/<folder> as of the git `ref` into `destination`, returns its conanfile.py or None"""
+    try:
+        archive = subprocess.check_output(["git", "archive", ref, f"recipes/{name}/{folder}"],
+                                          cwd=root_dir, stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError:
+        return None  # new folder
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(destination, filter="data")
+        else:
+            tar.extractall(destination)
+    conanfile_path = Path(destination) / "recipes" / name / folder / "conanfile.py"
+    return conanfile_path if conanfile_path.is_file() else None
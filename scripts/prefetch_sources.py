@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Download the sources listed in the recipes' conandata.yml into a Conan download cache
+
+Archives are fetched concurrently, with a bounded number of connections per host, and their sha256
+is checked while they are being written. Interrupted downloads are resumed with HTTP range requests.
+
+The layout is the one of Conan's `core.sources:download_cache` (backup sources): each file is stored
+as `s/<sha256>` next to a `s/<sha256>.json` summary of the references and urls it comes from. Once
+prefetched, point `core.sources:download_cache` at the cache folder and `get()` won't download again.
+
+    python3 scripts/prefetch_sources.py zlib openssl --cache ~/backup_sources_cache
+    python3 scripts/prefetch_sources.py --all --jobs 32 --per-host 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import yaml
+
+from index_utils import recipes_dir, root_dir
+
+DEFAULT_CACHE = root_dir / ".cache" / "backup_sources_cache"
+CHUNK_SIZE = 1 << 16
+
+
+def load_yaml(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+
+def source_files(source):
+    """(urls, sha256) of each file of a `sources` entry: a dict, a list of dicts or nested per platform"""
+    if isinstance(source, list):
+        return [item for element in source for item in source_files(element)]
+    if not isinstance(source, dict):
+        return []
+    if "url" in source:
+        urls = source["url"] if isinstance(source["url"], list) else [source["url"]]
+        return [([str(url) for url in urls], source.get("sha256"))]
+    return [item for value in source.values() for item in source_files(value)]
+
+
+def collect_sources(names, versions=None):
+    """{sha256: {"urls": [...], "references": {reference: urls}}} for the given recipes
+
+    Files listed without a sha256 can't be stored in the cache and are skipped.
+    """
+    files = {}
+    for name in names:
+        config = load_yaml(recipes_dir / name / "config.yml")
+        for version, info in (config.get("versions") or {}).items():
+            version = str(version)
+            if versions and version not in versions:
+                continue
+            conandata_path = recipes_dir / name / str(info["folder"]) / "conandata.yml"
+            if not conandata_path.is_file():
+                continue
+            source = (load_yaml(conandata_path).get("sources") or {}).get(version)
+            for urls, sha256 in source_files(source):
+                if not sha256:
+                    print(f"{name}/{version}: no sha256 for {urls[0]}, skipped", file=sys.stderr)
+                    continue
+                entry = files.setdefault(sha256.lower(), {"urls": [], "references": {}})
+                entry["urls"].extend(url for url in urls if url not in entry["urls"])
+                entry["references"].setdefault(f"{name}/{version}", urls)
+    return files
+
+
+class Prefetcher:
+    def __init__(self, cache, per_host=4, backup_url=None, retries=3, timeout=60):
+        self.folder = Path(cache) / "s"
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.per_host = per_host
+        self.backup_url = backup_url.rstrip("/") + "/" if backup_url else None
+        self.retries = retries
+        self.timeout = timeout
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+        self._summary_lock = threading.Lock()
+
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        with self._hosts_lock:
+            return self._hosts.setdefault(host, threading.BoundedSemaphore(self.per_host))
+
+    def _download(self, url, sha256, part_path):
+        """Download (or resume) `url` into `part_path`, returns True when the sha256 matches"""
+        hasher = hashlib.sha256()
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        request = urllib.request.Request(url, headers={"User-Agent": "conan-center-index prefetch"})
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+        with self._host_slot(url), urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if offset and response.status == 206:
+                with open(part_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        hasher.update(chunk)
+                mode = "ab"
+            else:
+                mode = "wb"  # The server ignored the range, start again
+            with open(part_path, mode) as f:
+                for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    f.write(chunk)
+        if hasher.hexdigest() != sha256:
+            part_path.unlink()
+            raise ValueError(f"sha256 mismatch for {url}: expected {sha256}, got {hasher.hexdigest()}")
+        return True
+
+    def _update_summary(self, sha256, entry):
+        summary_path = self.folder / f"{sha256}.json"
+        with self._summary_lock:
+            summary = {"references": {}, "exports": {}}
+            if summary_path.is_file():
+                summary = json.loads(summary_path.read_text())
+            for reference, urls in entry["references"].items():
+                known = summary.setdefault("references", {}).setdefault(reference, [])
+                known.extend(url for url in urls if url not in known)
+            summary_path.write_text(json.dumps(summary))
+
+    def fetch(self, sha256, entry):
+        """Store one file in the cache, returns (status, message) with status in cached/downloaded/failed"""
+        path = self.folder / sha256
+        if path.is_file():
+            self._update_summary(sha256, entry)
+            return "cached", None
+        part_path = self.folder / f"{sha256}.part"
+        urls = ([self.backup_url + sha256] if self.backup_url else []) + entry["urls"]
+        errors = []
+        for url in urls:
+            for attempt in range(self.retries):
+                try:
+                    self._download(url, sha256, part_path)
+                    os.replace(part_path, path)
+                    self._update_summary(sha256, entry)
+                    return "downloaded", url
+                except ValueError as e:
+                    errors.append(str(e))
+                    break
+                except (OSError, urllib.error.URLError) as e:
+                    if isinstance(e, urllib.error.HTTPError) and e.code < 500 and e.code != 429:
+                        errors.append(f"{url}: {e}")
+                        break  # The server refused the request, retrying won't help (5xx and 429 are retried)
+                    if attempt == self.retries - 1:
+                        errors.append(f"{url}: {e}")
+                    else:
+                        time.sleep(2 ** attempt)  # The partial file is kept and resumed
+        if part_path.exists():
+            part_path.unlink()
+        return "failed", "; ".join(errors)
+
+    def fetch_all(self, files, jobs=16):
+        results = {}
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {sha256: executor.submit(self.fetch, sha256, entry) for sha256, entry in files.items()}
+            for sha256, future in futures.items():
+                results[sha256] = future.result()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch and verify the sources of recipes into a Conan download cache.")
+    parser.add_argument("names", nargs="*", help="recipes to prefetch")
+    parser.add_argument("--all", action="store_true", help="prefetch the sources of every recipe")
+    parser.add_argument("--version", dest="versions", action="append", help="only these versions (repeatable)")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE),
+                        help="download cache folder (the value of core.sources:download_cache)")
+    parser.add_argument("--backup-url", help="backup sources server tried before the original urls")
+    parser.add_argument("-j", "--jobs", type=int, default=16, help="number of concurrent downloads")
+    parser.add_argument("--per-host", type=int, default=4, help="maximum concurrent connections to the same host")
+    parser.add_argument("--retries", type=int, default=3, help="attempts per url on network and 5xx/429 errors")
+    args = parser.parse_args()
+
+    if args.all:
+        names = sorted(path.parent.name for path in recipes_dir.glob("*/config.yml"))
+    elif args.names:
+        names = args.names
+    else:
+        parser.error("give the recipes to prefetch, or --all")
+    missing = [name for name in names if not (recipes_dir / name / "config.yml").is_file()]
+    if missing:
+        parser.error(f"unknown recipes: {', '.join(missing)}")
+
+    files = collect_sources(names, versions=args.versions)
+    prefetcher = Prefetcher(args.cache, per_host=args.per_host, backup_url=args.backup_url, retries=args.retries)
+    results = prefetcher.fetch_all(files, jobs=args.jobs)
+
+    failed = 0
+    for sha256, (status, message) in sorted(results.items(), key=lambda item: sorted(files[item[0]]["references"])):
+        references = ", ".join(sorted(files[sha256]["references"]))
+        if status == "failed":
+            failed += 1
+            print(f"FAILED {references}: {message}")
+        elif status == "downloaded":
+            print(f"downloaded {references} from {message}")
+    counts = {status: sum(1 for s, _ in results.values() if s == status) for status in ["cached", "downloaded", "failed"]}
+    print(f"{counts['downloaded']} downloaded, {counts['cached']} already cached, {counts['failed']} failed",
+          file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
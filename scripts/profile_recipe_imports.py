@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Profile the import time of the recipes, and fail when a change makes a recipe slower to load
+
+Every conanfile.py is imported in its own interpreter, started with `-X importtime`, like Conan's
+loader does (the recipe folder first in `sys.path`). The modules every recipe uses (`conan`,
+`conan.tools.*`) are imported beforehand and are not counted: the report shows what each recipe
+adds, its module body and the modules it pulls in (`yaml`, helpers next to the recipe...).
+
+Each recipe is imported `--repeat` times and the median run is reported.
+
+    python3 scripts/profile_recipe_imports.py --all --top 20
+    python3 scripts/profile_recipe_imports.py googleapis google-cloud-cpp --format json
+
+With `--since REF`, only the recipe folders changed since REF are profiled, at REF and in the working
+tree (imported in turn, one recipe at a time unless `--jobs` is given), and the script fails if one
+of them got slower by more than `--threshold` percent and more than `--min-delta` ms, both for its
+median and its fastest import, to ignore noise:
+
+    python3 scripts/profile_recipe_imports.py --since origin/master --threshold 20
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from index_utils import COMMON_MODULES, extract_at, recipes_dir, root_dir
+
+MARKER = "--- recipe import ---"
+
+_IMPORT_SNIPPET = f"""
+import importlib, importlib.util, os, sys, time
+sys.dont_write_bytecode = True  # like Conan's loader, recipes are compiled on every load
+for module in sys.argv[2].split(","):
+    importlib.import_module(module)
+sys.stderr.write({MARKER!r} + "\\n")
+sys.path.insert(0, os.path.dirname(sys.argv[1]))
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("conanfile", sys.argv[1])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(int((time.perf_counter() - start) * 1e6))
+"""
+
+
+def _parse_importtime(stderr):
+    """[(depth, module, self_us, cumulative_us)] of the imports done after the marker"""
+    imports = []
+    lines = stderr.splitlines()
+    for line in lines[lines.index(MARKER) + 1:] if MARKER in lines else []:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        imports.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def _import_once(conanfile_path):
+    """(total_us, imports) of one import of a conanfile.py in a new interpreter, or its error message"""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", _IMPORT_SNIPPET,
+                              str(conanfile_path), ",".join(COMMON_MODULES)],
+                             capture_output=True, text=True)
+    if process.returncode != 0:
+        return (process.stderr.strip().splitlines() or ["failed"])[-1]
+    return int(process.stdout.strip().splitlines()[-1]), _parse_importtime(process.stderr)
+
+
+def _summary(runs):
+    errors = [run for run in runs if isinstance(run, str)]
+    if errors:
+        return {"status": "error", "message": errors[0], "total_ms": None, "fastest_ms": None,
+                "imports": [], "heaviest": []}
+    runs = sorted(runs, key=lambda run: run[0])
+    total_us, imports = runs[(len(runs) - 1) // 2]  # the median run
+    return {
+        "status": "ok",
+        "message": None,
+        "total_ms": total_us / 1000,
+        "fastest_ms": runs[0][0] / 1000,
+        # Modules imported by the recipe itself, with everything they import
+        "imports": [{"module": name, "ms": cumulative / 1000}
+                    for depth, name, _, cumulative in sorted(imports, key=lambda i: -i[3]) if depth == 0],
+        # Modules whose own body is the most expensive, wherever they are imported from
+        "heaviest": [{"module": name, "ms": self_us / 1000}
+                     for _, name, self_us, _ in sorted(imports, key=lambda i: -i[2])[:5]],
+    }
+
+
+def profile(*conanfile_paths, repeat=5):
+    """Import time of conanfile.py files: total (ms) of the median run, its direct imports and the heaviest modules
+
+    Given several revisions of a recipe, they are imported in turn, so that a load change of the machine
+    affects all of them alike.
+    """
+    runs = [[] for _ in conanfile_paths]
+    for _ in range(repeat):
+        for conanfile_path, path_runs in zip(conanfile_paths, runs):
+            path_runs.append(_import_once(conanfile_path))
+    return [_summary(path_runs) for path_runs in runs]
+
+
+def _slower(current_ms, previous_ms, threshold, min_delta):
+    return current_ms - previous_ms > min_delta and current_ms > previous_ms * (1 + threshold / 100)
+
+
+def _changed_folders(ref):
+    output = subprocess.check_output(["git", "diff", "--name-only", ref, "--", "recipes"],
+                                     cwd=root_dir, text=True)
+    folders = set()
+    for path in output.splitlines():
+        parts = Path(path).parts
+        if len(parts) > 3:
+            folders.add((parts[1], parts[2]))
+    return sorted(folders)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the import time of recipes.")
+    parser.add_argument("names", nargs="*", help="recipes to profile")
+    parser.add_argument("--all", action="store_true", help="profile every recipe")
+    parser.add_argument("--since", metavar="REF",
+                        help="profile the recipe folders changed since the git REF, at REF and now, and compare")
+    parser.add_argument("--threshold", type=float, default=20,
+                        help="with --since, fail when a recipe is slower by more than this percentage")
+    parser.add_argument("--min-delta", type=float, default=5, help="with --since, ignore slowdowns below these ms")
+    parser.add_argument("--repeat", type=int, default=5, help="imports of each recipe, the median is reported")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of concurrent interpreters (default: 1 with --since, up to 4 otherwise)")
+    parser.add_argument("--top", type=int, default=None, help="only show the N slowest recipes")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    args = parser.parse_args()
+
+    if args.jobs is None:
+        # concurrent interpreters compete for the CPUs and skew the timings the gate compares
+        args.jobs = 1 if args.since else min(4, os.cpu_count() or 1)
+
+    if args.since:
+        folders = _changed_folders(args.since)
+    elif args.all or args.names:
+        names = args.names or [path.parent.name for path in recipes_dir.glob("*/config.yml")]
+        folders = sorted((path.parent.parent.name, path.parent.name)
+                         for name in names for path in (recipes_dir / name).glob("*/conanfile.py"))
+    else:
+        parser.error("give the recipes to profile, --all or --since")
+
+    with tempfile.TemporaryDirectory() as temp, ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = []
+        for name, folder in folders:
+            conanfile_path = recipes_dir / name / folder / "conanfile.py"
+            if not conanfile_path.is_file():
+                continue  # removed folder
+            previous_path = extract_at(args.since, name, folder, temp) if args.since else None
+            paths = [conanfile_path, previous_path] if previous_path else [conanfile_path]
+            futures.append((name, folder, executor.submit(profile, *paths, repeat=args.repeat)))
+        report = []
+        for name, folder, future in futures:
+            profiles = future.result()
+            entry = dict(profiles[0], name=name, folder=folder)
+            if len(profiles) > 1 and profiles[1]["status"] == "ok":
+                entry["previous_ms"] = profiles[1]["total_ms"]
+                entry["previous_fastest_ms"] = profiles[1]["fastest_ms"]
+            report.append(entry)
+    report.sort(key=lambda entry: entry["total_ms"] or 0, reverse=True)
+
+    # Slower by both margins for the median and for the fastest import: a noisy run can't fail the check alone
+    regressions = [entry for entry in report
+                   if entry.get("previous_ms") and entry["total_ms"] is not None
+                   and _slower(entry["total_ms"], entry["previous_ms"], args.threshold, args.min_delta)
+                   and _slower(entry["fastest_ms"], entry["previous_fastest_ms"], args.threshold, args.min_delta)]
+
+    if args.format == "json":
+        print(json.dumps(report, indent=1))
+    else:
+        for entry in report[:args.top]:
+            recipe = f"{entry['name']}/{entry['folder']}"
+            if entry["status"] != "ok":
+                print(f"{recipe:<45} error: {entry['message']}")
+                continue
+            line = f"{recipe:<45} {entry['total_ms']:>8.1f} ms"
+            if "previous_ms" in entry:
+                line += f" (was {entry['previous_ms']:.1f} ms)"
+            imports = ", ".join(f"{i['module']} {i['ms']:.1f}" for i in entry["imports"][:3])
+            print(line + (f"  imports: {imports}" if imports else ""))
+    for entry in regressions:
+        print(f"{entry['name']}/{entry['folder']}: import time went from {entry['previous_ms']:.1f} ms "
+              f"to {entry['total_ms']:.1f} ms", file=sys.stderr)
+    errors = sum(1 for entry in report if entry["status"] != "ok")
+    print(f"{len(report)} recipes profiled, {errors} errors, {len(regressions)} regressions", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
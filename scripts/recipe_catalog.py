@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Catalog of the metadata of every recipe in the index, stored in a SQLite database
+
+The catalog is built statically (recipes are never imported) from `recipes/*/config.yml` and the
+conanfile.py and conandata.yml of each folder. It is refreshed incrementally: only the recipes whose
+files changed since the last update are parsed again, every recipe is when the extractor changed.
+
+    python3 scripts/recipe_catalog.py update
+    python3 scripts/recipe_catalog.py query --requires openssl
+    python3 scripts/recipe_catalog.py query --generator CMakeDeps
+    python3 scripts/recipe_catalog.py query --sql "SELECT name FROM recipes WHERE package_type = 'header-library'"
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import yaml
+
+import conanfile_details
+from conanfile_details import ConanFileDetails, extract_requirements
+from index_utils import recipes_dir, root_dir
+
+DEFAULT_DATABASE = root_dir / ".cache" / "recipes_catalog.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipes_hashes (name TEXT PRIMARY KEY, hash TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT NOT NULL, version TEXT NOT NULL, folder TEXT NOT NULL,
+    PRIMARY KEY (name, version)
+);
+CREATE TABLE IF NOT EXISTS recipes (
+    name TEXT NOT NULL, folder TEXT NOT NULL,
+    package_type TEXT, description TEXT, license TEXT, homepage TEXT, topics TEXT,
+    options TEXT, default_options TEXT, build_system TEXT, generators TEXT,
+    patch_count INTEGER, error TEXT,
+    PRIMARY KEY (name, folder)
+);
+CREATE TABLE IF NOT EXISTS requirements (
+    name TEXT NOT NULL, folder TEXT NOT NULL, kind TEXT NOT NULL,
+    requirement TEXT NOT NULL, reference TEXT NOT NULL,
+    method TEXT, line INTEGER, conditional INTEGER
+);
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT NOT NULL, folder TEXT NOT NULL, version TEXT NOT NULL,
+    url TEXT, sha256 TEXT, patch_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS versions_folder ON versions (name, folder);
+CREATE INDEX IF NOT EXISTS recipes_package_type ON recipes (package_type);
+CREATE INDEX IF NOT EXISTS recipes_build_system ON recipes (build_system);
+CREATE INDEX IF NOT EXISTS requirements_name ON requirements (name);
+CREATE INDEX IF NOT EXISTS requirements_requirement ON requirements (requirement);
+CREATE INDEX IF NOT EXISTS sources_name ON sources (name, version);
+"""
+
+TABLES = ["versions", "recipes", "requirements", "sources"]
+
+
+def _to_json(value):
+    return json.dumps(value, default=lambda o: sorted(o, key=str))
+
+
+def _load_yaml(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+
+def _recipe_files(config_path):
+    """config.yml and the conanfile.py/conandata.yml of every folder it references"""
+    files = [config_path]
+    try:
+        folders = {str(info["folder"]) for info in _load_yaml(config_path)["versions"].values()}
+    except (yaml.YAMLError, KeyError, TypeError, AttributeError):
+        return files
+    for folder in sorted(folders):
+        files.extend([config_path.parent / folder / "conanfile.py", config_path.parent / folder / "conandata.yml"])
+    return files
+
+
+def tool_fingerprint():
+    """Hash of everything that can change the rows of any recipe: the extractor and the schema of the catalog"""
+    hasher = hashlib.sha256(yaml.__version__.encode())
+    for module in [__file__, conanfile_details.__file__]:
+        hasher.update(Path(module).read_bytes())
+    return hasher.hexdigest()
+
+
+def recipe_hash(config_path, tool_hash=""):
+    hasher = hashlib.sha256(tool_hash.encode())
+    for path in _recipe_files(config_path):
+        hasher.update(str(path.relative_to(recipes_dir)).encode())
+        if path.is_file():
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+def _source_urls(source):
+    """The url(s) of a `sources` entry, which can be a dict, a list of dicts or nested per platform"""
+    if isinstance(source, list):
+        return [url for item in source for url in _source_urls(item)]
+    if not isinstance(source, dict):
+        return []
+    if "url" in source:
+        urls = source["url"] if isinstance(source["url"], list) else [source["url"]]
+        return [(str(url), source.get("sha256")) for url in urls]
+    return [url for value in source.values() for url in _source_urls(value)]
+
+
+def _folder_rows(name, folder, folder_path):
+    """Rows of the recipes, requirements and sources tables for a recipe folder"""
+    rows = {"recipes": [], "requirements": [], "sources": []}
+    conanfile_path = folder_path / "conanfile.py"
+    conandata_path = folder_path / "conandata.yml"
+
+    conandata = {}
+    if conandata_path.is_file():
+        try:
+            conandata = _load_yaml(conandata_path)
+        except yaml.YAMLError:
+            pass
+    patches = conandata.get("patches") or {}
+    for version, source in (conandata.get("sources") or {}).items():
+        patch_count = len(patches.get(version) or [])
+        for url, sha256 in _source_urls(source) or [(None, None)]:
+            rows["sources"].append((name, folder, str(version), url, sha256, patch_count))
+
+    recipe = {"package_type": None, "description": None, "license": None, "homepage": None, "topics": None,
+              "options": None, "default_options": None, "build_system": None, "generators": None, "error": None}
+    try:
+        details = ConanFileDetails(conanfile_path)
+        for attr in ["package_type", "description", "license", "homepage"]:
+            value = details.attrs.get(attr)
+            recipe[attr] = value if value is None or isinstance(value, str) else _to_json(value)
+        for attr in ["topics", "options", "default_options"]:
+            recipe[attr] = _to_json(details.attrs.get(attr))
+        recipe["build_system"] = details.build_system
+        recipe["generators"] = _to_json(sorted(details.generators))
+    except Exception as e:
+        recipe["error"] = f"{type(e).__name__}: {e}"
+
+    try:
+        requirements = extract_requirements(conanfile_path.read_text(encoding="utf-8-sig"))
+    except (OSError, SyntaxError):
+        requirements = []
+    for requirement in requirements:
+        rows["requirements"].append((name, folder, requirement["kind"], requirement["reference"].split("/")[0],
+                                     requirement["reference"], requirement["method"], requirement["line"],
+                                     int(requirement["conditional"])))
+
+    patch_count = sum(len(p or []) for p in patches.values())
+    rows["recipes"].append((name, folder, recipe["package_type"], recipe["description"], recipe["license"],
+                            recipe["homepage"], recipe["topics"], recipe["options"], recipe["default_options"],
+                            recipe["build_system"], recipe["generators"], patch_count, recipe["error"]))
+    return rows
+
+
+def recipe_rows(config_path):
+    """All the catalog rows of a recipe, given its config.yml"""
+    config_path = Path(config_path)
+    name = config_path.parent.name
+    rows = {table: [] for table in TABLES}
+    try:
+        versions = _load_yaml(config_path).get("versions") or {}
+    except yaml.YAMLError:
+        versions = {}
+    folders = set()
+    for version, info in versions.items():
+        folder = str((info or {}).get("folder"))
+        rows["versions"].append((name, str(version), folder))
+        folders.add(folder)
+    for folder in sorted(folders):
+        for table, table_rows in _folder_rows(name, folder, config_path.parent / folder).items():
+            rows[table].extend(table_rows)
+    return rows
+
+
+class Catalog:
+    def __init__(self, database=DEFAULT_DATABASE):
+        Path(database).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(database))
+        self.connection.executescript(SCHEMA)
+
+    def update(self, jobs=None):
+        """Parse again the recipes that changed since the last update, returns the number of updated recipes"""
+        config_paths = {path.parent.name: path for path in sorted(recipes_dir.glob("*/config.yml"))}
+        known = dict(self.connection.execute("SELECT name, hash FROM recipes_hashes"))
+        tool_hash = tool_fingerprint()
+        hashes = {name: recipe_hash(path, tool_hash) for name, path in config_paths.items()}
+        changed = [name for name, value in hashes.items() if known.get(name) != value]
+        removed = set(known) - set(hashes)
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            all_rows = executor.map(recipe_rows, [config_paths[name] for name in changed], chunksize=16)
+            with self.connection:
+                for name in list(removed) + changed:
+                    for table in TABLES + ["recipes_hashes"]:
+                        self.connection.execute(f"DELETE FROM {table} WHERE name = ?", (name,))
+                for name, rows in zip(changed, all_rows):
+                    for table, table_rows in rows.items():
+                        if table_rows:
+                            placeholders = ", ".join("?" * len(table_rows[0]))
+                            self.connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", table_rows)
+                    self.connection.execute("INSERT INTO recipes_hashes VALUES (?, ?)", (name, hashes[name]))
+        return len(changed) + len(removed)
+
+    def query(self, sql, parameters=()):
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def requires(self, requirement, kinds=("requires", "tool_requires", "test_requires")):
+        """(name, folder, kind, reference) of the recipes which directly require `requirement`"""
+        placeholders = ", ".join("?" * len(kinds))
+        return self.query("SELECT DISTINCT name, folder, kind, reference FROM requirements "
+                          f"WHERE requirement = ? AND kind IN ({placeholders}) ORDER BY name, folder",
+                          (requirement, *kinds))
+
+    def using_generator(self, generator):
+        return self.query("SELECT recipes.name, recipes.folder FROM recipes, json_each(recipes.generators) "
+                          "WHERE json_each.value = ? ORDER BY name, folder", (generator,))
+
+    def export_json(self):
+        """Whole catalog as a dict {name: {"versions": {...}, "folders": {folder: {...}}}}"""
+        catalog = {}
+        for name, version, folder in self.query("SELECT name, version, folder FROM versions"):
+            catalog.setdefault(name, {"versions": {}, "folders": {}})["versions"][version] = folder
+        columns = [c[1] for c in self.query("PRAGMA table_info(recipes)")]
+        for row in self.query("SELECT * FROM recipes"):
+            recipe = dict(zip(columns, row))
+            for key in ["topics", "options", "default_options", "generators"]:
+                recipe[key] = json.loads(recipe[key]) if recipe[key] else None
+            entry = catalog.setdefault(recipe["name"], {"versions": {}, "folders": {}})
+            entry["folders"][recipe["folder"]] = dict(recipe, requirements=[], sources=[])
+        for name, folder, kind, _, reference, method, line, conditional in self.query("SELECT * FROM requirements"):
+            catalog[name]["folders"][folder]["requirements"].append(
+                {"kind": kind, "reference": reference, "method": method, "line": line, "conditional": bool(conditional)})
+        for name, folder, version, url, sha256, patch_count in self.query("SELECT * FROM sources"):
+            catalog[name]["folders"][folder]["sources"].append(
+                {"version": version, "url": url, "sha256": sha256, "patch_count": patch_count})
+        return catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query a catalog of the recipes' metadata.")
+    parser.add_argument("--database", default=str(DEFAULT_DATABASE), help="path of the SQLite catalog")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    update_parser = subparsers.add_parser("update", help="refresh the catalog (only the recipes that changed)")
+    update_parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes")
+    update_parser.add_argument("--json", help="also export the whole catalog to this JSON file")
+    query_parser = subparsers.add_parser("query", help="query the catalog")
+    group = query_parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--requires", metavar="NAME", help="recipes which directly require NAME")
+    group.add_argument("--generator", metavar="NAME", help="recipes using the given generator (e.g. CMakeDeps)")
+    group.add_argument("--package-type", metavar="TYPE", help="recipes with the given package_type")
+    group.add_argument("--sql", help="any SQL query over the versions, recipes, requirements and sources tables")
+    args = parser.parse_args()
+
+    catalog = Catalog(args.database)
+    if args.command == "update":
+        updated = catalog.update(jobs=args.jobs)
+        print(f"{updated} recipes updated", file=sys.stderr)
+        if args.json:
+            Path(args.json).write_text(json.dumps(catalog.export_json(), indent=1, sort_keys=True))
+        return
+
+    if args.requires:
+        rows = catalog.requires(args.requires)
+    elif args.generator:
+        rows = catalog.using_generator(args.generator)
+    elif args.package_type:
+        rows = catalog.query("SELECT name, folder FROM recipes WHERE package_type = ? ORDER BY name, folder",
+                             (args.package_type,))
+    else:
+        rows = catalog.query(args.sql)
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Recipes needed to build a set of references, as a git sparse-checkout or an exported mini-index
+
+The closure of the `requires`/`tool_requires` of the roots is resolved statically from the recipe
+catalog (see recipe_catalog.py), conditional requirements included. Version ranges are matched
+against the versions of the index; requirements which can't be evaluated statically (versions
+computed by the recipe) bring all the versions of the required recipe. The requirements of the
+test_package of every selected folder are followed too, unless `--no-test-packages`.
+
+    python3 scripts/recipe_closure.py openssl/3.2.1 qt/6.5.2                  # the selected folders
+    python3 scripts/recipe_closure.py qt/6.5.2 --format sparse | git sparse-checkout set --cone --stdin
+    python3 scripts/recipe_closure.py boost --export ../mini-index            # a copy with only the closure
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import yaml
+
+from conanfile_details import extract_requirements
+from dependency_graph import DEFAULT_KINDS, satisfies
+from index_utils import recipes_dir
+from recipe_catalog import DEFAULT_DATABASE, Catalog
+
+
+class RecipeClosure:
+    def __init__(self, catalog, kinds=DEFAULT_KINDS, test_packages=True):
+        self.kinds = kinds
+        self.test_packages = test_packages
+        self.versions = defaultdict(dict)        # name -> {version: folder}
+        for name, version, folder in catalog.query("SELECT name, version, folder FROM versions"):
+            self.versions[name][version] = folder
+        self.requirements = defaultdict(list)    # (name, folder) -> [(requirement, reference)]
+        placeholders = ", ".join("?" * len(kinds))
+        for name, folder, requirement, reference in catalog.query(
+                f"SELECT name, folder, requirement, reference FROM requirements WHERE kind IN ({placeholders})",
+                tuple(kinds)):
+            self.requirements[name, folder].append((requirement, reference))
+        self.unresolved = defaultdict(set)       # (name, folder) -> references not found in the index
+
+    def _test_package_requirements(self, name, folder):
+        conanfile_path = recipes_dir / name / folder / "test_package" / "conanfile.py"
+        if not conanfile_path.is_file():
+            return []
+        try:
+            requirements = extract_requirements(conanfile_path.read_text(encoding="utf-8-sig"))
+        except SyntaxError:
+            return []
+        # The tested reference (`self.tested_reference_str`) is the recipe itself
+        return [(requirement["reference"].split("/")[0], requirement["reference"]) for requirement in requirements
+                if requirement["kind"] in self.kinds and not requirement["reference"].startswith("{")]
+
+    def resolve(self, roots):
+        """{name: {version: folder}} of the roots (`name` or `name/version`) and their requirements"""
+        selected = defaultdict(dict)
+        pending = []
+
+        def select(name, versions):
+            for version in versions:
+                if version not in selected[name]:
+                    selected[name][version] = self.versions[name][version]
+                    pending.append((name, self.versions[name][version]))
+
+        for root in roots:
+            name, _, version = root.partition("/")
+            if name not in self.versions or (version and version not in self.versions[name]):
+                raise ValueError(f"{root} is not in the index")
+            select(name, [version] if version else list(self.versions[name]))
+
+        visited = set()
+        while pending:
+            name, folder = pending.pop()
+            if (name, folder) in visited:
+                continue
+            visited.add((name, folder))
+            requirements = list(self.requirements[name, folder])
+            if self.test_packages:
+                requirements += self._test_package_requirements(name, folder)
+            for requirement, reference in requirements:
+                if requirement == name or "{" in requirement:
+                    continue
+                if requirement not in self.versions:
+                    self.unresolved[name, folder].add(reference)
+                    continue
+                versions = [version for version in self.versions[requirement] if satisfies(version, reference)]
+                if not versions:
+                    self.unresolved[name, folder].add(reference)
+                    versions = list(self.versions[requirement])
+                select(requirement, versions)
+        return {name: dict(versions) for name, versions in sorted(selected.items())}
+
+
+def sparse_checkout_patterns(closure):
+    """Directories of a cone mode sparse-checkout (the config.yml next to them come along)"""
+    return sorted({f"recipes/{name}/{folder}" for name, versions in closure.items() for folder in versions.values()})
+
+
+def export_index(closure, destination):
+    """Copy the selected folders into `destination`/recipes, with config.yml files listing their versions only"""
+    destination = Path(destination) / "recipes"
+    for name, versions in closure.items():
+        with open(recipes_dir / name / "config.yml", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        folders = set(versions.values())
+        config["versions"] = {version: info for version, info in config["versions"].items()
+                              if str(info["folder"]) in folders}
+        (destination / name).mkdir(parents=True, exist_ok=True)
+        for folder in folders:
+            shutil.rmtree(destination / name / folder, ignore_errors=True)
+            shutil.copytree(recipes_dir / name / folder, destination / name / folder,
+                            ignore=shutil.ignore_patterns("__pycache__"))
+        with open(destination / name / "config.yml", "w", encoding="utf-8") as f:
+            f.write("versions:\n")
+            for version, info in config["versions"].items():
+                f.write(f'  "{version}":\n    folder: {info["folder"]}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Select the recipes needed to build some references.")
+    parser.add_argument("roots", nargs="+", help="root references, `name` (all its versions) or `name/version`")
+    parser.add_argument("--kinds", nargs="+", default=DEFAULT_KINDS,
+                        choices=["requires", "tool_requires", "test_requires"], help="requirement kinds to follow")
+    parser.add_argument("--no-test-packages", dest="test_packages", action="store_false",
+                        help="don't follow the requirements of the test_package of the selected folders")
+    parser.add_argument("--format", choices=["text", "sparse", "json"], default="text",
+                        help="text: the selected folders, sparse: cone patterns for `git sparse-checkout set --stdin`")
+    parser.add_argument("--export", metavar="DIR", help="copy the selected recipes into a mini-index in DIR")
+    parser.add_argument("--database", default=str(DEFAULT_DATABASE), help="path of the SQLite recipe catalog")
+    args = parser.parse_args()
+
+    catalog = Catalog(args.database)
+    catalog.update()
+    resolver = RecipeClosure(catalog, kinds=args.kinds, test_packages=args.test_packages)
+    try:
+        closure = resolver.resolve(args.roots)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.export:
+        export_index(closure, args.export)
+    if args.format == "json":
+        print(json.dumps({"recipes": closure,
+                          "unresolved": {f"{name}/{folder}": sorted(references)
+                                         for (name, folder), references in sorted(resolver.unresolved.items())}},
+                         indent=2))
+    elif args.format == "sparse":
+        print("\n".join(sparse_checkout_patterns(closure)))
+    else:
+        for name, versions in closure.items():
+            folders = defaultdict(list)
+            for version, folder in versions.items():
+                folders[folder].append(version)
+            print(f"{name}: " + ", ".join(f"{folder} ({' '.join(v)})" for folder, v in sorted(folders.items())))
+    for (name, folder), references in sorted(resolver.unresolved.items()):
+        print(f"{name}/{folder}: no version in the index for {', '.join(sorted(references))}, "
+              f"all the versions are selected", file=sys.stderr)
+    folder_count = len(sparse_checkout_patterns(closure))
+    print(f"{len(closure)} recipes, {folder_count} folders selected", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,191 +1,37 @@
 #!/usr/bin/env python3
 
-import ast
-import inspect
+import argparse
+import codecs
+import glob
+import hashlib
 import io
+import json
 import os
 import re
 import sys
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import black
-from conan import ConanFile
-from conans.model.version import Version
-
-
-def extract_definitions(source):
-    lines = source.splitlines(keepends=True)
-    tree = ast.parse(source)
-    definitions = {}
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-            lineno = node.lineno
-            if "@" in lines[lineno - 2]:
-                lineno -= 1
-            definitions[node.name] = {
-                "type": type(node).__name__,
-                "start_line": lineno,
-                "end_line": node.end_lineno,
-            }
-    return definitions
-
-
-class ConanFileDetails:
-    def __init__(self, conanfile_path):
-        conanfile_path = Path(conanfile_path)
-        conanfile_source = conanfile_path.read_text(encoding="utf-8")
-        conanfile_lines = conanfile_source.splitlines(keepends=True)
-        # Formatting the file breaks inspect.getsourcefile()
-        # conanfile = _format_source(conanfile)
-        sys.path.insert(0, str(conanfile_path.parent))
-        eval(compile(conanfile_source, str(conanfile_path), "exec"), globals(), globals())
-        conanfile_class = [
-            value
-            for value in globals().values()
-            if inspect.isclass(value) and issubclass(value, ConanFile) and value != ConanFile
-        ][0]
-
-        defs = extract_definitions(conanfile_source)
-        # Keep only methods
-        class_def = defs[conanfile_class.__name__]
-        defs = {
-            name: details
-            for name, details in defs.items()
-            if details["start_line"] > class_def["start_line"]
-            and details["end_line"] <= class_def["end_line"]
-            and details["type"] == "FunctionDef"
-        }
-        # Exclude inner functions
-        defs = {
-            name: details
-            for name, details in defs.items()
-            if not any(
-                details["start_line"] > other["start_line"] and details["end_line"] <= other["end_line"]
-                for other in defs.values()
-            )
-        }
-
-        def get_method_source(method):
-            if method not in defs:
-                raise ValueError(f"Method {method} not found")
-            start_line = defs[method]["start_line"]
-            end_line = defs[method]["end_line"]
-            return "".join(conanfile_lines[start_line - 1 : end_line])
-
-        attrs = {}
-        for attr, value in conanfile_class.__dict__.items():
-            if attr.startswith("__"):
-                continue
-            if hasattr(value, "__call__") or isinstance(value, property):
-                continue
-            if value is not None:
-                attrs[attr] = value
-
-        methods = {}
-        for method in defs:
-            source = get_method_source(method)
-            if f"# TODO: fill in {method}" not in source:
-                methods[method] = source
-
-        self.head: str = "".join(conanfile_lines[: class_def["start_line"] - 1])
-        self.tail: str = "".join(conanfile_lines[class_def["end_line"] :])
-        self.class_name: str = conanfile_class.__name__
-        self.attrs: dict[str, object] = attrs
-        self.methods: dict[str, str] = methods
-
-    def is_method_empty(self, method):
-        if method not in self.methods:
-            return True
-        body = self.methods[method]
-        body = re.sub(r"#.*", "", body)
-        return re.match(r":\s+pass\s*$", body) is not None
-
-    @property
-    def is_header_only(self):
-        if "package_info" in self.methods and 'self.cpp_info.libs = ["' in self.methods["package_info"]:
-            return False
-        if "package_type" in self.attrs:
-            return self.attrs["package_type"] == "header-library"
-        if "shared" in self.attrs.get("options", {}) or "fPIC" in self.attrs.get("options", {}):
-            return False
-        if self.attrs.get("no_copy_source") is True:
-            return True
-        if "package_id" in self.methods:
-            return (
-                "self.info.header_only()" in self.methods["package_id"]
-                or "self.info.clear()" in self.methods["package_id"]
-            )
-        return False
-
-    @property
-    def is_application(self):
-        if self.is_header_only:
-            return False
-        if "package_info" in self.methods and 'self.cpp_info.libs = ["' in self.methods["package_info"]:
-            return False
-        if "package_type" in self.attrs:
-            return self.attrs["package_type"] == "application"
-        if self.build_system is not None:
-            return False
-        if "shared" in self.attrs.get("options", []) or "fPIC" in self.attrs.get("options", []):
-            return False
-        if "layout" in self.methods and self.is_method_empty("layout"):
-            return True
-        if "source" in self.methods and self.is_method_empty("source"):
-            return True
-        if "build" in self.methods and (
-            self.is_method_empty("build")
-            or '**self.conan_data["sources"][self.version]' in self.methods["build"]
-        ):
-            return True
-        if "package_id" in self.methods and (
-            "del self.info.settings.compiler" in self.methods["package_id"]
-            or 'self.info.settings.rm_safe("compiler")' in self.methods["package_id"]
-        ):
-            return True
-        if "package_info" in self.methods and (
-            "self.cpp_info.libdirs = []" in self.methods["package_info"]
-            or "self.cpp_info.includedirs = []" in self.methods["package_info"]
-            or "self.env_info.PATH" in self.methods["package_info"]
-        ):
-            return True
-        return False
-
-    @property
-    def generators(self):
-        if "generate" not in self.methods:
-            return set()
-        return set(re.findall(r"(\w+(?:Deps|Toolchain))", self.methods["generate"]))
-
-    @property
-    def build_system(self):
-        generators = self.generators
-        build = self.methods.get("build", "")
-        if generators.intersection({"AutotoolsDeps", "AutotoolsToolchain"}) or "Autotools" in build:
-            return "Autotools"
-        if generators.intersection({"BazelDeps", "BazelToolchain"}) or "Bazel" in build:
-            return "Bazel"
-        if generators.intersection({"CMakeDeps", "CMakeToolchain"}) or "CMake" in build:
-            return "CMake"
-        if generators.intersection({"MesonToolchain"}) or "Meson" in build:
-            return "Meson"
-        if generators.intersection({"MSBuildDeps", "MSBuildToolchain"}) or "MSBuild" in build:
-            return "MSBuild"
-        if generators.intersection({"XCodeDeps", "XCodeToolchain"}) or "XCode" in build:
-            return "XCode"
-        return None
-
-
-def _format_source(source):
-    mode = black.Mode(
-        target_versions={black.TargetVersion.PY311},
-        line_length=110,
-        magic_trailing_comma=True,
-        preview=True,
-    )
+
+import conanfile_details
+from conanfile_details import ConanFileDetails, SourceExpression
+
+
+# Built once and shared by all the recipes formatted by this process
+BLACK_MODE = black.Mode(
+    target_versions={black.TargetVersion.PY311},
+    line_length=110,
+    magic_trailing_comma=True,
+    preview=True,
+)
+DEFAULT_CACHE = Path(".cache") / "tidy_conanfile.json"
+
+
+def _format_source(source, fast=False):
     try:
-        return black.format_file_contents(source, fast=False, mode=mode)
+        return black.format_file_contents(source, fast=fast, mode=BLACK_MODE)
     except black.report.NothingChanged:
         pass
     except Exception:
@@ -195,11 +41,16 @@ def _format_source(source):
     return source
 
 
+def _version_tuple(version):
+    return tuple(int(part) for part in version.split("."))
+
+
 def _indent(text, level=1):
     return textwrap.indent(text, "    " * level)
 
 
-def tidy_conanfile(conanfile_path, write=True):
+def tidy_source(conanfile_path, fast=False):
+    """Return the tidied source of a recipe, `fast` skips black's equivalence check of the result"""
     conanfile_path = Path(conanfile_path)
     details = ConanFileDetails(conanfile_path)
 
@@ -281,11 +132,21 @@ def tidy_conanfile(conanfile_path, write=True):
     def prepend_to_method(method, prepend):
         return method.replace("self):\n", f"self):\n{_indent(prepend, 2)}\n", 1)
 
+    def add_topic(topic):
+        topics = details.attrs["topics"]
+        # Both are str: a membership test would match substrings, and list() would split them into characters
+        if isinstance(topics, SourceExpression):
+            warn(f"Can't add the '{topic}' topic to 'topics = {topics}'")
+            return
+        if isinstance(topics, str):
+            topics = (topics,)  # e.g. `topics = ("archive")`
+        if topic not in topics:
+            details.attrs["topics"] = tuple(list(topics) + [topic])
+
     if is_header_only:
         details.attrs["package_type"] = "header-library"
         details.attrs["no_copy_source"] = True
-        if "header-only" not in details.attrs["topics"]:
-            details.attrs["topics"] = tuple(list(details.attrs["topics"]) + ["header-only"])
+        add_topic("header-only")
         if "package_info" not in details.methods:
             details.methods["package_info"] = _indent(
                 "def package_info(self):\n    self.cpp_info.bindirs = []\n    self.cpp_info.libdirs = []\n"
@@ -304,8 +165,8 @@ def tidy_conanfile(conanfile_path, write=True):
         details.attrs["package_type"] = "application"
         if "no_copy_source" in details.attrs:
             del details.attrs["no_copy_source"]
-        if details.build_system is None and "pre-built" not in details.attrs["topics"]:
-            details.attrs["topics"] = tuple(list(details.attrs["topics"]) + ["pre-built"])
+        if details.build_system is None:
+            add_topic("pre-built")
         if "package_info" not in details.methods:
             details.methods["package_info"] = "    def package_info(self):\n" + _indent(
                 (
@@ -374,7 +235,7 @@ def tidy_conanfile(conanfile_path, write=True):
         min_conan_version = "1.53.0"
     if m := re.search(r'required_conan_version = ">=(\d+\.\d+\.\d+)"', details.head):
         cur_min = m.group(1)
-        if Version(cur_min) > Version(min_conan_version):
+        if _version_tuple(cur_min) > _version_tuple(min_conan_version):
             min_conan_version = cur_min
     result.write(f'\nrequired_conan_version = ">={min_conan_version}"\n')
 
@@ -502,19 +363,125 @@ def tidy_conanfile(conanfile_path, write=True):
     if warnings:
         w = "\n".join(f"#   {warning}" for warning in warnings)
         processed_source = f"# Warnings:\n{w}\n\n{processed_source}"
-    processed_source = _format_source(processed_source)
+    processed_source = _format_source(processed_source, fast=fast)
     processed_source = processed_source.replace(
         'settings = ("os", "arch", "compiler", "build_type")',
         'settings = "os", "arch", "compiler", "build_type"',
     )
     processed_source = processed_source.replace("\n\n\nrequired_conan_version", "\n\nrequired_conan_version")
 
+    return processed_source
+
+
+def tidy_conanfile(conanfile_path, write=True):
+    processed_source = tidy_source(conanfile_path)
     if write:
-        conanfile_path.write_text(processed_source)
+        Path(conanfile_path).write_text(processed_source, encoding=_read_source(conanfile_path)[1])
     else:
         print(processed_source, end="")
 
 
+def _sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _tool_fingerprint():
+    """Hash of everything that can change the output of the tidy"""
+    hasher = hashlib.sha256(black.__version__.encode())
+    for module in [__file__, conanfile_details.__file__]:
+        hasher.update(Path(module).read_bytes())
+    return hasher.hexdigest()
+
+
+def _read_source(path):
+    """Content of a conanfile without its byte order mark, and the encoding to write it back"""
+    content = Path(path).read_bytes()
+    encoding = "utf-8-sig" if content.startswith(codecs.BOM_UTF8) else "utf-8"
+    return content.decode(encoding), encoding
+
+
+def _tidy_worker(conanfile_path, check, fast):
+    """Returns (status, cache entry for the resulting content of the file)"""
+    try:
+        content, encoding = _read_source(conanfile_path)
+        processed_source = tidy_source(conanfile_path, fast=fast)
+    except Exception as e:
+        print(f"Error: failed to tidy {conanfile_path}: {e}", file=sys.stderr)
+        return "failed", None
+    if processed_source == content:
+        return "unchanged", {"hash": _sha256(content), "tidy": True}
+    if check:
+        return "would reformat", {"hash": _sha256(content), "tidy": False}
+    Path(conanfile_path).write_text(processed_source, encoding=encoding)
+    return "reformatted", {"hash": _sha256(processed_source), "tidy": True}
+
+
+def tidy_conanfiles(conanfile_paths, check=False, fast=False, jobs=None, cache_path=DEFAULT_CACHE):
+    """Tidy many recipes in a process pool, skipping the ones that didn't change since they were last tidied
+
+    Returns a dict {status: [paths]}.
+    """
+    fingerprint = _tool_fingerprint()
+    cache = {}
+    if cache_path:
+        try:
+            cache = json.loads(Path(cache_path).read_text())
+        except (OSError, ValueError):
+            pass
+    if cache.get("fingerprint") != fingerprint:
+        cache = {"fingerprint": fingerprint, "files": {}}
+
+    results = {}
+    pending = []
+    for path in map(str, conanfile_paths):
+        entry = cache["files"].get(path)
+        if entry and entry["hash"] == _sha256(_read_source(path)[0]):
+            if entry["tidy"]:
+                results.setdefault("unchanged", []).append(path)
+                continue
+            if check:
+                results.setdefault("would reformat", []).append(path)
+                continue
+        pending.append(path)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {path: executor.submit(_tidy_worker, path, check, fast) for path in pending}
+        for path, future in futures.items():
+            status, entry = future.result()
+            results.setdefault(status, []).append(path)
+            if entry:
+                cache["files"][path] = entry
+            else:
+                cache["files"].pop(path, None)
+
+    if cache_path:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(cache_path).write_text(json.dumps(cache, indent=1, sort_keys=True))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tidy ConanCenterIndex recipes.")
+    parser.add_argument("paths", nargs="+", help="conanfile.py files or glob patterns (e.g. 'recipes/*/*/conanfile.py')")
+    parser.add_argument("--check", action="store_true",
+                        help="don't write the files, exit with 1 if any of them would be modified")
+    parser.add_argument("--fast", action="store_true", help="skip black's check that the formatted code is equivalent")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes (default: all CPUs)")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE), help="cache of already tidy files, empty to disable")
+    args = parser.parse_args()
+
+    missing = [pattern for pattern in args.paths if not glob.glob(pattern)]
+    if missing:
+        parser.error(f"no such file: {', '.join(missing)}")
+    paths = sorted({p for pattern in args.paths for p in glob.glob(pattern)})
+    results = tidy_conanfiles(paths, check=args.check, fast=args.fast, jobs=args.jobs, cache_path=args.cache or None)
+    for status in ["reformatted", "would reformat", "failed"]:
+        for path in results.get(status, []):
+            print(f"{status}: {path}")
+    print(", ".join(f"{len(paths)} {status}" for status, paths in sorted(results.items())), file=sys.stderr)
+    if results.get("failed") or (args.check and results.get("would reformat")):
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    conanfile_path = sys.argv[1]
-    tidy_conanfile(conanfile_path, write=True)
+    main()
@@ -3,50 +3,169 @@
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-import datetime
+import argparse
+import difflib
+import glob
+import hashlib
+import json
+import os
 import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from distutils.version import LooseVersion
 from conan.tools.scm import Version
 import yaml
 
 recipes_dir = Path(__file__).parent.absolute() / "recipes"
+version_index_path = Path(__file__).parent.absolute() / ".cache" / "version_index.json"
+
+class _StringLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    # Every scalar is a string: an unquoted 1.10 version stays "1.10", not the float 1.1
+    yaml_implicit_resolvers = {}
 
 def _get_config_versions(config_path):
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_StringLoader)
     return list(config["versions"])
 
-def find_latest_version(config_path):
-    config_versions = _get_config_versions(config_path)
+def _git_blob_hash(content):
+    # Same as `git hash-object`, without spawning git
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+def _version_line(line):
+    """Version declared by a line of config.yml (e.g. `  "1.2.3":`), or None"""
+    line = line.split("#")[0].strip()
+    if not line or "versions" in line or "folder" in line or line[-1] != ":":
+        return None
+    return line[:-1].strip().strip("\"'")
+
+def _sweep_version_dates(recipes):
+    """{recipe: {version: date}} of the given recipes, from a single `git log` of their config.yml
+
+    The date of a version is the author date of the last commit adding its line, like `git blame`
+    reports it. Versions which are not committed yet are dated now.
+    """
+    root = recipes_dir.parent
+    pathspecs = [f"recipes/{recipe}/config.yml" for recipe in recipes]
+    log = subprocess.run(["git", "log", "--reverse", "--no-renames", "--relative", "-p", "--unified=0",
+                          "--format=%x00%at", "--", *pathspecs],
+                         capture_output=True, text=True, cwd=root).stdout
+    dates = {recipe: {} for recipe in recipes}
+    date, current, in_hunk = None, None, False
+    for line in log.splitlines():
+        if line.startswith("\0"):
+            date = int(line[1:])
+        elif line.startswith("diff --git "):
+            current, in_hunk = None, False
+        elif not in_hunk and line.startswith("+++ "):
+            parts = Path(line[len("+++ b/"):]).parts
+            current = parts[1] if line.startswith("+++ b/") and len(parts) == 3 else None
+        elif line.startswith("@@"):
+            in_hunk = True
+        elif in_hunk and current in dates and line.startswith("+"):
+            version = _version_line(line[1:])
+            if version is not None:
+                dates[current][version] = date
+    now = int(time.time())
+    for recipe in recipes:
+        versions = _get_config_versions(recipes_dir / recipe / "config.yml")
+        dates[recipe] = {version: dates[recipe].get(version, now) for version in versions}
+    return dates
+
+def _loose_key(version):
+    # LooseVersion can't compare numbers with strings (e.g. 1.0 vs 1.a), rank numbers first
+    return [(1, part) if isinstance(part, int) else (0, part) for part in LooseVersion(version).version]
+
+def _latest_version(versions, dates):
     # If all versions are in a standard format, sort by version only
-    if all(re.fullmatch(r"[\d.]+", v) for v in config_versions):
-        return sorted([(LooseVersion(v), v) for v in config_versions], reverse=True)[0][1]
+    if all(re.fullmatch(r"[\d.]+", v) for v in versions):
+        return sorted([(LooseVersion(v), v) for v in versions], reverse=True)[0][1]
     # Otherwise, sort by commit date, then version
-    versions = []
-    blame = subprocess.run(["git", "blame", "-e", config_path], capture_output=True, text=True).stdout
-    for line in blame.splitlines():
-        line = line.split("#")[0].strip()
-        if "versions" in line or "folder" in line or line[-1] != ":":
-            continue
-        # 815109b9a45 (SpaceIm           2022-11-08 20:49:32 +0100 26)   "1.3.5":
-        m = re.match(r'^\w+ (?:\S+ )?\(.+\s+(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} [+-]\d{4}) +\d+\) +"?([^"]+)"?:', line)
-        if not m:
-            print("  Matching failed:", line, file=sys.stderr)
-            continue
-        date = datetime.datetime.strptime(m.group(1), "%Y-%m-%d %H:%M:%S %z").timestamp()
-        version = m.group(2)
-        version_sort = LooseVersion(version.replace("cci.", ""))
-        versions.append((date, version_sort, version))
-    return sorted(versions, reverse=True)[0][-1]
+    if not dates:
+        print("  Matching failed: no dates found in git blame", file=sys.stderr)
+        return None
+    return sorted((date, _loose_key(version.replace("cci.", "")), version)
+                  for version, date in dates.items())[-1][-1]
 
 
-def main(conanfile_path):
-    content = Path(conanfile_path).read_text()
-    deps = re.findall(r'"([a-z0-9_.-]+)/([a-z0-9_.-]+)"', content)
-    for dep, current_version in deps:
+class VersionIndex:
+    """Latest version of each recipe and the date of each version, persisted on disk
+
+    Entries are invalidated by the config.yml blob hash. The outdated entries are recomputed at
+    once, with a single `git log` of their config.yml files giving the date of every version line
+    (needed to order versions like cci.yyyymmdd). Each config.yml is hashed once per run.
+    """
+
+    def __init__(self, path=version_index_path):
+        self.path = Path(path)
+        self.dirty = False
+        self.checked = set()  # recipes whose entry is known to be up to date in this run
+        try:
+            self.entries = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def entry(self, recipe):
+        if recipe not in self.checked:
+            self.refresh([recipe])
+        return self.entries[recipe]
+
+    def latest_version(self, recipe):
+        return self.entry(recipe)["latest"]
+
+    def refresh(self, recipes=None, jobs=None):
+        """Update the entries of the given recipes (all by default) at once"""
+        all_recipes = recipes is None
+        if all_recipes:
+            recipes = sorted(p.parent.name for p in recipes_dir.glob("*/config.yml"))
+        if all_recipes:
+            removed = set(self.entries) - set(recipes)
+            for recipe in removed:
+                del self.entries[recipe]
+            self.dirty = self.dirty or bool(removed)
+        recipes = [recipe for recipe in recipes if recipe not in self.checked]
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+            hashes = dict(zip(recipes, executor.map(
+                lambda recipe: _git_blob_hash((recipes_dir / recipe / "config.yml").read_bytes()), recipes)))
+        outdated = [recipe for recipe in recipes
+                    if recipe not in self.entries or self.entries[recipe]["hash"] != hashes[recipe]]
+        if outdated:
+            for recipe, dates in _sweep_version_dates(outdated).items():
+                versions = list(dates)
+                self.entries[recipe] = {"hash": hashes[recipe], "versions": versions, "dates": dates,
+                                        "latest": _latest_version(versions, dates)}
+            self.dirty = True
+        self.checked.update(recipes)
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.entries, indent=1, sort_keys=True))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+_version_index = None
+
+def _get_version_index():
+    global _version_index
+    if _version_index is None:
+        _version_index = VersionIndex()
+    return _version_index
+
+def find_latest_version(config_path):
+    return _get_version_index().latest_version(Path(config_path).parent.name)
+
+
+def _find_references(content):
+    """(name, version) of the recipes referenced as "name/version" in a conanfile"""
+    references = []
+    for dep, current_version in re.findall(r'"([a-z0-9_.-]+)/([a-z0-9_.-]+)"', content):
         if dep in ["lib", "include", "bin", "src", "share",
                    "etc", "doc", "res", "cmake", ".", ".."]:
             # probably matched a path
@@ -55,24 +174,98 @@ def main(conanfile_path):
             if len(parts[0]) >= 4 and len(parts[-1]) <= 3 and parts[-1].isalpha():
                 # probably matched a path
                 continue
-        print(f"  Processing {dep}")
         if current_version in ["system", "cci.latest"]:
             continue
-        config_path = recipes_dir / dep / "config.yml"
-        if not config_path.exists():
-            print(f"  ERROR: {config_path} does not exist", file=sys.stderr)
+        references.append((dep, current_version))
+    return references
+
+def _target_version(dep, current_version):
+    if dep == "openssl":
+        return "[>=1.1 <4]"
+    if dep == "cmake":
+        v = Version(current_version)
+        return f"[>={v.major}.{v.minor}]"
+    return _get_version_index().latest_version(dep)
+
+def update_requirements(content):
+    """Return the updated content of a conanfile and the list of (dep, old_version, new_version) bumps"""
+    bumps = []
+    for dep, current_version in _find_references(content):
+        if not (recipes_dir / dep / "config.yml").exists():
+            print(f"  ERROR: {recipes_dir / dep / 'config.yml'} does not exist", file=sys.stderr)
             continue
-        if dep == "openssl":
-            latest = "[>=1.1 <4]"
-        elif dep == "cmake":
-            v = Version(current_version)
-            latest = f"[>={v.major}.{v.minor}]"
-        else:
-            latest = find_latest_version(config_path)
-        if latest != current_version:
-            content = content.replace(f'"{dep}/{current_version}"', f'"{dep}/{latest}"')
-    Path(conanfile_path).write_text(content)
+        latest = _target_version(dep, current_version)
+        old_ref, new_ref = f'"{dep}/{current_version}"', f'"{dep}/{latest}"'
+        if latest and latest != current_version and old_ref in content:
+            content = content.replace(old_ref, new_ref)
+            bumps.append((dep, current_version, latest))
+    return content, bumps
+
+def _write_atomically(new_contents):
+    """Write all files or none: everything goes to temporary files first, then they are renamed"""
+    tmp_paths = {}
+    try:
+        for path, content in new_contents.items():
+            tmp_paths[path] = path.with_name(f".{path.name}.update_deps.tmp")
+            tmp_paths[path].write_text(content)
+    except BaseException:
+        for tmp_path in tmp_paths.values():
+            tmp_path.unlink(missing_ok=True)
+        raise
+    for path, tmp_path in tmp_paths.items():
+        os.replace(tmp_path, path)
+
+def update_conanfiles(conanfile_paths, dry_run=False, output_format="diff", jobs=None, out=sys.stdout):
+    """Bump the requirements of many conanfiles at once, reporting the changes as a unified diff or JSON"""
+    paths = [Path(p) for p in conanfile_paths]
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        contents = dict(zip(paths, executor.map(lambda p: p.read_text(), paths)))
+    # Resolve every referenced recipe once, before processing the conanfiles
+    deps = {dep for content in contents.values() for dep, _ in _find_references(content)}
+    _get_version_index().refresh(sorted(dep for dep in deps if (recipes_dir / dep / "config.yml").exists()), jobs=jobs)
+
+    new_contents = {}
+    report = {}
+    for path, content in contents.items():
+        new_content, bumps = update_requirements(content)
+        if bumps:
+            new_contents[path] = new_content
+            report[str(path)] = [{"reference": dep, "from": old, "to": new} for dep, old, new in bumps]
+
+    if output_format == "json":
+        json.dump(report, out, indent=2)
+        out.write("\n")
+    else:
+        for path, new_content in new_contents.items():
+            out.writelines(difflib.unified_diff(contents[path].splitlines(keepends=True),
+                                                new_content.splitlines(keepends=True),
+                                                fromfile=f"a/{path}", tofile=f"b/{path}"))
+    if not dry_run:
+        _write_atomically(new_contents)
+    return report
+
+
+def main(conanfile_path):
+    update_conanfiles([conanfile_path])
+    _get_version_index().save()
 
 
 if __name__ == "__main__":
-    main(sys.argv[1])
+    parser = argparse.ArgumentParser(description="Update the requirements of recipes to the latest versions in the index.")
+    parser.add_argument("conanfile_paths", nargs="*",
+                        help="conanfile.py files or glob patterns to update (e.g. 'recipes/*/*/conanfile.py')")
+    parser.add_argument("--dry-run", action="store_true", help="only report the changes, don't modify any file")
+    parser.add_argument("--format", choices=["diff", "json"], default="diff", help="format of the report of changes")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of concurrent jobs (default: all CPUs)")
+    parser.add_argument("--refresh-index", action="store_true",
+                        help=f"update the cached version index ({version_index_path}) for all recipes")
+    args = parser.parse_args()
+    if args.refresh_index:
+        _get_version_index().refresh(jobs=args.jobs)
+    missing = [pattern for pattern in args.conanfile_paths if not glob.glob(pattern)]
+    if missing:
+        parser.error(f"no such file: {', '.join(missing)}")
+    paths = sorted({p for pattern in args.conanfile_paths for p in glob.glob(pattern)})
+    if paths:
+        update_conanfiles(paths, dry_run=args.dry_run, output_format=args.format, jobs=args.jobs)
+    _get_version_index().save()